@@ -1,6 +1,9 @@
 from django.contrib import admin
+from django.db import transaction
 
-from .models import PerformanceData, UploadLog
+from .models import DatasetVersion, DepartmentMonthlyStat, PerformanceData, UploadLog
+from .services.aggregates import refresh_aggregates
+from .services.versions import active_version_id
 
 
 @admin.register(PerformanceData)
@@ -35,6 +38,71 @@ class PerformanceDataAdmin(admin.ModelAdmin):
         ),
     )
 
+    # 활성 버전의 행만 표시
+    def get_queryset(self, request):
+        return super().get_queryset(request).active()
+
+    # 변경된 기준 년월의 부서별 집계 갱신 (행은 해당 월의 활성 버전에 추가/이동)
+    @transaction.atomic
+    def save_model(self, request, obj, form, change):
+        previous_month = form.initial.get("reference_date") if change else None
+        obj.version_id = active_version_id(obj.reference_date)
+        super().save_model(request, obj, form, change)
+        refresh_aggregates([month for month in (previous_month, obj.reference_date) if month])
+
+    @transaction.atomic
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        refresh_aggregates([obj.reference_date])
+
+    @transaction.atomic
+    def delete_queryset(self, request, queryset):
+        months = list(queryset.values_list("reference_date", flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        refresh_aggregates(months)
+
+
+@admin.register(DepartmentMonthlyStat)
+class DepartmentMonthlyStatAdmin(admin.ModelAdmin):
+    list_display = [
+        "reference_date",
+        "department",
+        "revenue",
+        "budget",
+        "paper_count",
+        "row_count",
+    ]
+    list_filter = ["reference_date"]
+    search_fields = ["department"]
+    ordering = ["-reference_date", "department"]
+
+    # PerformanceData에서 자동 집계되므로 읽기 전용
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(DatasetVersion)
+class DatasetVersionAdmin(admin.ModelAdmin):
+    list_display = ["id", "month", "status", "row_count", "created_at", "activated_at"]
+    list_filter = ["status", "month"]
+    ordering = ["-id"]
+
+    # 업로드/롤백(/api/periods/{month}/rollback/)으로만 변경되므로 읽기 전용
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(UploadLog)
 class UploadLogAdmin(admin.ModelAdmin):
@@ -43,10 +111,18 @@ class UploadLogAdmin(admin.ModelAdmin):
         "filename",
         "reference_date",
         "row_count",
+        "rows_per_second",
         "status",
         "uploaded_by",
     ]
     list_filter = ["status", "reference_date"]
     search_fields = ["filename"]
     ordering = ["-created_at"]
-    readonly_fields = ["created_at"]
+    readonly_fields = ["created_at", "phase_timings", "rows_per_second", "peak_memory_bytes", "profile_report"]
+
+    fieldsets = (
+        ("업로드 정보", {"fields": ("reference_date", "filename", "row_count", "status", "error_message", "uploaded_by")}),
+        ("성능 프로파일", {"fields": ("phase_timings", "rows_per_second", "peak_memory_bytes")}),
+        ("cProfile 리포트", {"fields": ("profile_report",), "classes": ("collapse",)}),
+        ("메타 정보", {"fields": ("created_at",), "classes": ("collapse",)}),
+    )
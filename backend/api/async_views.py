@@ -0,0 +1,219 @@
+"""
+Async (ASGI) read-only API views.
+
+Native async counterparts of the dashboard read endpoints, served under
+/api/async/. Under an ASGI server (gunicorn + uvicorn workers, see
+docs/deployment.md) a slow query only suspends its own request instead of
+blocking a whole worker.
+
+Responses are identical to the DRF endpoints: same filters, pagination,
+authentication, permissions and content negotiation. Authentication,
+renderers and the page size come from REST_FRAMEWORK (api_settings), so a
+change there applies to both. The authenticators run in a thread
+(sync_to_async) because DRF authentication is synchronous; the browsable
+API renderer is not offered (it needs a DRF view). Pagination follows
+PageNumberPagination (page/last), counted and sliced with the async ORM.
+"""
+
+import asyncio
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .db.routers import prefer_replica
+from .metrics import SUMMARY_LATENCY_SECONDS
+from .models import PerformanceData, ReferencePeriod, StudentRoster, UploadLog
+from .serializers import (
+    PerformanceDataSerializer,
+    ReferencePeriodSerializer,
+    StudentRosterSerializer,
+    UploadLogSerializer,
+)
+from .services.timeseries import aget_prefix_store
+from .views import API_PERMISSION, dashboard_summary_payload, filter_performance_data, filter_student_roster
+
+
+def get_renderers() -> list:
+    """REST_FRAMEWORK 렌더러 (JSON, MessagePack 등) - 브라우저블 API 제외"""
+    return [renderer() for renderer in api_settings.DEFAULT_RENDERER_CLASSES if renderer.format != "api"]
+
+
+def render_response(request: Request, renderers: list, data, status_code: int = status.HTTP_200_OK) -> HttpResponse:
+    """DRF 응답과 같은 렌더러·Content-Type으로 직렬화 (Accept 헤더 또는 ?format=)"""
+    renderer, media_type = request.accepted_renderer, request.accepted_media_type
+    content_type = f"{media_type}; charset={renderer.charset}" if renderer.charset else media_type
+    response = HttpResponse(
+        renderer.render(data, media_type, {"request": request}), status=status_code, content_type=content_type
+    )
+    if len(renderers) > 1:
+        patch_vary_headers(response, ["Accept"])
+    return response
+
+
+def authenticate(request: Request) -> None:
+    """
+    DEFAULT_AUTHENTICATION_CLASSES로 인증 후 API_PERMISSION 확인 (APIView.initial과 동일한 규칙)
+
+    Raises:
+        AuthenticationFailed: 인증 정보가 잘못된 경우 (예: 없는 토큰)
+        NotAuthenticated: 인증이 필요한데 인증 정보가 없는 경우
+        PermissionDenied: 인증됐지만 권한이 없는 경우
+    """
+    request.user  # pylint: disable=pointless-statement
+    for permission in (permission_class() for permission_class in API_PERMISSION):
+        if not permission.has_permission(request, None):
+            if request.authenticators and not request.successful_authenticator:
+                raise exceptions.NotAuthenticated()
+            raise exceptions.PermissionDenied()
+
+
+def auth_error_status(request: Request) -> tuple[int, dict]:
+    """인증 실패 응답 상태와 헤더 (첫 인증 클래스가 WWW-Authenticate를 주면 401, 아니면 403)"""
+    header = request.authenticators[0].authenticate_header(request) if request.authenticators else None
+    if header:
+        return status.HTTP_401_UNAUTHORIZED, {"WWW-Authenticate": header}
+    return status.HTTP_403_FORBIDDEN, {}
+
+
+def async_api_view(view):
+    """
+    비동기 GET 전용 API 뷰 데코레이터
+
+    - 콘텐츠 협상, 인증/권한 확인 후 view(request) 실행
+    - view는 (data, status) 또는 data를 반환
+    """
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        renderers = get_renderers()
+        drf_request = Request(
+            request, authenticators=[authenticator() for authenticator in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+        )
+        try:
+            negotiator = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS()
+            drf_request.accepted_renderer, drf_request.accepted_media_type = negotiator.select_renderer(
+                drf_request, renderers
+            )
+        except exceptions.NotAcceptable as exc:
+            drf_request.accepted_renderer, drf_request.accepted_media_type = renderers[0], renderers[0].media_type
+            return render_response(drf_request, renderers, {"detail": str(exc.detail)}, exc.status_code)
+
+        if request.method not in ("GET", "HEAD"):
+            response = render_response(
+                drf_request,
+                renderers,
+                {"detail": str(exceptions.MethodNotAllowed(request.method).detail)},
+                status.HTTP_405_METHOD_NOT_ALLOWED,
+            )
+            response["Allow"] = "GET, HEAD"
+            return response
+
+        try:
+            await sync_to_async(authenticate)(drf_request)
+        except (exceptions.NotAuthenticated, exceptions.AuthenticationFailed) as exc:
+            status_code, headers = auth_error_status(drf_request)
+            response = render_response(drf_request, renderers, {"detail": str(exc.detail)}, status_code)
+            for key, value in headers.items():
+                response[key] = value
+            return response
+        except exceptions.PermissionDenied as exc:
+            return render_response(drf_request, renderers, {"detail": str(exc.detail)}, exc.status_code)
+        request.user = drf_request.user
+
+        with prefer_replica():
+            result = await view(request, *args, **kwargs)
+        data, status_code = result if isinstance(result, tuple) else (result, status.HTTP_200_OK)
+        return render_response(drf_request, renderers, data, status_code)
+
+    return wrapper
+
+
+async def paginate(request, queryset, serializer_class):
+    """
+    DEFAULT_PAGINATION_CLASS(PageNumberPagination)와 동일한 형식의 페이지 응답 (count, next, previous, results)
+    """
+    pagination_class = api_settings.DEFAULT_PAGINATION_CLASS
+    page_size = pagination_class.page_size
+    page_param = pagination_class.page_query_param
+    count = await queryset.acount()
+    last_page = max(1, -(-count // page_size))
+
+    page_number = request.GET.get(page_param, 1)
+    try:
+        page = last_page if page_number in pagination_class.last_page_strings else int(page_number)
+    except (TypeError, ValueError):
+        page = 0
+    if not 1 <= page <= last_page:
+        return {"detail": str(pagination_class.invalid_page_message)}, status.HTTP_404_NOT_FOUND
+
+    offset = (page - 1) * page_size
+    objects = [obj async for obj in queryset[offset : offset + page_size]]
+
+    url = request.build_absolute_uri()
+    if page == 1:
+        previous = None
+    elif page == 2:
+        previous = remove_query_param(url, page_param)
+    else:
+        previous = replace_query_param(url, page_param, page - 1)
+    return {
+        "count": count,
+        "next": replace_query_param(url, page_param, page + 1) if page < last_page else None,
+        "previous": previous,
+        "results": serializer_class(objects, many=True).data,
+    }
+
+
+async def reference_months() -> list[str]:
+    return [month async for month in ReferencePeriod.objects.values_list("month", flat=True)]
+
+
+@async_api_view
+async def dashboard_summary(request):
+    """
+    대시보드 요약 데이터 API (비동기)
+
+    - GET /api/async/summary/ : /api/summary/와 동일한 파라미터와 응답
+    - 누적합 저장소(데이터 버전 확인)와 기준 년월 목록을 동시에 조회
+    """
+    with SUMMARY_LATENCY_SECONDS.time():
+        store, months = await asyncio.gather(aget_prefix_store(), reference_months())
+        try:
+            return dashboard_summary_payload(request.GET, store, months)
+        except ValueError as e:
+            return {"error": str(e)}, status.HTTP_400_BAD_REQUEST
+
+
+@async_api_view
+async def performance_data_list(request):
+    """실적 데이터 목록 (비동기) - GET /api/async/data/"""
+    queryset = filter_performance_data(PerformanceData.objects.active(), request.GET)
+    return await paginate(request, queryset, PerformanceDataSerializer)
+
+
+@async_api_view
+async def student_roster_list(request):
+    """학생 명단 목록 (비동기) - GET /api/async/students/"""
+    queryset = filter_student_roster(StudentRoster.objects.all(), request.GET)
+    return await paginate(request, queryset, StudentRosterSerializer)
+
+
+@async_api_view
+async def upload_log_list(request):
+    """업로드 이력 목록 (비동기) - GET /api/async/logs/"""
+    # uploaded_by_name 직렬화 시 추가 쿼리(동기 ORM 호출) 방지
+    queryset = UploadLog.objects.select_related("uploaded_by").defer("profile_report")
+    return await paginate(request, queryset, UploadLogSerializer)
+
+
+@async_api_view
+async def reference_period_list(request):
+    """기준 년월 목록 (비동기) - GET /api/async/periods/"""
+    periods = [period async for period in ReferencePeriod.objects.all()]
+    return ReferencePeriodSerializer(periods, many=True).data
@@ -0,0 +1,117 @@
+"""
+Response body compression (see api.middleware.ResponseCompressionMiddleware).
+
+Content-Encoding negotiation and brotli/gzip compressors for whole bodies
+and for streamed chunks. Brotli is optional: without the brotli package only
+gzip is offered.
+"""
+
+import zlib
+from typing import AsyncIterator, Callable, Iterable, Iterator
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Preferred Content-Encoding order when the client accepts several
+ENCODING_PREFERENCE = ("br", "gzip")
+
+# gzip container (header + deflate + CRC trailer)
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def available_encodings() -> tuple[str, ...]:
+    return ENCODING_PREFERENCE if brotli is not None else ("gzip",)
+
+
+def accepted_encoding(accept_encoding: str, available) -> str:
+    """Best available Content-Encoding the client accepts ("" for identity)."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip())
+    for encoding in ENCODING_PREFERENCE:
+        if encoding in available and (encoding in accepted or "*" in accepted):
+            return encoding
+    return ""
+
+
+class StreamCompressor:
+    """
+    Incremental compressor for one response body.
+
+    compress() returns whatever output is ready for a chunk (flushed, so a
+    streamed chunk reaches the client without waiting for the next one);
+    finish() returns the remaining output and the trailer.
+    """
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=level)
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+
+    def compress(self, data: bytes, flush: bool = True) -> bytes:
+        if self.encoding == "br":
+            out = self._compressor.process(data)
+            return out + self._compressor.flush() if flush else out
+        out = self._compressor.compress(data)
+        return out + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+def compress_body(body: bytes, encoding: str, level: int) -> bytes:
+    """Compress a whole body in one call."""
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
+def compress_stream(
+    chunks: Iterable[bytes], encoding: str, level: int, on_finish: Callable[[int, int], None]
+) -> Iterator[bytes]:
+    """Compress a streamed body chunk by chunk; on_finish(original_bytes, compressed_bytes) at the end."""
+    compressor = StreamCompressor(encoding, level)
+    original = compressed = 0
+    for chunk in chunks:
+        original += len(chunk)
+        out = compressor.compress(chunk)
+        if out:
+            compressed += len(out)
+            yield out
+    out = compressor.finish()
+    compressed += len(out)
+    yield out
+    on_finish(original, compressed)
+
+
+async def acompress_stream(
+    chunks: AsyncIterator[bytes], encoding: str, level: int, on_finish: Callable[[int, int], None]
+) -> AsyncIterator[bytes]:
+    """Async variant of compress_stream for async StreamingHttpResponse bodies."""
+    compressor = StreamCompressor(encoding, level)
+    original = compressed = 0
+    async for chunk in chunks:
+        original += len(chunk)
+        out = compressor.compress(chunk)
+        if out:
+            compressed += len(out)
+            yield out
+    out = compressor.finish()
+    compressed += len(out)
+    yield out
+    on_finish(original, compressed)
@@ -0,0 +1,6 @@
+"""
+Database connection layer.
+
+- backends: postgresql / sqlite3 engines with connection metrics
+- config: DATABASES entries with pooling or persistent connections
+"""
@@ -0,0 +1,9 @@
+"""PostgreSQL backend with connection pool / connect metrics."""
+
+from django.db.backends.postgresql import base
+
+from api.db.instrumentation import InstrumentedConnectionMixin
+
+
+class DatabaseWrapper(InstrumentedConnectionMixin, base.DatabaseWrapper):
+    pass
@@ -0,0 +1,9 @@
+"""SQLite backend with connect metrics (local development and tests)."""
+
+from django.db.backends.sqlite3 import base
+
+from api.db.instrumentation import InstrumentedConnectionMixin
+
+
+class DatabaseWrapper(InstrumentedConnectionMixin, base.DatabaseWrapper):
+    pass
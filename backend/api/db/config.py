@@ -0,0 +1,58 @@
+"""
+DATABASES entries with connection reuse.
+
+PostgreSQL gets a per-process psycopg3 connection pool when psycopg_pool is
+installed and Django is 5.1+ (pool_options); otherwise, and for SQLite, connections persist for
+conn_max_age seconds and are health-checked before reuse. Either way
+requests stop paying connection (and TLS) setup on every hit.
+"""
+
+from typing import Optional
+
+import dj_database_url
+import django
+
+# Django engine -> instrumented engine (api.db.backends)
+INSTRUMENTED_ENGINES = {
+    "django.db.backends.postgresql": "api.db.backends.postgresql",
+    "django.db.backends.sqlite3": "api.db.backends.sqlite3",
+}
+
+
+def pool_available() -> bool:
+    """Django's built-in pooling needs Django 5.1+ and psycopg 3 with psycopg_pool."""
+    # Django 5.0 passes OPTIONS["pool"] straight to psycopg.connect() and every connection fails
+    if django.VERSION < (5, 1):
+        return False
+    try:
+        import psycopg  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
+        import psycopg_pool  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        return False
+    return True
+
+
+def database_config(url: str, pool_options: Optional[dict] = None, conn_max_age: int = 0) -> dict:
+    """
+    Build a DATABASES entry from a database URL.
+
+    Args:
+        url: DATABASE_URL style URL
+        pool_options: psycopg_pool.ConnectionPool arguments (min_size, max_size,
+            max_idle, max_lifetime, timeout); None disables pooling
+        conn_max_age: Persistent connection lifetime when not pooling
+            (0 closes after each request, None keeps connections open)
+    """
+    config = dj_database_url.parse(url)
+    engine = config["ENGINE"]
+    config["ENGINE"] = INSTRUMENTED_ENGINES.get(engine, engine)
+
+    if pool_options and engine == "django.db.backends.postgresql" and pool_available():
+        # Pooling and persistent connections are mutually exclusive in Django
+        config.setdefault("OPTIONS", {})["pool"] = dict(pool_options)
+        config["CONN_MAX_AGE"] = 0
+        config["CONN_HEALTH_CHECKS"] = False
+    else:
+        config["CONN_MAX_AGE"] = conn_max_age
+        config["CONN_HEALTH_CHECKS"] = conn_max_age != 0
+    return config
@@ -0,0 +1,55 @@
+"""
+Connection instrumentation shared by the api.db backends.
+
+Records how long each connection takes to obtain (pool checkout or a fresh
+connect) and how old the underlying connection is when a request releases
+it, plus the pool's size/available/waiting counts. A pooled connection is
+recognized across checkouts by object identity, so its age keeps growing
+while the pool reuses it.
+"""
+
+import time
+import weakref
+
+from api.metrics import DB_CONNECTION_ACQUIRE_SECONDS, DB_CONNECTION_AGE_SECONDS, DB_POOL_CONNECTIONS
+
+# Raw pooled connection -> monotonic time it was first handed out
+_first_seen = weakref.WeakKeyDictionary()
+
+
+class InstrumentedConnectionMixin:
+    """Mix into a backend DatabaseWrapper (before the Django class)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connection_opened_at = None
+
+    @property
+    def connection_pool(self):
+        """psycopg_pool.ConnectionPool when OPTIONS["pool"] is set, else None."""
+        return getattr(self, "pool", None)
+
+    def get_new_connection(self, conn_params):
+        pool = self.connection_pool
+        start = time.perf_counter()
+        connection = super().get_new_connection(conn_params)
+        now = time.perf_counter()
+        DB_CONNECTION_ACQUIRE_SECONDS.labels(alias=self.alias, source="pool" if pool else "connect").observe(now - start)
+
+        self.connection_opened_at = _first_seen.setdefault(connection, time.monotonic()) if pool else time.monotonic()
+        if pool:
+            self.record_pool_stats()
+        return connection
+
+    def _close(self):
+        if self.connection is not None and self.connection_opened_at is not None:
+            DB_CONNECTION_AGE_SECONDS.labels(alias=self.alias).observe(time.monotonic() - self.connection_opened_at)
+            self.connection_opened_at = None
+        super()._close()
+        if self.connection_pool:
+            self.record_pool_stats()
+
+    def record_pool_stats(self) -> None:
+        stats = self.connection_pool.get_stats()
+        for state, key in (("size", "pool_size"), ("available", "pool_available"), ("waiting", "requests_waiting")):
+            DB_POOL_CONNECTIONS.labels(alias=self.alias, state=state).set(stats.get(key, 0))
@@ -0,0 +1,145 @@
+"""
+Read-replica routing.
+
+When DATABASE_REPLICA_URL is set, dashboard reads (api models, safe methods
+of views that opt in) go to the "replica" alias and everything else stays on
+"default". The per-request RoutingState lives in a context variable set by
+ReplicaRoutingMiddleware; it is a mutable object so writes flagged in a
+sync_to_async thread are visible to the middleware afterwards.
+
+Read-your-writes: a request that writes through the ORM gets a short-lived
+cookie, and while it is valid that client's reads stay on the primary,
+covering replication lag right after the user's own upload.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+
+REPLICA_ALIAS = "replica"
+PRIMARY_ALIAS = "default"
+STICKY_COOKIE = "primary_db_until"
+
+# Only dashboard data is served from the replica; auth, sessions and tokens
+# always read the primary so a fresh login is never "lost" to replica lag.
+REPLICA_APPS = {"api"}
+
+
+class RoutingState:
+    """Routing decisions for one request."""
+
+    def __init__(self, pinned: bool = False):
+        self.pinned = pinned  # read-your-writes: stay on the primary
+        self.use_replica = False  # set by views that opt in (safe methods)
+        self.wrote = False  # request wrote to the primary
+
+    @property
+    def read_alias(self) -> Optional[str]:
+        if self.use_replica and not self.pinned and replica_configured():
+            return REPLICA_ALIAS
+        return None
+
+
+_state: ContextVar[Optional[RoutingState]] = ContextVar("db_routing_state", default=None)
+
+
+def replica_configured() -> bool:
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+@contextmanager
+def routing_request(pinned: bool = False):
+    """Routing scope of one request (ReplicaRoutingMiddleware)."""
+    state = RoutingState(pinned=pinned)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+@contextmanager
+def routing_thread(parent: Optional[RoutingState]):
+    """
+    Routing scope of a worker thread serving part of a request (batch sub-queries).
+
+    The thread gets its own copy of the request's state, so prefer_replica()
+    in one thread cannot flip use_replica under another; writes are reported
+    back to the request for the sticky cookie.
+    """
+    if parent is None:
+        yield None
+        return
+    state = RoutingState(pinned=parent.pinned)
+    state.use_replica = parent.use_replica
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+        parent.wrote = parent.wrote or state.wrote
+
+
+def current_state() -> Optional[RoutingState]:
+    return _state.get()
+
+
+@contextmanager
+def prefer_replica():
+    """Send reads inside the block to the replica (unless the request is pinned)."""
+    state = _state.get()
+    if state is None:
+        yield
+        return
+    previous, state.use_replica = state.use_replica, True
+    try:
+        yield
+    finally:
+        state.use_replica = previous
+
+
+def is_pinned(cookies) -> bool:
+    """Whether the sticky cookie from a recent write is still valid."""
+    try:
+        return float(cookies.get(STICKY_COOKIE, 0)) > time.time()
+    except (TypeError, ValueError):
+        return False
+
+
+def set_sticky_cookie(response) -> None:
+    seconds = settings.REPLICA_STICKY_SECONDS
+    response.set_cookie(
+        STICKY_COOKIE,
+        f"{time.time() + seconds:.0f}",
+        max_age=seconds,
+        httponly=True,
+        samesite="Lax",
+        secure=settings.SESSION_COOKIE_SECURE,
+    )
+
+
+class ReadReplicaRouter:
+    """DATABASE_ROUTERS entry (installed when DATABASE_REPLICA_URL is set)."""
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or model._meta.app_label not in REPLICA_APPS:
+            return None
+        return state.read_alias
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return PRIMARY_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Same data on both aliases
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica receives schema changes through replication
+        return db == PRIMARY_ALIAS
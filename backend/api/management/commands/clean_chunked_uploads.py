@@ -0,0 +1,30 @@
+"""
+Management command to delete abandoned chunked upload sessions (see api.services.chunked_upload).
+
+Run it from a scheduler (cron): sessions that were started but never
+finalized keep their .part file in CHUNKED_UPLOAD_DIR until removed here.
+
+Usage:
+    python manage.py clean_chunked_uploads
+    python manage.py clean_chunked_uploads --max-age 3600
+"""
+
+from django.core.management.base import BaseCommand
+
+from api.services.chunked_upload import delete_expired_uploads
+
+
+class Command(BaseCommand):
+    help = "Delete chunked upload sessions and partial files that have not been updated recently"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-age",
+            type=int,
+            default=None,
+            help="Seconds since the last update (default: CHUNKED_UPLOAD_EXPIRY)",
+        )
+
+    def handle(self, *args, **options):
+        deleted = delete_expired_uploads(options["max_age"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired chunked upload sessions"))
@@ -0,0 +1,32 @@
+"""
+Management command to delete old dataset versions (see api.services.versions).
+
+Run this from a scheduler (cron): uploads only collect their own months
+when DATASET_VERSION_GC_ON_UPLOAD is on, and abandoned (pending) versions of
+interrupted uploads are only removed here.
+
+Usage:
+    python manage.py collect_dataset_versions
+    python manage.py collect_dataset_versions --month 2024-05 --retention 0
+"""
+
+from django.core.management.base import BaseCommand
+
+from api.services.versions import collect_garbage
+
+
+class Command(BaseCommand):
+    help = "Delete rows of superseded, rolled back and abandoned dataset versions"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--month", action="append", dest="months", help="Only this month (repeatable)")
+        parser.add_argument(
+            "--retention",
+            type=int,
+            default=None,
+            help="Previous versions kept per month for rollback (default: DATASET_VERSION_RETENTION)",
+        )
+
+    def handle(self, *args, **options):
+        deleted = collect_garbage(options["months"], retention=options["retention"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} rows of old dataset versions"))
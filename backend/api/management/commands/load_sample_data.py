@@ -4,18 +4,25 @@ Management command to load sample CSV data from public/ folder.
 Usage:
     python manage.py load_sample_data
     python manage.py load_sample_data --clear  # Clear existing data first
+
+Each loaded month gets a new active DatasetVersion, like an upload, so the
+sample rows replace what the month showed before (see api.services.versions).
 """
 
 import os
-from collections import defaultdict
+from collections import Counter, defaultdict
 from decimal import Decimal
 
 import pandas as pd
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.utils import timezone
 
-from api.models import PerformanceData, StudentRoster
+from api.models import DatasetVersion, PerformanceData, StudentRoster
+from api.services.aggregates import refresh_aggregates
+from api.services.partitions import ensure_partitions
+from api.services.versions import activate_versions, create_pending_versions
 
 
 class Command(BaseCommand):
@@ -101,6 +108,7 @@ class Command(BaseCommand):
         with transaction.atomic():
             if options["clear"]:
                 perf_deleted = PerformanceData.objects.all().delete()[0]
+                DatasetVersion.objects.all().delete()
                 student_deleted = StudentRoster.objects.all().delete()[0]
                 self.stdout.write(f"Cleared {perf_deleted} performance records, {student_deleted} student records")
 
@@ -123,8 +131,15 @@ class Command(BaseCommand):
                 )
                 objects_to_create.append(obj)
 
-            # Bulk create performance data
+            # Bulk create performance data under a new version per month, then activate them
+            # (unversioned rows would stay hidden behind months that already have an active version)
+            versions = create_pending_versions(Counter(obj.reference_date for obj in objects_to_create))
+            for obj in objects_to_create:
+                obj.version = versions[obj.reference_date]
+            ensure_partitions(versions)
             created = PerformanceData.objects.bulk_create(objects_to_create, batch_size=500)
+            activate_versions(versions.values())
+            refresh_aggregates(uploaded_at=timezone.now())
             self.stdout.write(
                 self.style.SUCCESS(f"Successfully created {len(created)} performance records")
             )
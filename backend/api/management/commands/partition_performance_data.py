@@ -0,0 +1,46 @@
+"""
+Management command to (re)partition PerformanceData (PostgreSQL only).
+
+Usage:
+    python manage.py partition_performance_data              # PERFORMANCE_DATA_PARTITIONING
+    python manage.py partition_performance_data --by month
+    python manage.py partition_performance_data --by none    # back to a plain table
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from api.services.partitions import SCHEMES, current_scheme, partition_table, unpartition_table
+
+
+class Command(BaseCommand):
+    help = "Convert the PerformanceData table to year/month partitions (or back)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--by",
+            choices=[*SCHEMES, "none"],
+            default=None,
+            help="Partitioning scheme (default: PERFORMANCE_DATA_PARTITIONING)",
+        )
+        parser.add_argument("--database", default="default", help="Database alias")
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        scheme = options["by"] or settings.PERFORMANCE_DATA_PARTITIONING or "none"
+        if connections[using].vendor != "postgresql":
+            raise CommandError("Partitioning needs PostgreSQL")
+
+        before = current_scheme(using) or "none"
+        if before == scheme:
+            self.stdout.write(f"Already partitioned by {scheme}" if scheme != "none" else "Not partitioned")
+            return
+
+        # Copies the whole table; reads and writes wait on the ACCESS EXCLUSIVE lock
+        with transaction.atomic(using=using):
+            if scheme == "none":
+                unpartition_table(using)
+            else:
+                partition_table(scheme, using)
+        self.stdout.write(self.style.SUCCESS(f"Partitioning changed: {before} -> {scheme}"))
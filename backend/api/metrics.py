@@ -0,0 +1,131 @@
+"""
+Prometheus Metrics
+
+Ingestion and dashboard metrics exposed at /api/metrics in the text exposition
+format. Under gunicorn every worker writes its samples to the shared
+PROMETHEUS_MULTIPROC_DIR (see gunicorn.conf.py) and the endpoint aggregates
+them, so a scrape sees the whole server rather than one worker.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Upload phases range from milliseconds (mapping) to minutes (large workbooks)
+PHASE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+# Pool checkout is sub-millisecond; a new TLS connection to a remote database tens to hundreds of ms
+CONNECT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+CONNECTION_AGE_BUCKETS = (0.1, 1, 5, 15, 30, 60, 300, 900, 1800, 3600)
+ROWS_PER_SECOND_BUCKETS = (100, 500, 1_000, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000)
+
+INGESTION_PHASE_SECONDS = Histogram(
+    "ingestion_phase_duration_seconds",
+    "Time spent in each upload phase (read, map, parse, write)",
+    ["phase"],
+    buckets=PHASE_BUCKETS,
+)
+UPLOAD_DURATION_SECONDS = Histogram(
+    "upload_duration_seconds",
+    "End-to-end duration of an upload import",
+    ["status"],
+    buckets=PHASE_BUCKETS,
+)
+UPLOAD_ROWS_TOTAL = Counter("upload_rows_total", "Rows inserted by successful uploads")
+UPLOAD_ROWS_PER_SECOND = Histogram(
+    "upload_rows_per_second",
+    "Import throughput of successful uploads",
+    buckets=ROWS_PER_SECOND_BUCKETS,
+)
+SUMMARY_LATENCY_SECONDS = Histogram(
+    "dashboard_summary_duration_seconds",
+    "Time to build the dashboard summary response",
+)
+CACHE_REQUESTS_TOTAL = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache name and result (hit/miss)",
+    ["cache", "result"],
+)
+
+RESPONSE_COMPRESSION_SECONDS = Histogram(
+    "response_compression_seconds",
+    "CPU time to compress a (non-streamed) response body",
+    ["encoding"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+RESPONSE_COMPRESSION_BYTES_TOTAL = Counter(
+    "response_compression_bytes_total",
+    "Response body bytes before (stage=original) and after (stage=compressed) compression",
+    ["encoding", "stage"],
+)
+
+DB_CONNECTION_ACQUIRE_SECONDS = Histogram(
+    "db_connection_acquire_seconds",
+    "Time to obtain a DB connection: pool wait (source=pool) or a new connection (source=connect)",
+    ["alias", "source"],
+    buckets=CONNECT_BUCKETS,
+)
+DB_CONNECTION_AGE_SECONDS = Histogram(
+    "db_connection_age_seconds",
+    "Age of the underlying DB connection when a request releases it (high = connections are reused)",
+    ["alias"],
+    buckets=CONNECTION_AGE_BUCKETS,
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Connection pool state summed over workers (state: size, available, waiting)",
+    ["alias", "state"],
+    multiprocess_mode="livesum",
+)
+
+
+@contextmanager
+def observe_phase(phase: str):
+    """Observe the duration of an ingestion phase, including failed attempts."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        INGESTION_PHASE_SECONDS.labels(phase=phase).observe(time.perf_counter() - start)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS_TOTAL.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def record_compression(encoding: str, original: int, compressed: int, seconds: Optional[float] = None) -> None:
+    """Record one compressed response body (seconds is None for streamed bodies)."""
+    RESPONSE_COMPRESSION_BYTES_TOTAL.labels(encoding=encoding, stage="original").inc(original)
+    RESPONSE_COMPRESSION_BYTES_TOTAL.labels(encoding=encoding, stage="compressed").inc(compressed)
+    if seconds is not None:
+        RESPONSE_COMPRESSION_SECONDS.labels(encoding=encoding).observe(seconds)
+
+
+def get_registry():
+    """
+    Registry to expose.
+
+    In multiprocess mode a fresh registry collects every worker's files on each
+    scrape; otherwise the in-process default registry is used.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Return (exposition body, content type) for the metrics endpoint."""
+    return generate_latest(get_registry()), CONTENT_TYPE_LATEST
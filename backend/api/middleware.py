@@ -0,0 +1,352 @@
+"""
+API Middleware
+
+- PerformanceMonitoringMiddleware: per-request timing (wall, DB, serialization)
+- AsyncCapableWhiteNoiseMiddleware: WhiteNoise usable in an async (ASGI) chain
+- ReplicaRoutingMiddleware: read-replica routing scope and read-your-writes cookie
+- ResponseCompressionMiddleware: brotli/gzip response bodies, including streamed ones
+
+All support sync and async requests, so under ASGI Django does not have to
+run the middleware chain (and with it every async view) through a
+sync-to-async thread hop.
+"""
+
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.utils.cache import patch_vary_headers
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from api.compression import accepted_encoding, acompress_stream, available_encodings, compress_body, compress_stream
+from api.db.routers import is_pinned, replica_configured, routing_request, set_sticky_cookie
+from api.metrics import record_compression
+
+logger = logging.getLogger("api.performance")
+
+
+class RequestMetrics:
+    """Timings collected for one sampled request."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.render_start = None
+        self.render_time = None
+
+    def db_wrapper(self, execute, sql, params, many, context):
+        """Counts queries and accumulates DB time."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.db_queries += 1
+
+    def render_done(self, response):
+        """Post-render callback of TemplateResponse/DRF Response."""
+        if self.render_start is not None:
+            self.render_time = time.perf_counter() - self.render_start
+
+
+# Metrics of the sampled request being handled. A context variable rather
+# than a per-request execute_wrapper: async views run their queries in
+# sync_to_async threads with their own connections, which inherit the
+# context but not wrappers installed on the event loop's connection.
+_active_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("perf_metrics", default=None)
+
+
+def _timed_execute(execute, sql, params, many, context):
+    metrics = _active_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics.db_wrapper(execute, sql, params, many, context)
+
+
+def _install_db_timing(connection, **kwargs):
+    """Add the (permanent, context-driven) query timer to a DB connection."""
+    if _timed_execute not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_timed_execute)
+
+
+connection_created.connect(_install_db_timing)
+
+
+class PerformanceMonitoringMiddleware:
+    """
+    요청 단위 성능 계측 미들웨어
+
+    - 전체 처리 시간, DB 쿼리 수/시간, 직렬화(렌더링) 시간, 응답 크기 측정
+    - Server-Timing 헤더로 브라우저 개발자 도구에 노출
+    - api.performance 로거로 key=value 형식 구조화 로그 기록
+
+    설정:
+        PERF_MONITORING_SAMPLE_RATE: 상세 계측 샘플링 비율 (0.0 ~ 1.0)
+        PERF_SLOW_REQUEST_MS: 샘플링과 무관하게 항상 로그를 남길 느린 요청 기준(ms)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        # 미들웨어 로드 전에 열린 연결 (이후 연결은 connection_created 시그널로 설치)
+        for connection in connections.all(initialized_only=True):
+            _install_db_timing(connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        metrics = self._sample(request)
+        if metrics is None:
+            return self._call_unsampled(request)
+
+        with self._db_timing(metrics):
+            response = self.get_response(request)
+        return self._finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = self._sample(request)
+        if metrics is None:
+            start = time.perf_counter()
+            response = await self.get_response(request)
+            self._log_if_slow(request, response, time.perf_counter() - start)
+            return response
+
+        with self._db_timing(metrics):
+            response = await self.get_response(request)
+        return self._finish(request, response, metrics)
+
+    @staticmethod
+    def _sample(request):
+        sample_rate = settings.PERF_MONITORING_SAMPLE_RATE
+        if sample_rate <= 0 or random.random() >= sample_rate:
+            return None
+        metrics = RequestMetrics()
+        request._perf_metrics = metrics
+        return metrics
+
+    @staticmethod
+    @contextmanager
+    def _db_timing(metrics: RequestMetrics):
+        token = _active_metrics.set(metrics)
+        try:
+            yield
+        finally:
+            _active_metrics.reset(token)
+
+    def _finish(self, request, response, metrics: RequestMetrics):
+        total = time.perf_counter() - metrics.start
+        response["Server-Timing"] = self._server_timing(metrics, total)
+        self._log(request, response, total, metrics)
+        return response
+
+    def process_template_response(self, request, response):
+        metrics = getattr(request, "_perf_metrics", None)
+        if metrics is not None:
+            metrics.render_start = time.perf_counter()
+            response.add_post_render_callback(metrics.render_done)
+        return response
+
+    def _call_unsampled(self, request):
+        start = time.perf_counter()
+        response = self.get_response(request)
+        self._log_if_slow(request, response, time.perf_counter() - start)
+        return response
+
+    def _log_if_slow(self, request, response, total: float):
+        # 샘플링되지 않은 요청도 느린 요청은 기록 (벽시계 시간만 측정)
+        if total * 1000 >= settings.PERF_SLOW_REQUEST_MS:
+            self._log(request, response, total, None)
+
+    @staticmethod
+    def _server_timing(metrics: RequestMetrics, total: float) -> str:
+        entries = [
+            f"total;dur={total * 1000:.1f}",
+            f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.db_queries} queries"',
+        ]
+        if metrics.render_time is not None:
+            entries.append(f"serialize;dur={metrics.render_time * 1000:.1f}")
+        return ", ".join(entries)
+
+    @staticmethod
+    def _log(request, response, total: float, metrics):
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": f"{total * 1000:.1f}",
+        }
+        if metrics is not None:
+            fields["db_queries"] = metrics.db_queries
+            fields["db_ms"] = f"{metrics.db_time * 1000:.1f}"
+            if metrics.render_time is not None:
+                fields["serialize_ms"] = f"{metrics.render_time * 1000:.1f}"
+        if not response.streaming:
+            fields["bytes"] = len(response.content)
+        fields["sampled"] = metrics is not None
+
+        slow = total * 1000 >= settings.PERF_SLOW_REQUEST_MS
+        logger.log(
+            logging.WARNING if slow else logging.INFO,
+            " ".join(f"{key}={value}" for key, value in fields.items()),
+            extra={"perf": fields},
+        )
+
+
+class AsyncCapableWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise 정적 파일 미들웨어 (동기/비동기 겸용)
+
+    WhiteNoiseMiddleware는 동기 전용이라 ASGI에서 하위 체인 전체가 스레드로
+    전환됨. 정적 파일 조회(메모리 dict)만 이벤트 루프에서 처리하고, 파일 응답
+    생성만 스레드에서 실행. WSGI에서는 WhiteNoiseMiddleware와 동일하게 동작.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):  # pylint: disable=redefined-outer-name
+        super().__init__(get_response, settings=settings)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve, thread_sensitive=False)(static_file, request)
+        return await self.get_response(request)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    읽기 복제본 라우팅 미들웨어 (DATABASE_REPLICA_URL 설정 시)
+
+    - 요청별 라우팅 상태 생성 (api.db.routers.ReadReplicaRouter가 참조)
+    - 최근 쓰기 쿠키가 유효하면 조회도 기본(primary) DB 사용 (read-your-writes)
+    - 요청 중 DB 쓰기가 있었으면 REPLICA_STICKY_SECONDS 동안 유효한 쿠키 발급
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with routing_request(pinned=is_pinned(request.COOKIES)) as state:
+            response = self.get_response(request)
+        return self._finish(state, response)
+
+    async def __acall__(self, request):
+        with routing_request(pinned=is_pinned(request.COOKIES)) as state:
+            response = await self.get_response(request)
+        return self._finish(state, response)
+
+    @staticmethod
+    def _finish(state, response):
+        if state.wrote and response.status_code < 400 and replica_configured():
+            set_sticky_cookie(response)
+        return response
+
+
+class ResponseCompressionMiddleware:
+    """
+    응답 본문 압축 미들웨어 (brotli/gzip)
+
+    - Accept-Encoding 협상: brotli(설치 시) 우선, 없으면 gzip
+    - RESPONSE_COMPRESSION_MIN_SIZE 미만 본문, 이미 압축된 형식(이미지, zip, xlsx 등),
+      Content-Encoding이 있는 응답(SPA index.html 등)은 건너뜀
+    - StreamingHttpResponse는 청크 단위로 압축해 바로 전송 (동기/비동기 스트림)
+    - 압축 전후 바이트와 압축 시간은 Prometheus 메트릭으로 기록
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.levels = {
+            "gzip": settings.RESPONSE_COMPRESSION_GZIP_LEVEL,
+            "br": settings.RESPONSE_COMPRESSION_BROTLI_QUALITY,
+        }
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    @staticmethod
+    def compressible(response) -> bool:
+        if response.has_header("Content-Encoding") or response.status_code in (204, 206, 304):
+            return False
+        if "no-transform" in response.get("Cache-Control", ""):
+            return False
+        content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+        return not content_type.startswith(settings.RESPONSE_COMPRESSION_EXCLUDED_TYPES)
+
+    def process_response(self, request, response):
+        if not self.compressible(response):
+            return response
+        if not response.streaming and len(response.content) < settings.RESPONSE_COMPRESSION_MIN_SIZE:
+            return response
+
+        # 압축 여부가 Accept-Encoding에 따라 달라지므로 캐시에 알림
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = accepted_encoding(request.headers.get("Accept-Encoding", ""), available_encodings())
+        if not encoding:
+            return response
+        level = self.levels[encoding]
+
+        if response.streaming:
+            def on_finish(original: int, compressed: int):
+                record_compression(encoding, original, compressed)
+
+            if response.is_async:
+                response.streaming_content = acompress_stream(response.streaming_content, encoding, level, on_finish)
+            else:
+                response.streaming_content = compress_stream(response.streaming_content, encoding, level, on_finish)
+            del response.headers["Content-Length"]
+        else:
+            start = time.perf_counter()
+            compressed = compress_body(response.content, encoding, level)
+            if len(compressed) >= len(response.content):
+                return response
+            record_compression(encoding, len(response.content), len(compressed), time.perf_counter() - start)
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # 본문 바이트가 달라지므로 강한 ETag는 약한 ETag로
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
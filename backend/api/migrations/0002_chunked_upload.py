@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:40
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_add_student_roster'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChunkedUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=255, verbose_name='파일명')),
+                ('total_size', models.BigIntegerField(verbose_name='전체 크기(바이트)')),
+                ('received_bytes', models.BigIntegerField(default=0, verbose_name='수신 크기(바이트)')),
+                ('checksum', models.CharField(blank=True, default='', max_length=64, verbose_name='SHA-256 체크섬')),
+                ('status', models.CharField(choices=[('uploading', '업로드 중'), ('complete', '처리 완료'), ('failed', '실패')], default='uploading', max_length=20, verbose_name='상태')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('uploaded_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='업로드 사용자')),
+            ],
+            options={
+                'verbose_name': '분할 업로드',
+                'verbose_name_plural': '분할 업로드',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
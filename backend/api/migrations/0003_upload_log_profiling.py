@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_chunked_upload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadlog',
+            name='peak_memory_bytes',
+            field=models.BigIntegerField(blank=True, help_text='업로드 처리 중 프로세스 최대 RSS (bytes)', null=True, verbose_name='최대 메모리'),
+        ),
+        migrations.AddField(
+            model_name='uploadlog',
+            name='phase_timings',
+            field=models.JSONField(blank=True, default=dict, help_text='단계별 처리 시간(초): file_read, encoding_detection, column_mapping, row_parsing, delete, insert, commit, total', verbose_name='단계별 처리 시간'),
+        ),
+        migrations.AddField(
+            model_name='uploadlog',
+            name='profile_report',
+            field=models.TextField(blank=True, default='', help_text='UPLOAD_PROFILING_ENABLED 설정 시에만 기록', verbose_name='cProfile 리포트'),
+        ),
+        migrations.AddField(
+            model_name='uploadlog',
+            name='rows_per_second',
+            field=models.FloatField(blank=True, null=True, verbose_name='초당 처리 행 수'),
+        ),
+    ]
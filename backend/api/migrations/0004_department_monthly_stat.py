@@ -0,0 +1,79 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:05
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_department_stats(apps, schema_editor):
+    """기존 PerformanceData로 부서별 월간 집계 생성"""
+    PerformanceData = apps.get_model("api", "PerformanceData")
+    DepartmentMonthlyStat = apps.get_model("api", "DepartmentMonthlyStat")
+
+    rows = (
+        PerformanceData.objects.order_by()
+        .values("reference_date", "department")
+        .annotate(
+            total_revenue=Sum("revenue"),
+            total_budget=Sum("budget"),
+            total_expenditure=Sum("expenditure"),
+            total_papers=Sum("paper_count"),
+            total_patents=Sum("patent_count"),
+            total_projects=Sum("project_count"),
+            rows=Count("id"),
+        )
+    )
+    DepartmentMonthlyStat.objects.bulk_create(
+        [
+            DepartmentMonthlyStat(
+                reference_date=row["reference_date"],
+                department=row["department"],
+                revenue=row["total_revenue"] or 0,
+                budget=row["total_budget"] or 0,
+                expenditure=row["total_expenditure"] or 0,
+                paper_count=row["total_papers"] or 0,
+                patent_count=row["total_patents"] or 0,
+                project_count=row["total_projects"] or 0,
+                row_count=row["rows"],
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_upload_log_profiling'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='uploadlog',
+            name='phase_timings',
+            field=models.JSONField(blank=True, default=dict, help_text='단계별 처리 시간(초): file_read, encoding_detection, column_mapping, row_parsing, delete, insert, aggregate, commit, total', verbose_name='단계별 처리 시간'),
+        ),
+        migrations.CreateModel(
+            name='DepartmentMonthlyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reference_date', models.CharField(max_length=7, verbose_name='기준 년월')),
+                ('department', models.CharField(blank=True, default='', max_length=100, verbose_name='부서명')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=20, verbose_name='매출액 합계')),
+                ('budget', models.DecimalField(decimal_places=2, default=0, max_digits=20, verbose_name='예산 합계')),
+                ('expenditure', models.DecimalField(decimal_places=2, default=0, max_digits=20, verbose_name='지출액 합계')),
+                ('paper_count', models.BigIntegerField(default=0, verbose_name='논문수 합계')),
+                ('patent_count', models.BigIntegerField(default=0, verbose_name='특허수 합계')),
+                ('project_count', models.BigIntegerField(default=0, verbose_name='프로젝트수 합계')),
+                ('row_count', models.IntegerField(default=0, verbose_name='원본 행 수')),
+            ],
+            options={
+                'verbose_name': '부서별 월간 집계',
+                'verbose_name_plural': '부서별 월간 집계',
+                'ordering': ['-reference_date', 'department'],
+                'indexes': [models.Index(fields=['department'], name='api_departm_departm_950574_idx')],
+                'constraints': [models.UniqueConstraint(fields=('reference_date', 'department'), name='unique_department_month_stat')],
+            },
+        ),
+        migrations.RunPython(backfill_department_stats, migrations.RunPython.noop),
+    ]
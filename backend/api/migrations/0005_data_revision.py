@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_department_monthly_stat'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataRevision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=32, verbose_name='버전 토큰')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='갱신일시')),
+            ],
+            options={
+                'verbose_name': '데이터 버전',
+                'verbose_name_plural': '데이터 버전',
+            },
+        ),
+    ]
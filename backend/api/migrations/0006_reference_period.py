@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:10
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_reference_periods(apps, schema_editor):
+    """기존 PerformanceData로 기준 년월 목록 생성"""
+    PerformanceData = apps.get_model("api", "PerformanceData")
+    ReferencePeriod = apps.get_model("api", "ReferencePeriod")
+
+    rows = PerformanceData.objects.order_by().values("reference_date").annotate(rows=Count("id"))
+    ReferencePeriod.objects.bulk_create(
+        [ReferencePeriod(month=row["reference_date"], row_count=row["rows"]) for row in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_data_revision'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReferencePeriod',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.CharField(max_length=7, unique=True, verbose_name='기준 년월')),
+                ('row_count', models.IntegerField(default=0, verbose_name='데이터 행 수')),
+                ('last_uploaded_at', models.DateTimeField(blank=True, null=True, verbose_name='최근 업로드 일시')),
+            ],
+            options={
+                'verbose_name': '기준 년월',
+                'verbose_name_plural': '기준 년월',
+                'ordering': ['-month'],
+            },
+        ),
+        migrations.RunPython(backfill_reference_periods, migrations.RunPython.noop),
+    ]
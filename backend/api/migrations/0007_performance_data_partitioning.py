@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:30
+
+from django.conf import settings
+from django.db import migrations
+
+
+def partition(apps, schema_editor):
+    """PERFORMANCE_DATA_PARTITIONING이 설정된 PostgreSQL에서만 실적 테이블을 파티션 테이블로 변환"""
+    scheme = settings.PERFORMANCE_DATA_PARTITIONING
+    if not scheme or schema_editor.connection.vendor != "postgresql":
+        return
+    from api.services.partitions import partition_table
+
+    table = apps.get_model("api", "PerformanceData")._meta.db_table
+    partition_table(scheme, using=schema_editor.connection.alias, table=table)
+
+
+def unpartition(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    from api.services.partitions import unpartition_table
+
+    table = apps.get_model("api", "PerformanceData")._meta.db_table
+    unpartition_table(using=schema_editor.connection.alias, table=table)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_reference_period'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition, unpartition),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_performance_data_partitioning'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='uploadlog',
+            name='phase_timings',
+            field=models.JSONField(blank=True, default=dict, help_text='단계별 처리 시간(초): file_read, encoding_detection, column_mapping, row_parsing, insert, activate, aggregate, commit, total', verbose_name='단계별 처리 시간'),
+        ),
+        migrations.CreateModel(
+            name='DatasetVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.CharField(max_length=7, verbose_name='기준 년월')),
+                ('status', models.CharField(choices=[('pending', '적재 중'), ('active', '활성'), ('superseded', '이전 버전'), ('rolled_back', '롤백됨')], default='pending', max_length=20, verbose_name='상태')),
+                ('row_count', models.IntegerField(default=0, verbose_name='데이터 행 수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('activated_at', models.DateTimeField(blank=True, null=True, verbose_name='활성화 일시')),
+                ('upload_log', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='versions', to='api.uploadlog', verbose_name='업로드 이력')),
+            ],
+            options={
+                'verbose_name': '데이터 버전',
+                'verbose_name_plural': '데이터 버전',
+                'ordering': ['-id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='performancedata',
+            name='version',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='rows', to='api.datasetversion', verbose_name='데이터 버전'),
+        ),
+        migrations.AddIndex(
+            model_name='datasetversion',
+            index=models.Index(fields=['month', 'status'], name='api_dataset_month_c0c9be_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='datasetversion',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'active')), fields=('month',), name='unique_active_dataset_version'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_dataset_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='chunkedupload',
+            name='status',
+            field=models.CharField(choices=[('uploading', '업로드 중'), ('processing', '처리 중'), ('complete', '처리 완료'), ('failed', '실패')], default='uploading', max_length=20, verbose_name='상태'),
+        ),
+    ]
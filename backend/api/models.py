@@ -1,11 +1,28 @@
+import uuid
+
 from django.db import models
 
 
+class PerformanceDataQuerySet(models.QuerySet):
+    def active(self):
+        """
+        조회용: 각 기준 년월의 활성 버전 행만 (api.services.versions)
+        - 업로드된 행: 그 행의 버전이 해당 월의 활성 버전일 때
+        - 버전 없는 행(버전 도입 전 데이터, API/관리자 직접 입력): 그 월에 활성 버전이 없을 때
+        """
+        active_versions = DatasetVersion.objects.filter(status=DatasetVersion.STATUS_ACTIVE)
+        return self.filter(
+            models.Q(version__in=active_versions.values("pk"))
+            | (models.Q(version__isnull=True) & ~models.Q(reference_date__in=active_versions.values("month")))
+        )
+
+
 class PerformanceData(models.Model):
     """
     이카운트 엑셀 데이터를 저장하는 모델
     - reference_date: 기준 년월 (YYYY-MM 형식, 데이터 교체의 기준)
     - 실적, 예산, 논문수 등 핵심 지표 포함
+    - version: 업로드 버전 (조회는 objects.active()로 활성 버전만)
     """
 
     # 기준 년월 (필수) - 데이터 교체 시 이 필드 기준으로 DELETE
@@ -35,10 +52,22 @@ class PerformanceData(models.Model):
     extra_metric_2 = models.DecimalField(max_digits=15, decimal_places=2, null=True, blank=True, verbose_name="추가지표2")
     extra_text = models.TextField(blank=True, default="", verbose_name="비고")
 
+    # 업로드 버전 (NULL: 버전 도입 전 데이터 또는 직접 입력)
+    version = models.ForeignKey(
+        "DatasetVersion",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="rows",
+        verbose_name="데이터 버전",
+    )
+
     # 메타 필드
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
 
+    objects = PerformanceDataQuerySet.as_manager()
+
     class Meta:
         verbose_name = "실적 데이터"
         verbose_name_plural = "실적 데이터"
@@ -53,6 +82,127 @@ class PerformanceData(models.Model):
         return f"{self.reference_date} - {self.department}"
 
 
+class DepartmentMonthlyStat(models.Model):
+    """
+    부서별 월간 실적 집계 (PerformanceData의 materialized 집계)
+    - 업로드/수정 트랜잭션에서 해당 월만 재집계 (api.services.aggregates)
+    - 대시보드 부서 순위는 원본 행 대신 이 테이블(월 × 부서)을 합산
+    """
+
+    reference_date = models.CharField(max_length=7, verbose_name="기준 년월")
+    department = models.CharField(max_length=100, verbose_name="부서명", blank=True, default="")
+
+    revenue = models.DecimalField(max_digits=20, decimal_places=2, default=0, verbose_name="매출액 합계")
+    budget = models.DecimalField(max_digits=20, decimal_places=2, default=0, verbose_name="예산 합계")
+    expenditure = models.DecimalField(max_digits=20, decimal_places=2, default=0, verbose_name="지출액 합계")
+    paper_count = models.BigIntegerField(default=0, verbose_name="논문수 합계")
+    patent_count = models.BigIntegerField(default=0, verbose_name="특허수 합계")
+    project_count = models.BigIntegerField(default=0, verbose_name="프로젝트수 합계")
+    row_count = models.IntegerField(default=0, verbose_name="원본 행 수")
+
+    class Meta:
+        verbose_name = "부서별 월간 집계"
+        verbose_name_plural = "부서별 월간 집계"
+        ordering = ["-reference_date", "department"]
+        constraints = [
+            models.UniqueConstraint(fields=["reference_date", "department"], name="unique_department_month_stat"),
+        ]
+        indexes = [
+            models.Index(fields=["department"]),
+        ]
+
+    def __str__(self):
+        return f"{self.reference_date} - {self.department}"
+
+
+class ReferencePeriod(models.Model):
+    """
+    기준 년월 목록 (PerformanceData의 월별 카탈로그)
+    - 업로드/수정 트랜잭션에서 집계와 함께 갱신 (api.services.aggregates)
+    - 대시보드 월 선택 목록과 /api/periods/ 가 원본 테이블 대신 사용
+    """
+
+    month = models.CharField(max_length=7, unique=True, verbose_name="기준 년월")
+    row_count = models.IntegerField(default=0, verbose_name="데이터 행 수")
+    last_uploaded_at = models.DateTimeField(null=True, blank=True, verbose_name="최근 업로드 일시")
+
+    class Meta:
+        verbose_name = "기준 년월"
+        verbose_name_plural = "기준 년월"
+        ordering = ["-month"]
+
+    def __str__(self):
+        return self.month
+
+
+class DataRevision(models.Model):
+    """
+    데이터 버전 (단일 행)
+    - 실적 데이터가 바뀔 때마다 새 토큰으로 갱신 (api.services.data_version)
+    - 프로세스 내 캐시(누적합 저장소 등)는 토큰이 바뀌면 다시 생성
+    """
+
+    token = models.CharField(max_length=32, verbose_name="버전 토큰")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="갱신일시")
+
+    class Meta:
+        verbose_name = "데이터 버전"
+        verbose_name_plural = "데이터 버전"
+
+    def __str__(self):
+        return self.token
+
+
+class DatasetVersion(models.Model):
+    """
+    실적 데이터 버전 (업로드 1회의 기준 년월 1개 = 버전 1개)
+    - 업로드는 새 버전(pending)으로 행을 넣은 뒤 짧은 트랜잭션에서 해당 월의 활성 버전만 전환
+    - 이전 버전은 롤백용으로 보관하다가 정리 (api.services.versions)
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_ACTIVE = "active"
+    STATUS_SUPERSEDED = "superseded"
+    STATUS_ROLLED_BACK = "rolled_back"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "적재 중"),
+        (STATUS_ACTIVE, "활성"),
+        (STATUS_SUPERSEDED, "이전 버전"),
+        (STATUS_ROLLED_BACK, "롤백됨"),
+    ]
+
+    month = models.CharField(max_length=7, verbose_name="기준 년월")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name="상태")
+    row_count = models.IntegerField(default=0, verbose_name="데이터 행 수")
+    upload_log = models.ForeignKey(
+        "UploadLog",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="versions",
+        verbose_name="업로드 이력",
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+    activated_at = models.DateTimeField(null=True, blank=True, verbose_name="활성화 일시")
+
+    class Meta:
+        verbose_name = "데이터 버전"
+        verbose_name_plural = "데이터 버전"
+        ordering = ["-id"]
+        constraints = [
+            # 월마다 활성 버전은 하나
+            models.UniqueConstraint(
+                fields=["month"], condition=models.Q(status="active"), name="unique_active_dataset_version"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["month", "status"]),
+        ]
+
+    def __str__(self):
+        return f"{self.month} v{self.pk} ({self.status})"
+
+
 class StudentRoster(models.Model):
     """
     학생 명단 모델
@@ -132,6 +282,26 @@ class UploadLog(models.Model):
         blank=True,
         verbose_name="업로드 사용자",
     )
+    # 성능 프로파일 (성공한 업로드, 처리 중 실패한 업로드 기록 - record_failure)
+    phase_timings = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="단계별 처리 시간",
+        help_text="단계별 처리 시간(초): file_read, encoding_detection, column_mapping, row_parsing, insert, activate, aggregate, commit, total",
+    )
+    rows_per_second = models.FloatField(null=True, blank=True, verbose_name="초당 처리 행 수")
+    peak_memory_bytes = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="최대 메모리",
+        help_text="업로드 처리 중 프로세스 최대 RSS (bytes)",
+    )
+    profile_report = models.TextField(
+        blank=True,
+        default="",
+        verbose_name="cProfile 리포트",
+        help_text="UPLOAD_PROFILING_ENABLED 설정 시에만 기록",
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="업로드 일시")
 
     class Meta:
@@ -141,3 +311,50 @@ class UploadLog(models.Model):
 
     def __str__(self):
         return f"{self.created_at.strftime('%Y-%m-%d %H:%M')} - {self.filename}"
+
+
+class ChunkedUpload(models.Model):
+    """
+    분할(Chunked) 업로드 세션 모델
+    - init → PUT chunk(offset) → finalize 순서로 진행
+    - 수신한 청크는 CHUNKED_UPLOAD_DIR 아래 파일에 순서대로 기록
+    - 연결이 끊기면 received_bytes 부터 이어서 업로드 (resume)
+    - finalize는 uploading → processing 전환에 성공한 요청 하나만 처리
+    - CHUNKED_UPLOAD_EXPIRY 동안 갱신이 없는 세션은 clean_chunked_uploads 명령으로 삭제
+      (processing 세션은 CHUNKED_UPLOAD_PROCESSING_EXPIRY 이후에만 삭제)
+    """
+
+    STATUS_CHOICES = [
+        ("uploading", "업로드 중"),
+        ("processing", "처리 중"),
+        ("complete", "처리 완료"),
+        ("failed", "실패"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    filename = models.CharField(max_length=255, verbose_name="파일명")
+    total_size = models.BigIntegerField(verbose_name="전체 크기(바이트)")
+    received_bytes = models.BigIntegerField(default=0, verbose_name="수신 크기(바이트)")
+    checksum = models.CharField(max_length=64, blank=True, default="", verbose_name="SHA-256 체크섬")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="uploading", verbose_name="상태")
+    uploaded_by = models.ForeignKey(
+        "auth.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="업로드 사용자",
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
+
+    class Meta:
+        verbose_name = "분할 업로드"
+        verbose_name_plural = "분할 업로드"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.filename} ({self.received_bytes}/{self.total_size})"
+
+    @property
+    def is_complete(self) -> bool:
+        return self.received_bytes >= self.total_size
@@ -0,0 +1,69 @@
+"""
+API response renderers (REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"]).
+
+ORJSONRenderer serializes application/json with orjson when it is installed.
+Values orjson does not handle natively (Decimal, datetime, lazy strings,
+numpy scalars, ...) go through DRF's JSONEncoder.default, so the output is
+the same as DRF's JSONRenderer.
+
+MessagePackRenderer serves the same values as application/msgpack for the
+dashboard and bulk consumers (Accept header or ?format=msgpack). It is
+registered only when msgpack is installed.
+"""
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+_encoder = JSONEncoder()
+
+
+def encode_default(obj):
+    """Fallback for types the fast encoders do not handle (DRF's JSON representation)."""
+    return _encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer backed by orjson (falls back to DRF's encoder without it)."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            # 들여쓰기 요청(브라우저 등)은 기존 인코더 (orjson은 2칸 들여쓰기만 지원)
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        ret = orjson.dumps(
+            data,
+            default=encode_default,
+            # datetime은 DRF 표현(밀리초, "Z")과 같도록 encode_default에서 처리
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+        # JSONRenderer와 동일하게 JavaScript에서 줄바꿈으로 해석되는 문자 이스케이프
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class MessagePackRenderer(BaseRenderer):
+    """application/msgpack renderer (requires msgpack)."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
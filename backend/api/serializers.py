@@ -1,6 +1,6 @@
 from rest_framework import serializers
 
-from .models import PerformanceData, StudentRoster, UploadLog
+from .models import ChunkedUpload, DatasetVersion, PerformanceData, ReferencePeriod, StudentRoster, UploadLog
 
 
 class PerformanceDataSerializer(serializers.ModelSerializer):
@@ -75,7 +75,7 @@ class StudentRosterSerializer(serializers.ModelSerializer):
 
 class UploadLogSerializer(serializers.ModelSerializer):
     """
-    업로드 이력 Serializer
+    업로드 이력 Serializer (목록용, cProfile 보고서 제외)
     """
 
     uploaded_by_name = serializers.CharField(source="uploaded_by.username", read_only=True, default="")
@@ -90,5 +90,59 @@ class UploadLogSerializer(serializers.ModelSerializer):
             "status",
             "error_message",
             "uploaded_by_name",
+            "phase_timings",
+            "rows_per_second",
+            "peak_memory_bytes",
             "created_at",
         ]
+
+
+class UploadLogDetailSerializer(UploadLogSerializer):
+    """
+    업로드 이력 상세 Serializer (스태프 단건 조회 전용, cProfile 보고서 포함)
+    """
+
+    class Meta(UploadLogSerializer.Meta):
+        fields = UploadLogSerializer.Meta.fields + ["profile_report"]
+
+
+class ReferencePeriodSerializer(serializers.ModelSerializer):
+    """
+    기준 년월 목록 Serializer
+    """
+
+    class Meta:
+        model = ReferencePeriod
+        fields = ["month", "row_count", "last_uploaded_at"]
+
+
+class DatasetVersionSerializer(serializers.ModelSerializer):
+    """
+    데이터 버전 Serializer
+    """
+
+    class Meta:
+        model = DatasetVersion
+        fields = ["id", "month", "status", "row_count", "upload_log", "created_at", "activated_at"]
+
+
+class ChunkedUploadSerializer(serializers.ModelSerializer):
+    """
+    분할 업로드 세션 Serializer
+    """
+
+    upload_id = serializers.UUIDField(source="id", read_only=True)
+    offset = serializers.IntegerField(source="received_bytes", read_only=True)
+
+    class Meta:
+        model = ChunkedUpload
+        fields = [
+            "upload_id",
+            "filename",
+            "total_size",
+            "offset",
+            "status",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
@@ -2,8 +2,18 @@
 Services layer for business logic.
 
 Separates business logic from views for better testability.
-"""
 
-from .excel_parser import ExcelParser
+ExcelParser (pandas/numpy) is imported on first attribute access so that
+importing a light service module (aggregates, facets, chunked_upload, ...)
+does not load the spreadsheet stack.
+"""
 
 __all__ = ["ExcelParser"]
+
+
+def __getattr__(name):
+    if name == "ExcelParser":
+        from .excel_parser import ExcelParser
+
+        return ExcelParser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,135 @@
+"""
+Department Aggregates
+
+Maintains DepartmentMonthlyStat, the per-(month, department) totals behind
+the dashboard summary. Uploads replace whole months, so the stats are
+refreshed month by month inside the same transaction that changes
+PerformanceData, and the data version is bumped so every process rebuilds
+its prefix-sum store (see timeseries).
+
+The ReferencePeriod catalog (months with row counts and last upload time)
+is rewritten from the same stats.
+
+Every code path that writes PerformanceData must call refresh_aggregates()
+with the months it touched (bulk_create/queryset.delete send no signals).
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from api.models import DepartmentMonthlyStat, PerformanceData, ReferencePeriod
+
+from .data_version import bump_data_version
+from .timeseries import PrefixSumStore, get_prefix_store
+
+# ranking_metric parameter -> ranking field (department_ranking output key)
+RANKING_METRICS = {
+    "revenue": "total_revenue",
+    "budget": "total_budget",
+    "papers": "total_papers",
+    "patents": "total_patents",
+    "projects": "total_projects",
+}
+DEFAULT_RANKING_METRIC = "revenue"
+
+
+def refresh_aggregates(months: Optional[Iterable[str]] = None, uploaded_at: Optional[datetime] = None) -> None:
+    """
+    Recompute the department stats and period catalog of the given months from PerformanceData.
+
+    Args:
+        months: Reference months (YYYY-MM) to refresh; None rebuilds every month
+        uploaded_at: Upload time to record on the refreshed periods; None keeps
+            the previous value (edits through the API/admin are not uploads)
+    """
+    with transaction.atomic():
+        stale = DepartmentMonthlyStat.objects.all()
+        source = PerformanceData.objects.active()
+        if months is not None:
+            months = sorted(set(months))
+            if not months:
+                return
+            stale = stale.filter(reference_date__in=months)
+            source = source.filter(reference_date__in=months)
+
+        stale.delete()
+        bump_data_version()
+        rows = (
+            source.order_by()
+            .values("reference_date", "department")
+            .annotate(
+                total_revenue=Sum("revenue"),
+                total_budget=Sum("budget"),
+                total_expenditure=Sum("expenditure"),
+                total_papers=Sum("paper_count"),
+                total_patents=Sum("patent_count"),
+                total_projects=Sum("project_count"),
+                rows=Count("id"),
+            )
+        )
+        stats = DepartmentMonthlyStat.objects.bulk_create(
+            [
+                DepartmentMonthlyStat(
+                    reference_date=row["reference_date"],
+                    department=row["department"],
+                    revenue=row["total_revenue"] or 0,
+                    budget=row["total_budget"] or 0,
+                    expenditure=row["total_expenditure"] or 0,
+                    paper_count=row["total_papers"] or 0,
+                    patent_count=row["total_patents"] or 0,
+                    project_count=row["total_projects"] or 0,
+                    row_count=row["rows"],
+                )
+                for row in rows
+            ],
+            batch_size=1000,
+        )
+        _refresh_reference_periods(months, stats, uploaded_at)
+
+
+def _refresh_reference_periods(months: Optional[list[str]], stats: list[DepartmentMonthlyStat], uploaded_at) -> None:
+    """Rewrite the ReferencePeriod rows of the refreshed months from their new stats."""
+    row_counts: dict[str, int] = defaultdict(int)
+    for stat in stats:
+        row_counts[stat.reference_date] += stat.row_count
+
+    stale = ReferencePeriod.objects.all() if months is None else ReferencePeriod.objects.filter(month__in=months)
+    previous_uploads = dict(stale.values_list("month", "last_uploaded_at"))
+    stale.delete()
+    ReferencePeriod.objects.bulk_create(
+        [
+            ReferencePeriod(month=month, row_count=count, last_uploaded_at=uploaded_at or previous_uploads.get(month))
+            for month, count in sorted(row_counts.items())
+        ]
+    )
+
+
+def department_ranking(
+    reference_date: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    departments: Optional[list[str]] = None,
+    metric: str = DEFAULT_RANKING_METRIC,
+    limit: int = 10,
+    store: Optional[PrefixSumStore] = None,
+) -> list[dict]:
+    """
+    Top departments for a month, a date range or all time.
+
+    Each department's range total is a difference of two prefix sums in the
+    in-memory store (see timeseries); the shape matches the former raw-row
+    aggregation.
+
+    Raises:
+        ValueError: If metric is not one of RANKING_METRICS
+    """
+    if metric not in RANKING_METRICS:
+        raise ValueError(f"ranking_metric must be one of: {', '.join(RANKING_METRICS)}")
+
+    store = store or get_prefix_store()
+    lo, hi = store.month_bounds(reference_date, start_date, end_date)
+    return store.department_ranking(lo, hi, store.department_rows(departments), RANKING_METRICS[metric], limit)
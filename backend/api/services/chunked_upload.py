@@ -0,0 +1,251 @@
+"""
+Chunked Upload Service
+
+Stores resumable upload sessions on local disk.
+Chunks must arrive in order (offset == received_bytes); a client that lost its
+connection asks for the current offset and resumes from there.
+The SHA-256 digest is updated incrementally as chunks are written, so finalize
+does not need to re-read the assembled file in the common case.
+
+Finalize claims the session (uploading -> processing) with one conditional
+UPDATE, so a client retrying a slow finalize cannot import the file twice.
+Sessions abandoned mid-upload are removed by delete_expired_uploads (the
+clean_chunked_uploads command).
+"""
+
+import hashlib
+import os
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from api.models import ChunkedUpload
+
+READ_BLOCK_SIZE = 1024 * 1024
+
+# Running digests per upload, keyed by upload id -> (received_bytes, hasher).
+# Only valid in the worker that received the previous chunk; other workers
+# fall back to hashing the file from disk.
+_running_digests: dict[str, tuple[int, "hashlib._Hash"]] = {}
+_digests_lock = threading.Lock()
+
+
+class ChunkOffsetError(ValueError):
+    """Raised when a chunk does not start at the current upload offset."""
+
+    def __init__(self, expected_offset: int):
+        super().__init__(f"잘못된 청크 위치입니다. offset={expected_offset} 부터 업로드해야 합니다.")
+        self.expected_offset = expected_offset
+
+
+class ChecksumMismatchError(ValueError):
+    """Raised when a chunk or the assembled file fails checksum verification."""
+
+
+def get_upload_dir() -> Path:
+    """Return the directory holding partial uploads, creating it if needed."""
+    upload_dir = Path(settings.CHUNKED_UPLOAD_DIR)
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    return upload_dir
+
+
+def get_upload_path(upload: ChunkedUpload) -> Path:
+    return get_upload_dir() / f"{upload.pk}.part"
+
+
+def create_upload(filename: str, total_size: int, checksum: str = "", user=None) -> ChunkedUpload:
+    """
+    Start a new chunked upload session.
+
+    Raises:
+        ValueError: If the declared size is invalid or exceeds the limit
+    """
+    if total_size <= 0:
+        raise ValueError("파일 크기가 올바르지 않습니다.")
+    if total_size > settings.CHUNKED_UPLOAD_MAX_SIZE:
+        raise ValueError(f"파일 크기가 최대 허용 크기({settings.CHUNKED_UPLOAD_MAX_SIZE} 바이트)를 초과합니다.")
+
+    upload = ChunkedUpload.objects.create(
+        filename=filename,
+        total_size=total_size,
+        checksum=checksum.lower(),
+        uploaded_by=user if user is not None and user.is_authenticated else None,
+    )
+    get_upload_path(upload).touch()
+    return upload
+
+
+def write_chunk(
+    upload: ChunkedUpload,
+    offset: int,
+    stream: BinaryIO,
+    length: int,
+    chunk_checksum: Optional[str] = None,
+) -> ChunkedUpload:
+    """
+    Append a chunk read from ``stream`` at ``offset``.
+
+    The chunk is streamed to disk in blocks; it is never held in memory whole.
+
+    Raises:
+        ChunkOffsetError: If offset does not match the bytes received so far
+        ChecksumMismatchError: If chunk_checksum is given and does not match
+        ValueError: If the chunk would exceed the declared total size
+    """
+    with transaction.atomic():
+        upload = ChunkedUpload.objects.select_for_update().get(pk=upload.pk)
+
+        if upload.status != "uploading":
+            raise ValueError("이미 완료된 업로드입니다.")
+        if offset != upload.received_bytes:
+            raise ChunkOffsetError(upload.received_bytes)
+        if offset + length > upload.total_size:
+            raise ValueError("청크가 선언된 파일 크기를 초과합니다.")
+
+        key = str(upload.pk)
+        with _digests_lock:
+            running = _running_digests.get(key)
+        if running and running[0] == offset:
+            hasher = running[1].copy()
+        else:
+            hasher = hashlib.sha256() if offset == 0 else None
+        chunk_hasher = hashlib.sha256()
+
+        path = get_upload_path(upload)
+        written = 0
+        with open(path, "r+b" if path.exists() else "wb") as f:
+            f.seek(offset)
+            while written < length:
+                block = stream.read(min(READ_BLOCK_SIZE, length - written))
+                if not block:
+                    break
+                f.write(block)
+                chunk_hasher.update(block)
+                if hasher is not None:
+                    hasher.update(block)
+                written += len(block)
+            # 이전 시도에서 남은 꼬리 데이터 제거
+            f.truncate(offset + written)
+
+        if written != length:
+            raise ValueError(f"청크 데이터가 불완전합니다. ({written}/{length} 바이트 수신)")
+        if chunk_checksum and chunk_hasher.hexdigest() != chunk_checksum.lower():
+            raise ChecksumMismatchError("청크 체크섬이 일치하지 않습니다.")
+
+        upload.received_bytes = offset + written
+        upload.save(update_fields=["received_bytes", "updated_at"])
+
+    with _digests_lock:
+        if hasher is not None:
+            _running_digests[key] = (upload.received_bytes, hasher)
+        else:
+            _running_digests.pop(key, None)
+    return upload
+
+
+def compute_checksum(upload: ChunkedUpload) -> str:
+    """Return the SHA-256 of the assembled file, reusing the running digest if possible."""
+    with _digests_lock:
+        running = _running_digests.get(str(upload.pk))
+    if running and running[0] == upload.received_bytes:
+        return running[1].hexdigest()
+
+    hasher = hashlib.sha256()
+    with open(get_upload_path(upload), "rb") as f:
+        for block in iter(lambda: f.read(READ_BLOCK_SIZE), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def read_assembled_file(upload: ChunkedUpload) -> Path:
+    """
+    Verify the upload is complete and return the path of the assembled file.
+
+    The file is not read into memory; the importer streams it from disk.
+
+    Raises:
+        ValueError: If not all bytes have been received
+        ChecksumMismatchError: If the declared checksum does not match
+    """
+    if not upload.is_complete:
+        raise ValueError(f"업로드가 완료되지 않았습니다. ({upload.received_bytes}/{upload.total_size} 바이트)")
+    if upload.checksum and compute_checksum(upload) != upload.checksum:
+        raise ChecksumMismatchError("파일 체크섬이 일치하지 않습니다. 업로드를 다시 시도하세요.")
+    return get_upload_path(upload)
+
+
+def discard_upload(upload: ChunkedUpload) -> None:
+    """Remove the partial file and in-memory digest for an upload."""
+    with _digests_lock:
+        _running_digests.pop(str(upload.pk), None)
+    try:
+        os.remove(get_upload_path(upload))
+    except FileNotFoundError:
+        pass
+
+
+def claim_upload(upload: ChunkedUpload) -> bool:
+    """
+    Atomically move an uploading session to processing.
+
+    Returns False when another request already claimed (or finished) it.
+    """
+    return (
+        ChunkedUpload.objects.filter(pk=upload.pk, status="uploading").update(
+            status="processing", updated_at=timezone.now()
+        )
+        == 1
+    )
+
+
+def release_upload(upload: ChunkedUpload) -> None:
+    """Return a claimed session to uploading (e.g. incomplete file), so the client can resume."""
+    ChunkedUpload.objects.filter(pk=upload.pk, status="processing").update(status="uploading", updated_at=timezone.now())
+
+
+def finish_upload(upload: ChunkedUpload, status: str) -> None:
+    """Remove the partial file of a processed session and record its final status."""
+    discard_upload(upload)
+    ChunkedUpload.objects.filter(pk=upload.pk).update(status=status, updated_at=timezone.now())
+
+
+def delete_expired_uploads(max_age: Optional[int] = None) -> int:
+    """
+    Delete sessions not updated for max_age seconds and their partial files.
+
+    Sessions being finalized (processing) are skipped so a long import never
+    loses its file; they are only removed after CHUNKED_UPLOAD_PROCESSING_EXPIRY
+    (a worker that died mid-import leaves them behind). Also removes .part files older than max_age that no session refers to
+    (e.g. left behind by a crashed worker).
+
+    Args:
+        max_age: Age in seconds (default CHUNKED_UPLOAD_EXPIRY)
+
+    Returns:
+        Number of deleted sessions
+    """
+    max_age = settings.CHUNKED_UPLOAD_EXPIRY if max_age is None else max_age
+    now = timezone.now()
+    expired = list(
+        ChunkedUpload.objects.exclude(status="processing").filter(updated_at__lt=now - timedelta(seconds=max_age))
+        | ChunkedUpload.objects.filter(
+            status="processing",
+            updated_at__lt=now - timedelta(seconds=settings.CHUNKED_UPLOAD_PROCESSING_EXPIRY),
+        )
+    )
+    for upload in expired:
+        discard_upload(upload)
+    ChunkedUpload.objects.filter(pk__in=[upload.pk for upload in expired]).delete()
+
+    known = {str(pk) for pk in ChunkedUpload.objects.values_list("pk", flat=True)}
+    cutoff = time.time() - max_age
+    for path in get_upload_dir().glob("*.part"):
+        if path.stem not in known and path.stat().st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+    return len(expired)
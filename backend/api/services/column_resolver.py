@@ -0,0 +1,109 @@
+"""
+Column Resolver
+
+Compiles the ExcelParser column mapping rules once and resolves a whole header
+in a single pass. Resolved mappings are cached by header signature, because
+users upload the same templates over and over.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Mapping, Sequence
+
+
+class ColumnResolver:
+    """
+    Precompiled source-to-target header resolver.
+
+    Rules, applied in order (same semantics as the original per-upload scan):
+        1. Exact COLUMN_MAPPING lookup. When several source columns map to
+           the same target, the target's priority list decides (targets
+           without a priority list use the first source).
+        2. If no reference_date yet, the first column containing a date keyword.
+        3. If no department yet, the first column containing a department keyword.
+
+    Usage:
+        resolver = ColumnResolver(mapping, priorities, date_keywords, dept_keywords)
+        df = df.rename(columns=resolver.resolve(df.columns))
+    """
+
+    def __init__(
+        self,
+        column_mapping: Mapping[str, str],
+        priorities: Mapping[str, Sequence[str]],
+        date_keywords: Iterable[str],
+        dept_keywords: Iterable[str],
+        cache_size: int = 256,
+    ):
+        self.column_mapping = dict(column_mapping)
+        # target -> {source: rank}; lower rank wins
+        self.priority_rank = {target: {source: rank for rank, source in enumerate(sources)} for target, sources in priorities.items()}
+        self.date_pattern = self._compile_keywords(date_keywords)
+        self.dept_pattern = self._compile_keywords(dept_keywords)
+        self._resolve_cached = lru_cache(maxsize=cache_size)(self._resolve)
+
+    @staticmethod
+    def _compile_keywords(keywords: Iterable[str]) -> re.Pattern:
+        return re.compile("|".join(re.escape(keyword.lower()) for keyword in keywords))
+
+    def resolve(self, columns: Iterable[str]) -> dict[str, str]:
+        """
+        Return the {source: target} rename mapping for a header.
+
+        Args:
+            columns: Normalized column names, in file order
+
+        Returns:
+            Mapping suitable for a single DataFrame.rename(columns=...) call
+        """
+        return dict(self._resolve_cached(tuple(columns)))
+
+    def cache_info(self):
+        return self._resolve_cached.cache_info()
+
+    def _resolve(self, header: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        # 1. Exact mapping with priority handling (one winner per target)
+        winners: dict[str, tuple[int, int, str]] = {}
+        for position, col in enumerate(header):
+            target = self.column_mapping.get(col)
+            if target is None:
+                continue
+            ranks = self.priority_rank.get(target)
+            if ranks is None:
+                rank = position
+            elif col in ranks:
+                rank = ranks[col]
+            else:
+                # Not in the priority list: never chosen when the target has several sources
+                rank = len(header) + len(ranks)
+            current = winners.get(target)
+            if current is None:
+                winners[target] = (rank, 1, col)
+            else:
+                best_rank, count, best_col = current
+                winners[target] = (rank, count + 1, col) if rank < best_rank else (best_rank, count + 1, best_col)
+
+        mapping: dict[str, str] = {}
+        for target, (rank, count, col) in winners.items():
+            ranks = self.priority_rank.get(target)
+            if count > 1 and ranks is not None and col not in ranks:
+                continue
+            mapping[col] = target
+
+        # Names after the exact rename, used by the keyword rules
+        renamed = [mapping.get(col, col) for col in header]
+
+        # 2./3. Keyword auto-detection on the renamed header
+        for target, pattern in (("reference_date", self.date_pattern), ("department", self.dept_pattern)):
+            if target in renamed:
+                continue
+            match = next((name for name in renamed if pattern.search(name.lower())), None)
+            if match is None:
+                continue
+            # Rename every column carrying the matched label, like DataFrame.rename
+            for position, name in enumerate(renamed):
+                if name == match:
+                    renamed[position] = target
+                    mapping[header[position]] = target
+
+        return tuple(mapping.items())
@@ -0,0 +1,37 @@
+"""
+Data Version
+
+A single DataRevision row whose token changes whenever dashboard data
+changes. Per-process caches key themselves on the token and rebuild when it
+moves, so every gunicorn worker picks up an upload on its next request
+without any cross-process invalidation.
+
+A random token is used instead of a counter so a rolled-back transaction can
+never hand out a version number that was already used for different data.
+"""
+
+import uuid
+
+from api.models import DataRevision
+
+SINGLETON_ID = 1
+
+
+def get_data_version() -> str:
+    """Current data version token ("" before the first change)."""
+    return DataRevision.objects.filter(pk=SINGLETON_ID).values_list("token", flat=True).first() or ""
+
+
+async def aget_data_version() -> str:
+    """Async variant of get_data_version for ASGI views."""
+    return await DataRevision.objects.filter(pk=SINGLETON_ID).values_list("token", flat=True).afirst() or ""
+
+
+def bump_data_version() -> str:
+    """
+    Assign a new data version. Call inside the transaction that changes the data,
+    so readers see the new token together with the new rows.
+    """
+    token = uuid.uuid4().hex
+    DataRevision.objects.update_or_create(pk=SINGLETON_ID, defaults={"token": token})
+    return token
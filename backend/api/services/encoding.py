@@ -0,0 +1,112 @@
+"""
+CSV Encoding Detection
+
+Decides the text encoding of an uploaded CSV from a bounded byte sample,
+so the file is parsed once instead of once per candidate encoding.
+Files on disk are sampled with seeks; only the sampled windows are read.
+"""
+
+import codecs
+import re
+
+from .file_source import FileSource, read_range, source_size
+
+# Bytes inspected when sniffing; large enough to reach the first Korean cells
+SAMPLE_SIZE = 64 * 1024
+
+# Candidates in legacy order, used when the sniffed guess fails on the full file
+FALLBACK_ENCODINGS = ["utf-8", "cp949", "euc-kr", "latin1"]
+
+BOMS = [
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+# EUC-KR / CP949 precomposed Hangul syllable: lead 0xB0-0xC8, trail 0xA1-0xFE
+HANGUL_PAIR_RE = re.compile(rb"[\xb0-\xc8][\xa1-\xfe]")
+HIGH_BYTE_RE = re.compile(rb"[\x80-\xff]")
+
+
+def sample_windows(file_content: FileSource, sample_size: int = SAMPLE_SIZE) -> list[bytes]:
+    """
+    Return up to three bounded windows (head, middle, tail) of the file.
+
+    Middle and tail windows start after a newline, which is a single ASCII byte
+    in every supported encoding, so they never begin inside a multibyte character.
+    Non-ASCII text that only appears deep in a large file is still seen.
+    """
+    size = source_size(file_content)
+    if size <= sample_size * 3:
+        return [read_range(file_content, 0, size)]
+
+    windows = [read_range(file_content, 0, sample_size)]
+    for start in (size // 2, size - sample_size):
+        window = read_range(file_content, start, sample_size)
+        newline = window.find(b"\n")
+        if newline != -1:
+            windows.append(window[newline + 1 :])
+    return windows
+
+
+def _decodes(windows: list[bytes], encoding: str) -> bool:
+    """Validate each window with an incremental decoder (a cut-off last character is fine)."""
+    for window in windows:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(window, final=False)
+        except UnicodeDecodeError:
+            return False
+    return True
+
+
+def looks_like_korean(sample: bytes) -> bool:
+    """
+    Hangul byte-pattern heuristic for legacy Korean encodings.
+
+    True when at least half of the non-ASCII bytes form EUC-KR Hangul syllable pairs.
+    """
+    high_bytes = len(HIGH_BYTE_RE.findall(sample))
+    if high_bytes == 0:
+        return False
+    hangul_bytes = len(HANGUL_PAIR_RE.findall(sample)) * 2
+    return hangul_bytes * 2 >= high_bytes
+
+
+def detect_encoding(file_content: FileSource, sample_size: int = SAMPLE_SIZE) -> str:
+    """
+    Detect the encoding of a CSV from bounded samples.
+
+    Order: BOM -> strict UTF-8 -> CP949 (superset of EUC-KR) with Hangul
+    heuristic -> latin1 (always decodes).
+
+    Args:
+        file_content: Raw bytes of the file, or its path on disk
+        sample_size: Size of each sampled window (head, middle, tail)
+
+    Returns:
+        Python codec name
+
+    Examples:
+        >>> detect_encoding("기준년월".encode("utf-8"))
+        'utf-8'
+        >>> detect_encoding("기준년월".encode("cp949"))
+        'cp949'
+    """
+    windows = sample_windows(file_content, sample_size)
+    for bom, encoding in BOMS:
+        if windows[0].startswith(bom):
+            return encoding
+
+    if _decodes(windows, "utf-8"):
+        return "utf-8"
+    if _decodes(windows, "cp949") and looks_like_korean(b"".join(windows)):
+        return "cp949"
+    return "latin1"
+
+
+def fallback_encodings(detected: str) -> list[str]:
+    """Legacy candidates to retry, in order, if the detected encoding fails past the sample."""
+    if detected not in FALLBACK_ENCODINGS:
+        return FALLBACK_ENCODINGS
+    return FALLBACK_ENCODINGS[FALLBACK_ENCODINGS.index(detected) + 1 :]
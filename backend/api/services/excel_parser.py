@@ -5,15 +5,23 @@ Handles Excel and CSV file parsing and data transformation for PerformanceData m
 Separated from views for better testability.
 """
 
-import io
+import importlib.util
 import re
 from decimal import Decimal, InvalidOperation
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
+from api.metrics import observe_phase, record_cache
 from api.models import PerformanceData
 
+from .column_resolver import ColumnResolver
+from .encoding import detect_encoding, fallback_encodings
+from .file_source import FileSource, as_readable
+from .profiling import profile_phase
+from .sheet_reader import read_sheets
+
 
 class ExcelParser:
     """
@@ -133,17 +141,52 @@ class ExcelParser:
         "논문제목": "extra_text",  # Paper title
     }
 
+    # Model field groups used for typed parsing
+    DECIMAL_FIELDS = ["revenue", "budget", "expenditure", "extra_metric_1", "extra_metric_2"]
+    INTEGER_FIELDS = ["paper_count", "patent_count", "project_count"]
+    TEXT_FIELDS = ["reference_date", "department", "department_code", "extra_text"]
+    OPTIONAL_DECIMAL_FIELDS = ["extra_metric_1", "extra_metric_2"]
+    # IntegerField bounds (32-bit on PostgreSQL); larger counts are row errors, never wrapped
+    INTEGER_MIN, INTEGER_MAX = -(2**31), 2**31 - 1
+
+    # CSV engine: "auto" uses the multithreaded pyarrow engine when installed
+    CSV_ENGINE = "auto"
+
+    # When multiple columns map to the same target, the first match in this list wins
+    COLUMN_PRIORITY = {
+        # Priority: 단과대학 > 학과 > 소속학과 > 부서명 > 부서
+        "department": ["단과대학", "학과", "소속학과", "부서명", "부서", "department"],
+        # Priority: 기준년월 > 평가년도 > 게재일 > 집행일자 > 날짜
+        "reference_date": ["기준년월", "기준 년월", "reference_date", "평가년도", "게재일", "집행일자", "날짜"],
+    }
+
     # Keywords to auto-detect date columns
     DATE_KEYWORDS = ["년월", "년도", "연월", "연도", "날짜", "일자", "date", "year", "month", "기준"]
     # Keywords to auto-detect department columns
     DEPT_KEYWORDS = ["부서", "학과", "기관", "조직", "팀", "단과", "소속", "dept", "department"]
 
-    def read_excel(self, file_content: bytes, filename: str = "") -> pd.DataFrame:
+    @classmethod
+    def get_column_resolver(cls) -> ColumnResolver:
+        """
+        Return the compiled column resolver for this parser class.
+
+        Built once per class from COLUMN_MAPPING, COLUMN_PRIORITY and the
+        keyword lists, then shared by every upload.
+        """
+        resolver = cls.__dict__.get("_column_resolver")
+        if resolver is None:
+            resolver = ColumnResolver(cls.COLUMN_MAPPING, cls.COLUMN_PRIORITY, cls.DATE_KEYWORDS, cls.DEPT_KEYWORDS)
+            cls._column_resolver = resolver
+        return resolver
+
+    def read_excel(self, file_content: FileSource, filename: str = "") -> pd.DataFrame:
         """
         Read Excel or CSV file content into a pandas DataFrame.
 
+        Only the first sheet of a workbook is read; see read_workbook().
+
         Args:
-            file_content: Raw bytes of the file
+            file_content: Raw bytes of the file, or its path on disk (streamed)
             filename: Original filename to determine file type
 
         Returns:
@@ -156,101 +199,71 @@ class ExcelParser:
         # Determine file type from filename
         is_csv = filename.lower().endswith(".csv")
 
-        if is_csv:
-            # Try different encodings for CSV
-            for encoding in ["utf-8", "cp949", "euc-kr", "latin1"]:
-                try:
-                    df = pd.read_csv(io.BytesIO(file_content), encoding=encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
+        with observe_phase("read"), profile_phase("file_read"):
+            if is_csv:
+                df = self.read_csv(file_content)
             else:
-                raise ValueError("CSV 파일 인코딩을 인식할 수 없습니다.")
-        else:
-            df = pd.read_excel(io.BytesIO(file_content))
+                df = pd.read_excel(as_readable(file_content))
 
+        return self.prepare_dataframe(df)
+
+    def read_workbook(self, file_content: FileSource, filename: str = "") -> list[tuple[str, pd.DataFrame]]:
+        """
+        Read every sheet of a workbook (or the single table of a CSV).
+
+        Sheets are read concurrently in a process pool (see sheet_reader) and
+        each one is mapped independently, so a workbook bundling KPI,
+        publication and research project sheets is handled in one upload.
+        Empty sheets are skipped.
+
+        Args:
+            file_content: Raw bytes of the file, or its path on disk (streamed)
+            filename: Original filename to determine file type
+
+        Returns:
+            List of (sheet name, prepared DataFrame); the sheet name is "" for CSV
+
+        Raises:
+            pd.errors.EmptyDataError: If file is empty
+            ValueError: If no sheet contains data
+        """
+        if filename.lower().endswith(".csv"):
+            return [("", self.read_excel(file_content, filename=filename))]
+
+        with observe_phase("read"), profile_phase("file_read"):
+            raw_sheets = read_sheets(file_content)
+        if len(raw_sheets) == 1:
+            sheet_name, df = raw_sheets[0]
+            return [(sheet_name, self.prepare_dataframe(df))]
+
+        sheets = [(sheet_name, self.prepare_dataframe(df)) for sheet_name, df in raw_sheets if not df.empty]
+        if not sheets:
+            raise ValueError("파일에 데이터가 없습니다.")
+        return sheets
+
+    def prepare_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Normalize and map the columns of a freshly read table.
+
+        Raises:
+            ValueError: If the table has no rows
+        """
         if df.empty:
             raise ValueError("파일에 데이터가 없습니다.")
 
+        with observe_phase("map"), profile_phase("column_mapping"):
+            return self._map_columns(df)
+
+    def _map_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         # Normalize column names (strip whitespace and remove BOM)
-        df.columns = df.columns.str.strip()
-        df.columns = df.columns.str.replace("\ufeff", "", regex=False)  # Remove BOM character
-
-        # Apply column mapping with priority handling
-        # When multiple columns map to the same target, prioritize and merge them
-        mapped_columns = {}
-        target_to_sources = {}  # Track which sources map to each target
-
-        for col in df.columns:
-            if col in self.COLUMN_MAPPING:
-                target = self.COLUMN_MAPPING[col]
-                if target not in target_to_sources:
-                    target_to_sources[target] = []
-                target_to_sources[target].append(col)
-
-        # For each target with multiple sources, choose priority source
-        for target, sources in target_to_sources.items():
-            if len(sources) == 1:
-                # Only one source, straightforward mapping
-                mapped_columns[sources[0]] = target
-            else:
-                # Multiple sources, apply priority logic
-                if target == "department":
-                    # Priority: 단과대학 > 학과 > 소속학과 > 부서명 > 부서
-                    priority = [
-                        "단과대학",
-                        "학과",
-                        "소속학과",
-                        "부서명",
-                        "부서",
-                        "department",
-                    ]
-                    for pref in priority:
-                        if pref in sources:
-                            mapped_columns[pref] = target
-                            break
-                elif target == "reference_date":
-                    # Priority: 기준년월 > 평가년도 > 게재일 > 집행일자 > 날짜
-                    priority = [
-                        "기준년월",
-                        "기준 년월",
-                        "reference_date",
-                        "평가년도",
-                        "게재일",
-                        "집행일자",
-                        "날짜",
-                    ]
-                    for pref in priority:
-                        if pref in sources:
-                            mapped_columns[pref] = target
-                            break
-                else:
-                    # Default: use first source
-                    mapped_columns[sources[0]] = target
-
-        df = df.rename(columns=mapped_columns)
-
-        # Auto-detect columns by keywords if reference_date not found
-        if "reference_date" not in df.columns:
-            for col in df.columns:
-                col_lower = col.lower()
-                for keyword in self.DATE_KEYWORDS:
-                    if keyword.lower() in col_lower:
-                        df = df.rename(columns={col: "reference_date"})
-                        break
-                if "reference_date" in df.columns:
-                    break
-
-        # Auto-detect department column if not found
-        if "department" not in df.columns:
-            for col in df.columns:
-                col_lower = col.lower()
-                for keyword in self.DEPT_KEYWORDS:
-                    if keyword.lower() in col_lower:
-                        df = df.rename(columns={col: "department"})
-                        break
-                if "department" in df.columns:
-                    break
+        df.columns = self.normalize_columns(df.columns)
+
+        # Resolve column mapping (exact names, priorities, keywords) in one pass
+        resolver = self.get_column_resolver()
+        hits = resolver.cache_info().hits
+        mapping = resolver.resolve(df.columns)
+        record_cache("column_resolver", resolver.cache_info().hits > hits)
+        df.columns = [mapping.get(col, col) for col in df.columns]
 
         # If still no reference_date, try to use first column if it looks like a date
         if "reference_date" not in df.columns and len(df.columns) > 0:
@@ -262,6 +275,98 @@ class ExcelParser:
                 if re.match(r"^\d{4}[-./\s]?\d{0,2}$", val_str) or re.match(r"^\d{6}$", val_str):
                     df = df.rename(columns={first_col: "reference_date"})
 
+        # Numeric fields arrive typed (thousand separators removed, invalid cells NaN)
+        return self.coerce_numeric_columns(df.loc[:, ~df.columns.duplicated()])
+
+    def read_csv(self, file_content: FileSource) -> pd.DataFrame:
+        """
+        Read CSV bytes (or a CSV file on disk), parsing once with the sniffed encoding and typed hints.
+
+        The encoding is decided from bounded samples. Columns that map to text
+        fields are read as strings (keeps codes like "001" and dates like
+        "2024.10" intact) and numbers are parsed with "," as thousands
+        separator. The pyarrow engine is used when available; if it rejects
+        the file, or the full file fails to decode, the C engine retries with
+        the remaining legacy encodings.
+
+        Raises:
+            ValueError: If no candidate encoding can decode the file
+        """
+        with profile_phase("encoding_detection"):
+            detected = detect_encoding(file_content)
+
+        if self._use_pyarrow():
+            try:
+                return self._read_csv_pyarrow(file_content, detected)
+            except pd.errors.EmptyDataError:
+                raise
+            except Exception:  # pylint: disable=broad-except
+                # pyarrow reports decode/shape problems with its own exceptions
+                pass
+
+        for encoding in [detected, *fallback_encodings(detected)]:
+            try:
+                dtype = self._csv_dtype_hints(file_content, encoding)
+                return pd.read_csv(as_readable(file_content), encoding=encoding, dtype=dtype, thousands=",")
+            except UnicodeDecodeError:
+                continue
+        raise ValueError("CSV 파일 인코딩을 인식할 수 없습니다.")
+
+    def _read_csv_pyarrow(self, file_content: FileSource, encoding: str) -> pd.DataFrame:
+        """Read CSV with pyarrow's multithreaded reader, forcing text fields to strings."""
+        from pyarrow import csv as pa_csv  # pylint: disable=import-outside-toplevel
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+        text_columns = self._csv_dtype_hints(file_content, encoding)
+        table = pa_csv.read_csv(
+            as_readable(file_content),
+            read_options=pa_csv.ReadOptions(encoding=encoding, use_threads=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={col: pa.string() for col in text_columns},
+                strings_can_be_null=True,
+            ),
+        )
+        if table.num_columns == 0:
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+        return table.to_pandas()
+
+    def _use_pyarrow(self) -> bool:
+        if self.CSV_ENGINE == "c":
+            return False
+        return importlib.util.find_spec("pyarrow") is not None
+
+    def _csv_dtype_hints(self, file_content: FileSource, encoding: str) -> dict[str, type]:
+        """Read only the header row and return {source column: str} for text fields."""
+        header = pd.read_csv(as_readable(file_content), encoding=encoding, nrows=0).columns
+        mapping = self.get_column_resolver().resolve(self.normalize_columns(header))
+        return {
+            source: str
+            for source, normalized in zip(header, self.normalize_columns(header))
+            if mapping.get(normalized) in self.TEXT_FIELDS
+        }
+
+    @staticmethod
+    def normalize_columns(columns) -> list[str]:
+        """Strip whitespace and BOM characters from column names."""
+        return [str(col).strip().replace("\ufeff", "") for col in columns]
+
+    @classmethod
+    def coerce_numeric_columns(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert mapped numeric columns to numeric dtypes in one vectorized pass.
+
+        Thousand separators are removed and unparseable cells become NaN
+        (which parse_dataframe treats like to_decimal/to_int defaults).
+        Columns that are already numeric are left untouched.
+        """
+        for field in cls.DECIMAL_FIELDS + cls.INTEGER_FIELDS:
+            if field not in df.columns:
+                continue
+            column = df[field]
+            if pd.api.types.is_numeric_dtype(column.dtype) and not pd.api.types.is_bool_dtype(column.dtype):
+                continue
+            cleaned = column.astype(str).str.replace(",", "", regex=False).str.strip()
+            df[field] = pd.to_numeric(cleaned.where(column.notna()), errors="coerce")
         return df
 
     def validate_dataframe(self, df: pd.DataFrame) -> None:
@@ -306,25 +411,95 @@ class ExcelParser:
         """
         Parse DataFrame rows into PerformanceData objects.
 
+        Columns are converted vectorized (same rules as parse_row) and then
+        zipped into model instances, instead of converting cell by cell.
+
         Args:
             df: DataFrame to parse
 
         Returns:
             Tuple of (list of PerformanceData objects, list of error messages)
         """
+        with observe_phase("parse"), profile_phase("row_parsing"):
+            return self._parse_rows(df)
+
+    def _parse_rows(self, df: pd.DataFrame) -> tuple[list[PerformanceData], list[str]]:
         objects = []
         errors = []
 
-        for idx, row in df.iterrows():
+        if "reference_date" not in df.columns:
+            return objects, errors
+
+        # Duplicate target columns: keep the first, like the column resolver
+        df = df.loc[:, ~df.columns.duplicated()]
+        df = df[df["reference_date"].notna()]
+        if df.empty:
+            return objects, errors
+
+        df = self.coerce_numeric_columns(df.copy())
+        columns = self._vectorized_columns(df)
+        names = list(columns)
+
+        for idx, values in zip(df.index, zip(*columns.values())):
             try:
-                obj_data = self.parse_row(row)
-                if obj_data:
-                    objects.append(PerformanceData(**obj_data))
+                data = dict(zip(names, values))
+                for field in self.OPTIONAL_DECIMAL_FIELDS:
+                    if data.get(field, 0) is None:
+                        del data[field]
+                for field in self.INTEGER_FIELDS:
+                    if data[field] is None:
+                        raise ValueError(
+                            f"{field} 값이 허용 범위({self.INTEGER_MIN}~{self.INTEGER_MAX})를 벗어났습니다."
+                        )
+                objects.append(PerformanceData(**data))
             except Exception as e:
                 errors.append(f"행 {idx + 2}: {str(e)}")
 
         return objects, errors
 
+    def _vectorized_columns(self, df: pd.DataFrame) -> dict[str, list]:
+        """Convert each model field column of df to a list of Python values."""
+        dates = df["reference_date"]
+        normalized_dates = {value: self.normalize_date(value) for value in dates.unique()}
+
+        columns = {"reference_date": dates.map(normalized_dates).tolist()}
+        for field in ["department", "department_code", "extra_text"]:
+            columns[field] = self._text_values(df, field)
+        for field in self.DECIMAL_FIELDS:
+            if field in self.OPTIONAL_DECIMAL_FIELDS and field not in df.columns:
+                continue
+            columns[field] = self._decimal_values(df, field, optional=field in self.OPTIONAL_DECIMAL_FIELDS)
+        for field in self.INTEGER_FIELDS:
+            columns[field] = self._int_values(df, field)
+        return columns
+
+    @staticmethod
+    def _text_values(df: pd.DataFrame, field: str) -> list[str]:
+        if field not in df.columns:
+            return [""] * len(df)
+        column = df[field]
+        return column.astype(str).str.strip().where(column.notna(), "").tolist()
+
+    @staticmethod
+    def _decimal_values(df: pd.DataFrame, field: str, optional: bool = False) -> list[Optional[Decimal]]:
+        if field not in df.columns:
+            return [Decimal(0)] * len(df)
+        column = df[field]
+        missing = None if optional else Decimal(0)
+        return [Decimal(text) if present else missing for text, present in zip(column.astype(str), column.notna())]
+
+    @classmethod
+    def _int_values(cls, df: pd.DataFrame, field: str) -> list[Optional[int]]:
+        """Truncated integers; values outside the IntegerField range become None (a row error)."""
+        if field not in df.columns:
+            return [0] * len(df)
+        column = df[field].replace([np.inf, -np.inf], np.nan).fillna(0)
+        values = np.trunc(column.astype("float64"))
+        in_range = values.between(cls.INTEGER_MIN, cls.INTEGER_MAX)
+        # Clip before the cast: float64 -> int64 wraps silently on overflow
+        ints = values.clip(cls.INTEGER_MIN, cls.INTEGER_MAX).astype("int64").tolist()
+        return [value if ok else None for value, ok in zip(ints, in_range)]
+
     def parse_row(self, row: pd.Series) -> Optional[dict[str, Any]]:
         """
         Parse a single DataFrame row into model field dictionary.
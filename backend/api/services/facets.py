@@ -0,0 +1,72 @@
+"""
+Filter Facets
+
+Distinct filter values with row counts for the dashboard filter panel and
+the student table, computed with one grouped query per model and cached
+under the data version (a new upload or roster change moves the version, so
+a cached entry is never stale).
+"""
+
+from collections import Counter
+from typing import Optional
+
+from django.core.cache import cache
+from django.db.models import Count
+
+from api.metrics import record_cache
+from api.models import DepartmentMonthlyStat, StudentRoster
+
+from .data_version import get_data_version
+
+CACHE_KEY = "api:facets:{version}"
+CACHE_TIMEOUT = 24 * 60 * 60
+
+STUDENT_FACETS = {
+    "colleges": "college",
+    "departments": "department",
+    "enrollment_statuses": "enrollment_status",
+    "program_types": "program_type",
+}
+
+
+def _facet(counter: Counter, reverse: bool = False) -> list[dict]:
+    return [{"value": value, "count": count} for value, count in sorted(counter.items(), reverse=reverse)]
+
+
+def compute_facets() -> dict:
+    """Build the facets (two grouped queries, tallied in Python)."""
+    # PerformanceData: the per-(month, department) stats are already grouped
+    departments: Counter = Counter()
+    months: Counter = Counter()
+    for month, department, rows in DepartmentMonthlyStat.objects.order_by().values_list(
+        "reference_date", "department", "row_count"
+    ):
+        departments[department] += rows
+        months[month] += rows
+
+    # StudentRoster: one GROUP BY over every facet column
+    fields = list(STUDENT_FACETS.values())
+    student_counters = {name: Counter() for name in STUDENT_FACETS}
+    for row in StudentRoster.objects.order_by().values(*fields).annotate(rows=Count("id")):
+        for name, field in STUDENT_FACETS.items():
+            student_counters[name][row[field]] += row["rows"]
+
+    return {
+        "performance": {
+            "departments": _facet(departments),
+            "reference_dates": _facet(months, reverse=True),
+        },
+        "students": {name: _facet(counter) for name, counter in student_counters.items()},
+    }
+
+
+def get_facets(version: Optional[str] = None) -> dict:
+    """Cached facets for the current data version."""
+    version = get_data_version() if version is None else version
+    key = CACHE_KEY.format(version=version)
+    facets = cache.get(key)
+    record_cache("facets", facets is not None)
+    if facets is None:
+        facets = compute_facets()
+        cache.set(key, facets, CACHE_TIMEOUT)
+    return facets
@@ -0,0 +1,37 @@
+"""
+Upload File Sources
+
+The parsers accept either the raw bytes of an upload or the path of a file on
+disk (an assembled chunked upload). Paths are handed to pandas/openpyxl/pyarrow
+as-is, so a large file is streamed from disk instead of being read into memory
+first; only bounded byte ranges are read directly (encoding sniffing).
+"""
+
+import io
+import os
+from typing import BinaryIO, Union
+
+FileSource = Union[bytes, str, os.PathLike]
+
+
+def as_readable(source: FileSource) -> Union[BinaryIO, str]:
+    """Return something pandas can read: a buffer over bytes, or the path itself."""
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    return os.fspath(source)
+
+
+def source_size(source: FileSource) -> int:
+    """Size of the file in bytes."""
+    if isinstance(source, bytes):
+        return len(source)
+    return os.path.getsize(source)
+
+
+def read_range(source: FileSource, start: int, length: int) -> bytes:
+    """Read at most length bytes starting at start."""
+    if isinstance(source, bytes):
+        return source[start : start + length]
+    with open(source, "rb") as f:
+        f.seek(start)
+        return f.read(length)
@@ -0,0 +1,236 @@
+"""
+Performance Data Import Service
+
+Runs the full import pipeline for an uploaded Excel/CSV file:
+parse (every sheet) -> validate -> insert under new dataset versions -> activate them
+together with the aggregates -> record UploadLog (see versions).
+Shared by the single-request upload endpoint and the chunked upload finalize step.
+
+pandas and ExcelParser are imported when the first importer is created, so
+importing this module (e.g. from api.views at worker boot) stays cheap.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from api.metrics import UPLOAD_DURATION_SECONDS, UPLOAD_ROWS_PER_SECOND, UPLOAD_ROWS_TOTAL, observe_phase
+from api.models import PerformanceData, UploadLog
+
+from .aggregates import refresh_aggregates
+from .facets import get_facets
+from .partitions import ensure_partitions
+from .file_source import FileSource
+from .versions import activate_versions, create_pending_versions, schedule_garbage_collection
+from .profiling import UploadProfile, profile_phase
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .excel_parser import ExcelParser
+
+
+class ImportValidationError(ValueError):
+    """Raised when a file parses but contains no importable rows."""
+
+    def __init__(self, message: str, details: Optional[list[str]] = None):
+        super().__init__(message)
+        self.details = details or []
+
+
+@dataclass
+class ImportResult:
+    """Outcome of a successful import."""
+
+    reference_dates: list[str]
+    created_count: int
+    warnings: list[str] = field(default_factory=list)
+    sheets: list[str] = field(default_factory=list)
+
+
+class PerformanceDataImporter:
+    """
+    Service class that imports a spreadsheet into PerformanceData.
+
+    Usage:
+        importer = PerformanceDataImporter()
+        result = importer.import_file(file_content, filename="data.xlsx", user=request.user)
+    """
+
+    def __init__(self, parser: Optional["ExcelParser"] = None):
+        if parser is None:
+            from .excel_parser import ExcelParser
+
+            parser = ExcelParser()
+        self.parser = parser
+
+    def import_file(self, file_content: FileSource, filename: str, user=None) -> ImportResult:
+        """
+        Parse the file and replace the reference months it contains.
+
+        Args:
+            file_content: Raw bytes of the file, or its path on disk (read by streaming)
+            filename: Original filename (used to detect CSV vs Excel)
+            user: Uploading user, or None for anonymous uploads
+
+        Returns:
+            ImportResult describing the replaced months and inserted rows
+
+        Raises:
+            ImportValidationError: If no valid rows could be parsed
+            ValueError: If the file is empty or missing required columns
+        """
+        profile = UploadProfile(enable_cprofile=settings.UPLOAD_PROFILING_ENABLED)
+        try:
+            with profile.run():
+                result, upload_log = self._import(file_content, filename, user)
+        except Exception as e:
+            UPLOAD_DURATION_SECONDS.labels(status="failed").observe(profile.total)
+            # Phases reached before the failure, saved by record_failure
+            e.upload_profile = profile
+            raise
+
+        UPLOAD_DURATION_SECONDS.labels(status="success").observe(profile.total)
+        UPLOAD_ROWS_TOTAL.inc(result.created_count)
+        if profile.total > 0:
+            UPLOAD_ROWS_PER_SECOND.observe(result.created_count / profile.total)
+
+        # 프로파일 기록 (commit 시간까지 포함되도록 트랜잭션 종료 후 저장)
+        UploadLog.objects.filter(pk=upload_log.pk).update(**self._profile_fields(profile, result.created_count))
+        return result
+
+    @staticmethod
+    def _profile_fields(profile: Optional[UploadProfile], rows: int) -> dict:
+        """UploadLog profiling fields of an import (empty when it was not profiled)."""
+        if profile is None:
+            return {}
+        return {
+            "phase_timings": profile.timings(),
+            "rows_per_second": profile.rows_per_second(rows),
+            "peak_memory_bytes": profile.peak_memory_bytes,
+            "profile_report": profile.report,
+        }
+
+    def _import(self, file_content: FileSource, filename: str, user) -> tuple[ImportResult, UploadLog]:
+        import pandas as pd
+
+        try:
+            sheets = self.parser.read_workbook(file_content, filename=filename)
+        except pd.errors.EmptyDataError as e:
+            raise ValueError("엑셀 파일이 비어있습니다.") from e
+
+        # 데이터 유효성 검증 (다중 시트: 날짜 컬럼이 없는 시트는 건너뜀)
+        sheets, errors = self._validate_sheets(sheets)
+
+        # 기준 년월 추출 및 데이터 변환 (모든 시트 통합)
+        reference_dates: list = []
+        performance_objects: list[PerformanceData] = []
+        for sheet_name, df in sheets:
+            for ref_date in self.parser.extract_reference_dates(df):
+                if ref_date not in reference_dates:
+                    reference_dates.append(ref_date)
+            objects, sheet_errors = self.parser.parse_dataframe(df)
+            performance_objects.extend(objects)
+            errors.extend(self._label(sheet_name, sheets, message) for message in sheet_errors)
+
+        if not performance_objects:
+            raise ImportValidationError("처리할 유효한 데이터가 없습니다.", details=errors)
+
+        uploaded_by = user if user is not None and user.is_authenticated else None
+
+        # 월마다 새 버전(pending)으로 행 삽입 - 조회는 그동안 기존 활성 버전을 계속 사용
+        # (commit 단계: insert/activate/aggregate를 제외한 트랜잭션 시작·이력 기록·커밋 시간)
+        months = list(dict.fromkeys(self.parser.normalize_date(d) for d in reference_dates))
+        row_counts = Counter({month: 0 for month in months})
+        row_counts.update(obj.reference_date for obj in performance_objects)
+        with observe_phase("write"), profile_phase("commit"):
+            with transaction.atomic():
+                versions = create_pending_versions(row_counts)
+                for obj in performance_objects:
+                    obj.version = versions[obj.reference_date]
+                with profile_phase("insert"):
+                    ensure_partitions(versions)
+                    created_objects = PerformanceData.objects.bulk_create(performance_objects, batch_size=1000)
+
+            # 활성 버전 전환 + 부서별 월간 집계·기준 년월 목록 갱신 (짧은 트랜잭션)
+            with transaction.atomic():
+                upload_log = UploadLog.objects.create(
+                    reference_date=str(reference_dates[0]),
+                    filename=filename,
+                    row_count=len(created_objects),
+                    status="success",
+                    uploaded_by=uploaded_by,
+                )
+                with profile_phase("activate"):
+                    activate_versions(versions.values(), upload_log=upload_log)
+                with profile_phase("aggregate"):
+                    refresh_aggregates(versions, uploaded_at=timezone.now())
+
+                # 커밋 후 새 데이터 버전의 필터 facet 미리 계산, 이전 버전 행 정리
+                transaction.on_commit(get_facets)
+                schedule_garbage_collection(versions)
+
+        result = ImportResult(
+            reference_dates=[str(d) for d in reference_dates],
+            created_count=len(created_objects),
+            warnings=errors,
+            sheets=[sheet_name for sheet_name, _ in sheets if sheet_name],
+        )
+        return result, upload_log
+
+    def _validate_sheets(self, sheets: list[tuple[str, "pd.DataFrame"]]) -> tuple[list[tuple[str, "pd.DataFrame"]], list[str]]:
+        """
+        Keep the sheets that have a reference_date column.
+
+        A single-sheet file fails as before. In a multi-sheet workbook, sheets
+        without a date column (cover pages, notes) are skipped with a warning;
+        the import fails only if no sheet is usable.
+        """
+        if len(sheets) == 1:
+            self.parser.validate_dataframe(sheets[0][1])
+            return sheets, []
+
+        valid, warnings, first_error = [], [], None
+        for sheet_name, df in sheets:
+            try:
+                self.parser.validate_dataframe(df)
+            except ValueError as e:
+                first_error = first_error or e
+                warnings.append(f"[{sheet_name}] 시트를 건너뜀: {e}")
+                continue
+            try:
+                self.parser.extract_reference_dates(df)
+            except ValueError as e:
+                warnings.append(f"[{sheet_name}] 시트를 건너뜀: {e}")
+                continue
+            valid.append((sheet_name, df))
+
+        if not valid:
+            raise first_error or ValueError("기준 년월 데이터가 없습니다.")
+        return valid, warnings
+
+    @staticmethod
+    def _label(sheet_name: str, sheets: list, message: str) -> str:
+        return f"[{sheet_name}] {message}" if len(sheets) > 1 else message
+
+    @classmethod
+    def record_failure(cls, filename: str, error: Exception, user=None) -> None:
+        """
+        Record a failed import in UploadLog.
+
+        When the error was raised by import_file, the phase timings, peak
+        memory and cProfile report of the failed run are stored as well.
+        """
+        UploadLog.objects.create(
+            reference_date="",
+            filename=filename or "unknown",
+            row_count=0,
+            status="failed",
+            error_message=str(error),
+            uploaded_by=user if user is not None and user.is_authenticated else None,
+            **cls._profile_fields(getattr(error, "upload_profile", None), 0),
+        )
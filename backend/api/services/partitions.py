@@ -0,0 +1,253 @@
+"""
+PerformanceData Partitioning (optional, PostgreSQL only)
+
+With PERFORMANCE_DATA_PARTITIONING = "year" or "month" the PerformanceData
+table is RANGE-partitioned on reference_date ('YYYY-MM' strings sort
+chronologically): one partition per year or per month, plus a DEFAULT
+partition for values outside every range. Range filters on reference_date,
+and the per-month deletes of old dataset versions (see versions), are
+pruned to the matching partitions.
+
+The table is converted by migration 0007 (or the partition_performance_data
+command when the setting changes later). The layout actually in the database
+is recorded in the table comment, so runtime behaviour follows the schema,
+not the setting. On SQLite or an unpartitioned table ensure_partitions is a
+no-op.
+
+The primary key of a partitioned table must include the partition key, so
+the database primary key becomes (id, reference_date); Django still treats
+id as the primary key and ids keep coming from one sequence.
+"""
+
+import re
+from typing import Iterable, Optional
+
+from django.db import connections
+
+from api.models import PerformanceData
+
+SCHEMES = ("year", "month")
+COMMENT_PREFIX = "partitioned by "
+PARTITION_KEY = "reference_date"
+
+MONTH_PATTERN = re.compile(r"^(\d{4})-(\d{2})$")
+
+
+def partition_key(month: str, scheme: str) -> Optional[str]:
+    """Partition key of a reference month ("2024" or "2024-05"), None for malformed values."""
+    match = MONTH_PATTERN.match(month or "")
+    if not match:
+        return None
+    return match.group(1) if scheme == "year" else month
+
+
+def partition_bounds(key: str, scheme: str) -> tuple[str, str]:
+    """[from, to) range of a partition key; '2024' < '2024-05' < '2025' as strings."""
+    if scheme == "year":
+        return key, f"{int(key) + 1:04d}"
+    year, month = int(key[:4]), int(key[5:7])
+    year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return key, f"{year:04d}-{month:02d}"
+
+
+def partition_name(table: str, key: str) -> str:
+    return f"{table}_p{key.replace('-', '_')}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def _table() -> str:
+    return PerformanceData._meta.db_table
+
+
+def current_scheme(using: str = "default", table: Optional[str] = None) -> str:
+    """Partitioning of the table in the database ("" when not partitioned)."""
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return ""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relkind, obj_description(c.oid, 'pg_class') FROM pg_class c WHERE c.oid = to_regclass(%s)",
+            [table or _table()],
+        )
+        row = cursor.fetchone()
+    if not row or row[0] != "p" or not (row[1] or "").startswith(COMMENT_PREFIX):
+        return ""
+    scheme = row[1][len(COMMENT_PREFIX) :]
+    return scheme if scheme in SCHEMES else ""
+
+
+def _existing_partitions(cursor, table: str) -> set[str]:
+    cursor.execute(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = to_regclass(%s)",
+        [table],
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+
+def ensure_partitions(months: Iterable[str], using: str = "default") -> list[str]:
+    """
+    Create the partitions that the given months will be written to.
+
+    Rows of these months that already landed in the DEFAULT partition (e.g.
+    single-row API writes before the partition existed) are moved into the
+    new partition, which is then attached. Returns the created partition names.
+    """
+    scheme = current_scheme(using)
+    if not scheme:
+        return []
+
+    table = _table()
+    keys = {key for key in (partition_key(month, scheme) for month in months) if key}
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    created = []
+    with connection.cursor() as cursor:
+        missing = keys - {key for key in keys if partition_name(table, key) in _existing_partitions(cursor, table)}
+        if not missing:
+            return []
+        # Concurrent uploads of the same new month create the partition once
+        cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [table])
+        existing = _existing_partitions(cursor, table)
+        for key in sorted(missing):
+            name = partition_name(table, key)
+            if name in existing:
+                continue
+            low, high = partition_bounds(key, scheme)
+            cursor.execute(f"CREATE TABLE {quote(name)} (LIKE {quote(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+            cursor.execute(
+                f"WITH moved AS (DELETE FROM {quote(default_partition_name(table))} "
+                f"WHERE {PARTITION_KEY} >= %s AND {PARTITION_KEY} < %s RETURNING *) "
+                f"INSERT INTO {quote(name)} SELECT * FROM moved",
+                [low, high],
+            )
+            cursor.execute(f"ALTER TABLE {quote(table)} ATTACH PARTITION {quote(name)} FOR VALUES FROM ('{low}') TO ('{high}')")
+            created.append(name)
+    return created
+
+
+def _dependent_definitions(cursor, table: str) -> tuple[list[str], list[tuple[str, str]]]:
+    """Index definitions (not backing a constraint) and foreign keys of a table, to recreate after a swap."""
+    cursor.execute(
+        "SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i WHERE i.indrelid = to_regclass(%s) "
+        "AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid) ORDER BY i.indexrelid",
+        [table],
+    )
+    indexes = [row[0].replace(" ON ONLY ", " ON ") for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = to_regclass(%s) AND contype = 'f' ORDER BY conname",
+        [table],
+    )
+    foreign_keys = cursor.fetchall()
+    cursor.execute("SELECT conname FROM pg_constraint WHERE confrelid = to_regclass(%s)", [table])
+    referencing = [row[0] for row in cursor.fetchall()]
+    if referencing:
+        raise ValueError(f"{table} is referenced by foreign keys ({', '.join(referencing)}) and cannot be swapped")
+    return indexes, foreign_keys
+
+
+def _swap_table(connection, table: str, create_sql: str, primary_key: str, populate=None) -> None:
+    """Rebuild table as create_sql (a '{new}' template), copying rows, indexes, foreign keys and the id sequence."""
+    quote = connection.ops.quote_name
+    new = f"{table}_swap"
+    sequence = f"{table}_id_seq"
+    with connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {quote(table)} IN ACCESS EXCLUSIVE MODE")
+        indexes, foreign_keys = _dependent_definitions(cursor, table)
+        cursor.execute(
+            "SELECT pg_get_serial_sequence(%s, 'id'), a.attidentity FROM pg_attribute a "
+            "WHERE a.attrelid = to_regclass(%s) AND a.attname = 'id'",
+            [table, table],
+        )
+        old_sequence, identity = cursor.fetchone()
+        cursor.execute(
+            f"SELECT GREATEST(COALESCE(MAX(id), 0), COALESCE(pg_sequence_last_value(%s::regclass), 0)) FROM {quote(table)}",
+            [old_sequence],
+        )
+        last_id = cursor.fetchone()[0]
+        if old_sequence and not identity:
+            # Plain owned sequence (a previous swap): keep it alive for the copied id default
+            cursor.execute(f"ALTER SEQUENCE {old_sequence} OWNED BY NONE")
+
+        cursor.execute(create_sql.format(new=quote(new), table=quote(table)))
+        if populate:
+            populate(cursor, new)
+        cursor.execute(f"INSERT INTO {quote(new)} SELECT * FROM {quote(table)}")
+        cursor.execute(f"DROP TABLE {quote(table)}")
+        cursor.execute(f"ALTER TABLE {quote(new)} RENAME TO {quote(table)}")
+
+        # An identity sequence dies with the old table: ids continue from a plain owned sequence
+        cursor.execute(f"CREATE SEQUENCE IF NOT EXISTS {quote(sequence)}")
+        cursor.execute(f"ALTER SEQUENCE {quote(sequence)} OWNED BY {quote(table)}.id")
+        cursor.execute("SELECT setval(%s, %s, %s)", [sequence, max(last_id, 1), last_id > 0])
+        cursor.execute(f"ALTER TABLE {quote(table)} ALTER COLUMN id SET DEFAULT nextval('{sequence}'::regclass)")
+
+        cursor.execute(f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(table + '_pkey')} PRIMARY KEY ({primary_key})")
+        for index in indexes:
+            cursor.execute(index)
+        for name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} {definition}")
+
+
+def partition_table(scheme: str, using: str = "default", table: Optional[str] = None) -> None:
+    """
+    Convert the table to RANGE partitions by year or month, keeping its rows.
+
+    Takes an ACCESS EXCLUSIVE lock and copies the table: run it in a
+    maintenance window (migration or partition_performance_data command).
+    """
+    if scheme not in SCHEMES:
+        raise ValueError(f"Unknown partitioning scheme {scheme!r} (expected one of {', '.join(SCHEMES)})")
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        raise ValueError("Partitioning needs PostgreSQL")
+    table = table or _table()
+    current = current_scheme(using, table)
+    if current == scheme:
+        return
+    if current:
+        unpartition_table(using, table)
+
+    quote = connection.ops.quote_name
+
+    def create_partitions(cursor, new):
+        cursor.execute(f"CREATE TABLE {quote(default_partition_name(table))} PARTITION OF {quote(new)} DEFAULT")
+        cursor.execute(f"SELECT DISTINCT {PARTITION_KEY} FROM {quote(table)}")
+        keys = {key for key in (partition_key(row[0], scheme) for row in cursor.fetchall()) if key}
+        for key in sorted(keys):
+            low, high = partition_bounds(key, scheme)
+            cursor.execute(
+                f"CREATE TABLE {quote(partition_name(table, key))} PARTITION OF {quote(new)} "
+                f"FOR VALUES FROM ('{low}') TO ('{high}')"
+            )
+
+    _swap_table(
+        connection,
+        table,
+        "CREATE TABLE {new} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        f"PARTITION BY RANGE ({PARTITION_KEY})",
+        primary_key=f"id, {PARTITION_KEY}",
+        populate=create_partitions,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"COMMENT ON TABLE {quote(table)} IS '{COMMENT_PREFIX}{scheme}'")
+
+
+def unpartition_table(using: str = "default", table: Optional[str] = None) -> None:
+    """Convert a partitioned table back to a plain table (no-op when not partitioned)."""
+    connection = connections[using]
+    table = table or _table()
+    if not current_scheme(using, table):
+        return
+    quote = connection.ops.quote_name
+    _swap_table(
+        connection,
+        table,
+        "CREATE TABLE {new} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        primary_key="id",
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"COMMENT ON TABLE {quote(table)} IS NULL")
@@ -0,0 +1,165 @@
+"""
+Upload Profiling
+
+Collects per-phase timings, peak memory and an optional cProfile report for
+one import. The active profile is held in a context variable so the parser
+can mark its phases without having the profile passed through every call.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_current_profile: ContextVar[Optional["UploadProfile"]] = ContextVar("upload_profile", default=None)
+
+PROFILE_REPORT_LINES = 40
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemorySampler:
+    """
+    Track the peak RSS while a block runs by polling from a daemon thread.
+
+    tracemalloc would attribute memory precisely but slows pandas-heavy
+    parsing several times over; polling costs nothing measurable. The value
+    is process-wide, so concurrent requests in the same worker are included.
+    """
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.peak: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        rss = current_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name="upload-memory-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        return False
+
+
+class UploadProfile:
+    """
+    Phase timings of one import.
+
+    Phases nest; each phase records only its own (exclusive) time, so the
+    timings add up to the measured total. Repeated phases (e.g. one
+    column_mapping per sheet) are summed.
+
+    Usage:
+        profile = UploadProfile(enable_cprofile=False)
+        with profile.run():
+            with profile_phase("file_read"):
+                ...
+        log.phase_timings = profile.timings()
+    """
+
+    def __init__(self, enable_cprofile: bool = False):
+        self.enable_cprofile = enable_cprofile
+        self.phases: dict[str, float] = {}
+        self.total = 0.0
+        self.peak_memory_bytes: Optional[int] = None
+        self.report = ""
+        self._stack: list[list] = []
+
+    @contextmanager
+    def run(self):
+        """Activate the profile for the current context and measure the whole block."""
+        token = _current_profile.set(self)
+        profiler = cProfile.Profile() if self.enable_cprofile else None
+        start = time.perf_counter()
+        try:
+            with MemorySampler() as sampler:
+                if profiler is not None:
+                    profiler.enable()
+                try:
+                    yield self
+                finally:
+                    if profiler is not None:
+                        profiler.disable()
+        finally:
+            self.total = time.perf_counter() - start
+            self.peak_memory_bytes = sampler.peak
+            _current_profile.reset(token)
+            if profiler is not None:
+                self.report = self._format_report(profiler)
+
+    @contextmanager
+    def phase(self, name: str):
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - frame[2]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def timings(self) -> dict[str, float]:
+        """Phase timings in seconds, rounded, with the block total under "total"."""
+        timings = {name: round(seconds, 4) for name, seconds in self.phases.items()}
+        timings["total"] = round(self.total, 4)
+        return timings
+
+    def rows_per_second(self, rows: int) -> Optional[float]:
+        return round(rows / self.total, 1) if self.total > 0 else None
+
+    @staticmethod
+    def _format_report(profiler: cProfile.Profile) -> str:
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_REPORT_LINES)
+        return stream.getvalue()
+
+
+@contextmanager
+def profile_phase(name: str):
+    """Time a phase of the active UploadProfile; a no-op when none is active."""
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+    with profile.phase(name):
+        yield
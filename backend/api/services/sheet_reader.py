@@ -0,0 +1,92 @@
+"""
+Workbook Sheet Reader
+
+Reads every sheet of an Excel workbook. Large multi-sheet workbooks are read
+concurrently in a process pool (openpyxl parsing is CPU-bound and holds the
+GIL, so threads would not help); the upload then takes about as long as its
+slowest sheet. Workbooks on disk are passed to the workers by path, so the
+file content is never pickled across processes.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import django
+import pandas as pd
+from django.conf import settings
+
+from .file_source import FileSource, as_readable, source_size
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def read_sheet(file_content: FileSource, sheet_name: str) -> pd.DataFrame:
+    """Read one sheet. Runs inside pool workers, so it must stay picklable."""
+    return pd.read_excel(as_readable(file_content), sheet_name=sheet_name)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """
+    Return the per-process sheet reader pool, creating it on first use.
+
+    Workers are spawned (not forked) so they never inherit DB connections or
+    locks from a threaded server process, and run django.setup() once so
+    this module can be imported by name. The pool is kept for reuse.
+    """
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.UPLOAD_SHEET_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+        return _executor
+
+
+def _reset_executor() -> None:
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def read_sheets(file_content: FileSource) -> list[tuple[str, pd.DataFrame]]:
+    """
+    Read all sheets of a workbook in workbook order.
+
+    Uses the process pool when the workbook has several sheets and is at
+    least UPLOAD_PARALLEL_SHEETS_MIN_BYTES large; small workbooks are read
+    in-process because spawning workers would cost more than it saves.
+
+    Returns:
+        List of (sheet name, raw DataFrame)
+    """
+    with pd.ExcelFile(as_readable(file_content)) as workbook:
+        sheet_names = [str(name) for name in workbook.sheet_names]
+
+        parallel = (
+            len(sheet_names) > 1
+            and settings.UPLOAD_SHEET_WORKERS > 1
+            and source_size(file_content) >= settings.UPLOAD_PARALLEL_SHEETS_MIN_BYTES
+        )
+        if not parallel:
+            frames = pd.read_excel(workbook, sheet_name=sheet_names)
+            return [(name, frames[name]) for name in sheet_names]
+
+    try:
+        executor = _get_executor()
+        futures = [(name, executor.submit(read_sheet, file_content, name)) for name in sheet_names]
+        return [(name, future.result()) for name, future in futures]
+    except BrokenProcessPool:
+        logger.warning("Sheet reader pool crashed; reading %d sheets sequentially", len(sheet_names))
+        _reset_executor()
+        return [(name, read_sheet(file_content, name)) for name in sheet_names]
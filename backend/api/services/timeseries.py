@@ -0,0 +1,196 @@
+"""
+Prefix-Sum Time Series Store
+
+Per-process, in-memory cumulative sums of DepartmentMonthlyStat over the
+month axis, one row per department and one matrix per metric:
+
+    prefix[metric][d, m] = sum of months [0, m) for department d
+
+Any date-range total is then prefix[:, hi] - prefix[:, lo], and the monthly
+trend of a department subset is a vectorized gather + diff, so summary
+latency no longer depends on how much history is stored.
+
+The store is rebuilt from the (small) stats table whenever the data version
+changes; uploads bump the version in their transaction.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from typing import Optional, Sequence
+
+import numpy as np
+from asgiref.sync import sync_to_async
+
+from api.models import DepartmentMonthlyStat
+
+from .data_version import aget_data_version, get_data_version
+
+# Money sums stay exact as Decimal (object arrays); counts are int64
+MONEY_FIELDS = ("revenue", "budget", "expenditure")
+COUNT_FIELDS = ("paper_count", "patent_count", "project_count", "row_count")
+FIELDS = MONEY_FIELDS + COUNT_FIELDS
+
+# Output key per metric in the summary / trend / ranking payloads
+SUMMARY_KEYS = {
+    "revenue": "total_revenue",
+    "budget": "total_budget",
+    "expenditure": "total_expenditure",
+    "paper_count": "total_papers",
+    "patent_count": "total_patents",
+    "project_count": "total_projects",
+}
+TREND_KEYS = {
+    "revenue": "revenue",
+    "budget": "budget",
+    "expenditure": "expenditure",
+    "paper_count": "papers",
+    "patent_count": "patents",
+    "project_count": "projects",
+}
+
+
+class PrefixSumStore:
+    """Immutable snapshot of the cumulative sums for one data version."""
+
+    def __init__(self, version: str, months: list[str], departments: list[str], prefix: dict[str, np.ndarray]):
+        self.version = version
+        self.months = months
+        self.departments = departments
+        self.department_index = {department: i for i, department in enumerate(departments)}
+        self.prefix = prefix
+
+    @classmethod
+    def from_stats(cls, version: str, rows: Sequence[tuple]) -> "PrefixSumStore":
+        """
+        Build from (reference_date, department, *FIELDS) tuples.
+        """
+        months = sorted({row[0] for row in rows})
+        departments = sorted({row[1] for row in rows})
+        month_index = {month: i for i, month in enumerate(months)}
+        department_index = {department: i for i, department in enumerate(departments)}
+        shape = (len(departments), len(months))
+
+        values = {field: np.full(shape, Decimal(0), dtype=object) for field in MONEY_FIELDS}
+        values.update({field: np.zeros(shape, dtype=np.int64) for field in COUNT_FIELDS})
+        for reference_date, department, *metrics in rows:
+            position = (department_index[department], month_index[reference_date])
+            for field, value in zip(FIELDS, metrics):
+                values[field][position] = value
+
+        prefix = {}
+        for field, matrix in values.items():
+            cumulative = np.zeros((shape[0], shape[1] + 1), dtype=matrix.dtype)
+            if field in MONEY_FIELDS:
+                cumulative[:, 0] = Decimal(0)
+            if shape[1]:
+                cumulative[:, 1:] = np.cumsum(matrix, axis=1)
+            prefix[field] = cumulative
+        return cls(version, months, departments, prefix)
+
+    def month_bounds(
+        self, reference_date: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> tuple[int, int]:
+        """Half-open month index range [lo, hi) matching the string filters of the raw queries."""
+        lo, hi = 0, len(self.months)
+        if reference_date:
+            lo, hi = max(lo, bisect_left(self.months, reference_date)), min(hi, bisect_right(self.months, reference_date))
+        if start_date:
+            lo = max(lo, bisect_left(self.months, start_date))
+        if end_date:
+            hi = min(hi, bisect_right(self.months, end_date))
+        return lo, max(lo, hi)
+
+    def department_rows(self, departments: Optional[list[str]] = None) -> np.ndarray:
+        """Row indices of the selected departments (all when no filter)."""
+        if not departments:
+            return np.arange(len(self.departments))
+        return np.array(
+            sorted({self.department_index[d] for d in departments if d in self.department_index}), dtype=np.intp
+        )
+
+    def range_totals(self, lo: int, hi: int, rows: np.ndarray) -> dict[str, np.ndarray]:
+        """Per-department totals over months [lo, hi): one prefix difference per department."""
+        return {field: prefix[rows, hi] - prefix[rows, lo] for field, prefix in self.prefix.items()}
+
+    def summary(self, lo: int, hi: int, rows: np.ndarray) -> dict:
+        totals = self.range_totals(lo, hi, rows)
+        row_count = int(totals["row_count"].sum())
+        if row_count == 0:
+            return {**{key: None for key in SUMMARY_KEYS.values()}, "department_count": 0, "avg_revenue": None}
+
+        summary = {key: self._total(totals[field], field) for field, key in SUMMARY_KEYS.items()}
+        summary["department_count"] = int(np.count_nonzero(totals["row_count"]))
+        summary["avg_revenue"] = summary["total_revenue"] / row_count
+        return summary
+
+    def monthly_trend(self, lo: int, hi: int, rows: np.ndarray) -> list[dict]:
+        """Per-month totals of the department subset, oldest first."""
+        # Sum the selected departments' prefix rows, then difference along the month axis
+        per_month = {field: np.diff(prefix[rows, lo : hi + 1].sum(axis=0)) for field, prefix in self.prefix.items()}
+        trend = []
+        for offset, month in enumerate(self.months[lo:hi]):
+            if per_month["row_count"][offset] == 0:
+                continue
+            entry = {"reference_date": month}
+            for field, key in TREND_KEYS.items():
+                entry[key] = self._scalar(per_month[field][offset], field)
+            trend.append(entry)
+        return trend
+
+    def department_ranking(self, lo: int, hi: int, rows: np.ndarray, order_key: str, limit: int = 10) -> list[dict]:
+        """Top departments by order_key (a SUMMARY_KEYS value), ties broken by name."""
+        totals = self.range_totals(lo, hi, rows)
+        ranking = []
+        for position, row in enumerate(rows):
+            if totals["row_count"][position] == 0:
+                continue
+            entry = {"department": self.departments[row]}
+            for field, key in SUMMARY_KEYS.items():
+                entry[key] = self._scalar(totals[field][position], field)
+            ranking.append(entry)
+        ranking.sort(key=lambda entry: (-entry[order_key], entry["department"]))
+        return ranking[:limit]
+
+    @staticmethod
+    def _scalar(value, field: str):
+        # numpy int64 is not JSON serializable
+        return value if field in MONEY_FIELDS else int(value)
+
+    @classmethod
+    def _total(cls, values: np.ndarray, field: str):
+        return sum(values, Decimal(0)) if field in MONEY_FIELDS else int(values.sum())
+
+
+_store: Optional[PrefixSumStore] = None
+_store_lock = threading.Lock()
+
+
+def get_prefix_store() -> PrefixSumStore:
+    """
+    Return the store for the current data version, rebuilding it if an
+    upload (in any process) changed the data since it was built.
+    """
+    global _store  # pylint: disable=global-statement
+    version = get_data_version()
+    store = _store
+    if store is not None and store.version == version:
+        return store
+
+    with _store_lock:
+        if _store is None or _store.version != version:
+            rows = list(DepartmentMonthlyStat.objects.order_by().values_list("reference_date", "department", *FIELDS))
+            _store = PrefixSumStore.from_stats(version, rows)
+        return _store
+
+
+async def aget_prefix_store() -> PrefixSumStore:
+    """
+    Async variant of get_prefix_store. The version check uses the async ORM;
+    only a rebuild (once per upload) hops to a worker thread.
+    """
+    version = await aget_data_version()
+    store = _store
+    if store is not None and store.version == version:
+        return store
+    return await sync_to_async(get_prefix_store)()
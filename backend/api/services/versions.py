@@ -0,0 +1,221 @@
+"""
+Dataset Versions
+
+An upload no longer deletes and re-inserts its months inside one long
+transaction. Every uploaded month gets a DatasetVersion; the rows are
+inserted under the pending version, where readers cannot see them, and one
+short transaction then flips the active version of those months and
+refreshes the aggregates. Readers only see active rows
+(PerformanceData.objects.active()), so they never wait for an upload, and a
+rollback re-activates the previous version without touching any rows.
+
+Superseded versions are kept for rollback (DATASET_VERSION_RETENTION per
+month). Everything older is deleted by the collect_dataset_versions command
+(run it from cron), or, with DATASET_VERSION_GC_ON_UPLOAD, in a background
+thread of the worker after the upload commits.
+
+Rows without a version (data from before versioning, rows created through
+the API/admin in a month that was never uploaded) act as the oldest version
+of their month: visible while the month has no active version.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Iterable, Mapping, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from api.models import DatasetVersion, PerformanceData, UploadLog
+
+from .aggregates import refresh_aggregates
+
+logger = logging.getLogger(__name__)
+
+# Rows of the oldest (unversioned) generation of a month in the rollback chain
+UNVERSIONED = None
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def active_version_id(month: str) -> Optional[int]:
+    """Active version of a month (None when the month only has unversioned rows)."""
+    return (
+        DatasetVersion.objects.filter(month=month, status=DatasetVersion.STATUS_ACTIVE)
+        .values_list("pk", flat=True)
+        .first()
+    )
+
+
+def create_pending_versions(row_counts: Mapping[str, int]) -> dict[str, DatasetVersion]:
+    """One pending version per month ({month: row count}) for the rows about to be inserted."""
+    versions = DatasetVersion.objects.bulk_create(
+        [DatasetVersion(month=month, row_count=count) for month, count in row_counts.items()]
+    )
+    return {version.month: version for version in versions}
+
+
+def lock_months(months: Iterable[str]) -> None:
+    """
+    Serialize version switches of the months until the transaction ends.
+
+    Without it two uploads of the same month that flip versions at the same
+    time both supersede only the old active version (READ COMMITTED) and the
+    second one violates unique_active_dataset_version. PostgreSQL takes a
+    transaction advisory lock per month (sorted, so concurrent uploads of
+    overlapping months cannot deadlock); SQLite already serializes writers.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        for month in sorted(set(months)):
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [f"{DatasetVersion._meta.db_table}:{month}"])
+
+
+def activate_versions(versions: Iterable[DatasetVersion], upload_log: Optional[UploadLog] = None) -> None:
+    """
+    Make the versions active for their months; the previous ones become superseded.
+
+    Call inside the transaction that refreshes the aggregates, so readers see
+    the new rows and the new totals together. A later upload of the same
+    month waits for this transaction and then supersedes these versions.
+    """
+    versions = list(versions)
+    months = [version.month for version in versions]
+    lock_months(months)
+    DatasetVersion.objects.filter(month__in=months, status=DatasetVersion.STATUS_ACTIVE).update(
+        status=DatasetVersion.STATUS_SUPERSEDED
+    )
+    DatasetVersion.objects.filter(pk__in=[version.pk for version in versions]).update(
+        status=DatasetVersion.STATUS_ACTIVE, activated_at=timezone.now(), upload_log=upload_log
+    )
+
+
+def rollback_month(month: str) -> Optional[DatasetVersion]:
+    """
+    Re-activate the version that preceded the active version of a month.
+
+    Returns the version that is active afterwards, or None when the month
+    falls back to its unversioned rows (or becomes empty).
+
+    Raises:
+        ValueError: If the month has no active version
+    """
+    with transaction.atomic():
+        lock_months([month])
+        current = (
+            DatasetVersion.objects.select_for_update()
+            .filter(month=month, status=DatasetVersion.STATUS_ACTIVE)
+            .first()
+        )
+        if current is None:
+            raise ValueError(f"{month}: 롤백할 활성 버전이 없습니다.")
+
+        previous = (
+            DatasetVersion.objects.filter(month=month, status=DatasetVersion.STATUS_SUPERSEDED, pk__lt=current.pk)
+            .order_by("-pk")
+            .first()
+        )
+        current.status = DatasetVersion.STATUS_ROLLED_BACK
+        current.save(update_fields=["status"])
+        if previous is not None:
+            previous.status = DatasetVersion.STATUS_ACTIVE
+            previous.activated_at = timezone.now()
+            previous.save(update_fields=["status", "activated_at"])
+        refresh_aggregates([month])
+    return previous
+
+
+def collect_garbage(
+    months: Optional[Iterable[str]] = None, retention: Optional[int] = None, pending_ttl: Optional[int] = None
+) -> int:
+    """
+    Delete the rows (and records) of versions that are no longer needed.
+
+    Per month, the active version and the `retention` versions before it
+    (the rollback chain, ending with the unversioned rows) are kept. Rolled
+    back versions, older superseded versions and pending versions older than
+    `pending_ttl` seconds (interrupted uploads) are removed.
+
+    Args:
+        months: Months to collect; None collects every month
+        retention: Previous versions kept per month (default DATASET_VERSION_RETENTION)
+        pending_ttl: Age in seconds after which a pending version is abandoned
+            (default DATASET_VERSION_PENDING_TTL)
+
+    Returns:
+        Number of deleted PerformanceData rows
+    """
+    retention = settings.DATASET_VERSION_RETENTION if retention is None else retention
+    pending_ttl = settings.DATASET_VERSION_PENDING_TTL if pending_ttl is None else pending_ttl
+    abandoned_before = timezone.now() - timedelta(seconds=pending_ttl)
+
+    versions = DatasetVersion.objects.order_by("-pk")
+    if months is not None:
+        versions = versions.filter(month__in=set(months))
+    by_month = defaultdict(list)
+    for version in versions.only("pk", "month", "status", "created_at"):
+        by_month[version.month].append(version)
+
+    deleted = 0
+    for month, month_versions in by_month.items():
+        active = next((v for v in month_versions if v.status == DatasetVersion.STATUS_ACTIVE), None)
+        keep = set()
+        if active is not None:
+            chain = [
+                v.pk for v in month_versions if v.status == DatasetVersion.STATUS_SUPERSEDED and v.pk < active.pk
+            ] + [UNVERSIONED]
+            keep = {active.pk, *chain[:retention]}
+        garbage = [
+            v.pk
+            for v in month_versions
+            if v.pk not in keep and (v.status != DatasetVersion.STATUS_PENDING or v.created_at < abandoned_before)
+        ]
+
+        # 월 조건으로 삭제 (파티션 테이블이면 해당 파티션만 대상)
+        with transaction.atomic():
+            rows = PerformanceData.objects.filter(reference_date=month)
+            if garbage:
+                deleted += rows.filter(version__in=garbage).delete()[0]
+                DatasetVersion.objects.filter(pk__in=garbage).delete()
+            if active is not None and UNVERSIONED not in keep:
+                deleted += rows.filter(version__isnull=True).delete()[0]
+    return deleted
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dataset-version-gc")
+        return _executor
+
+
+def _collect_in_background(months: list[str]) -> None:
+    try:
+        deleted = collect_garbage(months)
+        logger.debug("Collected %d rows of old dataset versions (%s)", deleted, ", ".join(months))
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Dataset version garbage collection failed")
+    finally:
+        # The thread's own connection; the next run opens a fresh one
+        connection.close()
+
+
+def schedule_garbage_collection(months: Iterable[str]) -> None:
+    """
+    Collect the months' old versions in a background thread once the transaction commits.
+
+    Off by default (DATASET_VERSION_GC_ON_UPLOAD): the deletes run in every
+    web worker next to the following uploads, which on SQLite contend for
+    the write lock. Schedule collect_dataset_versions instead.
+    """
+    if not settings.DATASET_VERSION_GC_ON_UPLOAD:
+        return
+    months = sorted(set(months))
+    transaction.on_commit(lambda: _get_executor().submit(_collect_in_background, months))
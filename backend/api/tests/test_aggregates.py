@@ -0,0 +1,144 @@
+"""
+Tests for department aggregates, the summary department ranking and reference periods.
+"""
+
+from decimal import Decimal
+
+import pytest
+from django.db.models import Sum
+from django.utils import timezone
+
+from api.models import DepartmentMonthlyStat, PerformanceData, ReferencePeriod
+from api.services.aggregates import department_ranking, refresh_aggregates
+from api.services.ingestion import PerformanceDataImporter
+from conftest import PerformanceDataFactory
+
+
+def raw_ranking(queryset, order_field="total_revenue"):
+    """The former ranking: aggregate raw rows on every request."""
+    return list(
+        queryset.values("department")
+        .annotate(
+            total_revenue=Sum("revenue"),
+            total_budget=Sum("budget"),
+            total_expenditure=Sum("expenditure"),
+            total_papers=Sum("paper_count"),
+            total_patents=Sum("patent_count"),
+            total_projects=Sum("project_count"),
+        )
+        .order_by(f"-{order_field}", "department")[:10]
+    )
+
+
+@pytest.fixture
+def monthly_data(db):
+    for month in ("2024-01", "2024-02", "2024-03"):
+        for index in range(12):
+            PerformanceDataFactory(reference_date=month, department=f"부서{index}")
+            PerformanceDataFactory(reference_date=month, department=f"부서{index}")
+    refresh_aggregates()
+
+
+@pytest.mark.django_db
+class TestDepartmentRanking:
+    """Test cases for the materialized ranking."""
+
+    def test_matches_raw_aggregation_all_time(self, monthly_data):
+        assert department_ranking() == raw_ranking(PerformanceData.objects.all())
+
+    def test_matches_raw_aggregation_for_range_and_departments(self, monthly_data):
+        departments = ["부서1", "부서2", "부서3"]
+        expected = raw_ranking(
+            PerformanceData.objects.filter(reference_date__gte="2024-02", department__in=departments), "total_papers"
+        )
+
+        ranking = department_ranking(start_date="2024-02", departments=departments, metric="papers")
+
+        assert ranking == expected
+
+    def test_unknown_metric_rejected(self):
+        with pytest.raises(ValueError):
+            department_ranking(metric="height")
+
+    def test_refresh_only_touches_given_months(self, monthly_data):
+        PerformanceData.objects.filter(reference_date="2024-01").delete()
+        refresh_aggregates(["2024-01"])
+
+        assert not DepartmentMonthlyStat.objects.filter(reference_date="2024-01").exists()
+        assert DepartmentMonthlyStat.objects.filter(reference_date="2024-02").count() == 12
+
+    def test_upload_refreshes_stats(self):
+        csv = "기준년월,부서,매출액\n2024-05,A,100\n2024-05,A,50\n2024-05,B,120\n".encode("utf-8")
+
+        PerformanceDataImporter().import_file(csv, filename="data.csv")
+
+        ranking = department_ranking(reference_date="2024-05")
+        assert [(row["department"], row["total_revenue"]) for row in ranking] == [
+            ("A", Decimal("150")),
+            ("B", Decimal("120")),
+        ]
+
+
+@pytest.mark.django_db
+class TestSummaryRankingMetric:
+    """Test cases for /api/summary/?ranking_metric=..."""
+
+    def test_ranking_metric_parameter(self, authenticated_client, monthly_data):
+        response = authenticated_client.get("/api/summary/", {"ranking_metric": "projects"})
+
+        assert response.status_code == 200
+        projects = [row["total_projects"] for row in response.json()["department_ranking"]]
+        assert projects == sorted(projects, reverse=True)
+
+    def test_invalid_ranking_metric(self, authenticated_client):
+        response = authenticated_client.get("/api/summary/", {"ranking_metric": "height"})
+
+        assert response.status_code == 400
+
+    def test_data_api_changes_refresh_stats(self, authenticated_client):
+        response = authenticated_client.post(
+            "/api/data/", {"reference_date": "2024-07", "department": "A", "revenue": "10.00"}, content_type="application/json"
+        )
+        record_id = response.json()["id"]
+        authenticated_client.patch(f"/api/data/{record_id}/", {"reference_date": "2024-08"}, content_type="application/json")
+
+        assert list(DepartmentMonthlyStat.objects.values_list("reference_date", flat=True)) == ["2024-08"]
+
+        authenticated_client.delete(f"/api/data/{record_id}/")
+
+        assert not DepartmentMonthlyStat.objects.exists()
+
+
+@pytest.mark.django_db
+class TestReferencePeriods:
+    """Test cases for the ReferencePeriod catalog and /api/periods/."""
+
+    def test_upload_records_period(self, authenticated_client):
+        csv = "기준년월,부서,매출액\n2024-05,A,100\n2024-05,B,50\n2024-06,A,10\n".encode("utf-8")
+
+        PerformanceDataImporter().import_file(csv, filename="data.csv")
+
+        periods = authenticated_client.get("/api/periods/").json()
+        assert [(p["month"], p["row_count"]) for p in periods] == [("2024-06", 1), ("2024-05", 2)]
+        assert all(p["last_uploaded_at"] for p in periods)
+        assert authenticated_client.get("/api/summary/").json()["reference_dates"] == ["2024-06", "2024-05"]
+
+    def test_emptied_month_removed(self, monthly_data):
+        PerformanceData.objects.filter(reference_date="2024-02").delete()
+        refresh_aggregates(["2024-02"])
+
+        assert list(ReferencePeriod.objects.values_list("month", flat=True)) == ["2024-03", "2024-01"]
+
+    def test_edit_keeps_last_upload_time(self, monthly_data):
+        uploaded_at = timezone.now()
+        refresh_aggregates(["2024-01"], uploaded_at=uploaded_at)
+
+        refresh_aggregates(["2024-01"])
+
+        assert ReferencePeriod.objects.get(month="2024-01").last_uploaded_at == uploaded_at
+
+    def test_period_detail(self, authenticated_client, monthly_data):
+        response = authenticated_client.get("/api/periods/2024-03/")
+
+        assert response.status_code == 200
+        assert response.json()["row_count"] == 24
@@ -0,0 +1,98 @@
+"""
+Tests for the async (ASGI) read-only views under /api/async/.
+"""
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from rest_framework.authtoken.models import Token
+from rest_framework.pagination import PageNumberPagination
+
+from api.models import StudentRoster, UploadLog
+from api.services.aggregates import refresh_aggregates
+from conftest import PerformanceDataFactory
+
+
+@pytest.fixture
+def read_data(db, monkeypatch):
+    monkeypatch.setattr(PageNumberPagination, "page_size", 2)
+    for month, department, revenue in [
+        ("2024-01", "컴퓨터공학과", 100),
+        ("2024-01", "경영학과", 50),
+        ("2024-02", "컴퓨터공학과", 300),
+        ("2024-03", "물리학과", 70),
+        ("2024-03", "경영학과", 20),
+    ]:
+        PerformanceDataFactory(reference_date=month, department=department, revenue=revenue)
+    refresh_aggregates()
+    StudentRoster.objects.create(student_id="1", name="가", college="공과대학", department="컴퓨터공학과")
+    StudentRoster.objects.create(student_id="2", name="나", college="경영대학", department="경영학과", enrollment_status="휴학")
+    UploadLog.objects.create(reference_date="2024-01", filename="a.xlsx", row_count=2)
+
+
+@pytest.mark.django_db
+class TestAsyncViews:
+    """Async endpoints return exactly what the DRF endpoints return."""
+
+    @pytest.mark.parametrize(
+        "path, params",
+        [
+            ("summary/", {}),
+            ("summary/", {"start_date": "2024-02", "ranking_metric": "papers"}),
+            ("summary/", {"departments": "경영학과,물리학과", "reference_date": "2024-03"}),
+            ("summary/", {"ranking_metric": "unknown"}),
+            ("data/", {}),
+            ("data/", {"page": 2}),
+            ("data/", {"page": "last", "department": "공학"}),
+            ("data/", {"page": 99}),
+            ("students/", {"enrollment_status": "휴학"}),
+            ("logs/", {}),
+            ("periods/", {}),
+        ],
+    )
+    def test_matches_sync_endpoint(self, authenticated_client, read_data, path, params):
+        sync_response = authenticated_client.get(f"/api/{path}", params)
+        async_response = authenticated_client.get(f"/api/async/{path}", params)
+
+        assert async_response.status_code == sync_response.status_code
+        # 페이지 링크만 경로가 다름 (/api/async/data/?page=2)
+        assert async_response.content.decode().replace("/api/async/", "/api/") == sync_response.content.decode()
+
+    def test_async_client_with_token(self, read_data, user):
+        token = Token.objects.create(user=user)
+        response = async_to_sync(AsyncClient().get)(
+            "/api/async/summary/", headers={"Authorization": f"Token {token.key}"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["reference_dates"] == ["2024-03", "2024-02", "2024-01"]
+
+    def test_invalid_token(self, client, read_data):
+        sync_response = client.get("/api/data/", HTTP_AUTHORIZATION="Token nope")
+        response = client.get("/api/async/data/", HTTP_AUTHORIZATION="Token nope")
+
+        assert response.status_code == 403
+        assert response.json() == sync_response.json()
+
+    def test_requires_authentication(self, client, read_data):
+        response = client.get("/api/async/summary/")
+
+        assert response.status_code == 403
+        assert response.json() == client.get("/api/summary/").json()
+
+    def test_follows_authentication_classes(self, authenticated_client, read_data, settings):
+        # 세션 인증을 빼면 로그인 세션은 무시되고 토큰만 허용 (401 + WWW-Authenticate, DRF와 동일)
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            "DEFAULT_AUTHENTICATION_CLASSES": ["rest_framework.authentication.TokenAuthentication"],
+        }
+
+        response = authenticated_client.get("/api/async/summary/")
+
+        assert response.status_code == 401
+        assert response["WWW-Authenticate"] == "Token"
+
+    def test_read_only(self, authenticated_client, read_data):
+        response = authenticated_client.post("/api/async/data/", {})
+
+        assert response.status_code == 405
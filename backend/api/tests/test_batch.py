@@ -0,0 +1,140 @@
+"""
+Tests for the /api/batch/ endpoint.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from api.db import routers
+from api.services.aggregates import refresh_aggregates
+from conftest import PerformanceDataFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def batch_data(db):
+    PerformanceDataFactory(reference_date="2024-01", department="컴퓨터공학과", revenue=100)
+    PerformanceDataFactory(reference_date="2024-02", department="경영학과", revenue=200)
+    refresh_aggregates()
+
+
+def post_batch(client, queries):
+    return client.post("/api/batch/", {"queries": queries}, content_type="application/json")
+
+
+@pytest.mark.django_db
+class TestBatchView:
+    """Test cases for /api/batch/."""
+
+    def post(self, client, queries):
+        return post_batch(client, queries)
+
+    def test_matches_individual_endpoints(self, authenticated_client, batch_data):
+        response = self.post(
+            authenticated_client,
+            [
+                {"id": "summary", "type": "summary", "params": {"start_date": "2024-02"}},
+                {"id": "data", "type": "data", "params": {"department": "경영학과"}},
+                {"type": "facets"},
+                {"type": "logs"},
+            ],
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["id"] for r in results] == ["summary", "data", "facets", "logs"]
+        assert all(r["status"] == 200 for r in results)
+        assert results[0]["data"] == authenticated_client.get("/api/summary/", {"start_date": "2024-02"}).json()
+        assert results[1]["data"] == authenticated_client.get("/api/data/", {"department": "경영학과"}).json()
+        assert results[2]["data"] == authenticated_client.get("/api/facets/").json()
+
+    def test_list_params_are_repeated(self, authenticated_client, batch_data):
+        results = self.post(
+            authenticated_client, [{"type": "summary", "params": {"departments": ["컴퓨터공학과"]}}]
+        ).json()["results"]
+
+        assert [r["department"] for r in results[0]["data"]["department_ranking"]] == ["컴퓨터공학과"]
+
+    def test_per_query_errors(self, authenticated_client, batch_data):
+        results = self.post(
+            authenticated_client,
+            [
+                {"id": "bad", "type": "unknown"},
+                {"id": "metric", "type": "summary", "params": {"ranking_metric": "nope"}},
+                {"id": "ok", "type": "periods"},
+            ],
+        ).json()["results"]
+
+        assert [r["status"] for r in results] == [400, 400, 200]
+        assert [p["month"] for p in results[2]["data"]] == ["2024-02", "2024-01"]
+
+    def test_sub_query_exception_is_isolated(self, authenticated_client, batch_data):
+        with mock.patch("api.views.DashboardSummaryView.get", side_effect=RuntimeError("boom")):
+            results = self.post(authenticated_client, [{"type": "summary"}, {"type": "facets"}]).json()["results"]
+
+        assert [r["status"] for r in results] == [500, 200]
+
+    @override_settings(BATCH_MAX_QUERIES=2)
+    def test_too_many_queries(self, authenticated_client, batch_data):
+        response = self.post(authenticated_client, [{"type": "facets"}] * 3)
+
+        assert response.status_code == 400
+
+    def test_requires_queries(self, authenticated_client):
+        assert self.post(authenticated_client, []).status_code == 400
+        assert authenticated_client.post("/api/batch/", {}, content_type="application/json").status_code == 400
+
+    def test_requires_authentication(self, client, batch_data):
+        assert self.post(client, [{"type": "facets"}]).status_code in (401, 403)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBatchViewThreads:
+    """연결 풀이 있을 때의 스레드 실행 경로 (SQLite 테스트 DB에서는 풀 확인을 대체)"""
+
+    QUERIES = [{"type": "summary"}, {"type": "data"}, {"type": "facets"}, {"type": "periods"}]
+
+    def test_threads_only_with_pool(self):
+        from api.views import BatchView
+
+        assert not BatchView.use_threads()
+
+    def test_threaded_matches_sequential(self, authenticated_client, batch_data):
+        sequential = post_batch(authenticated_client, self.QUERIES).json()
+        cache.clear()
+
+        with mock.patch("api.views.BatchView.use_threads", return_value=True), mock.patch(
+            "api.views.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as executor:
+            threaded = post_batch(authenticated_client, self.QUERIES).json()
+
+        executor.assert_called_once()
+        assert threaded == sequential
+
+    def test_each_thread_gets_own_routing_state(self, authenticated_client, batch_data):
+        from api.views import BatchView
+
+        seen = []
+        run = BatchView._run
+
+        def record_state(request, query):
+            seen.append(routers.current_state())
+            return run(request, query)
+
+        with mock.patch("api.views.BatchView.use_threads", return_value=True), mock.patch.object(
+            BatchView, "_run", side_effect=record_state
+        ):
+            post_batch(authenticated_client, self.QUERIES)
+
+        assert len(seen) == len(self.QUERIES) and None not in seen
+        assert len({id(state) for state in seen}) == len(self.QUERIES)
@@ -0,0 +1,246 @@
+"""
+Tests for the resumable chunked upload protocol.
+
+init -> PUT chunks with Content-Range -> finalize
+"""
+
+import hashlib
+import os
+import time
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from django.utils import timezone
+
+from api.models import ChunkedUpload, PerformanceData, UploadLog
+from api.services import chunked_upload
+from api.services.ingestion import PerformanceDataImporter
+from conftest import AdminUserFactory, UserFactory
+
+CSV_CONTENT = ("기준년월,부서명,매출액,논문수\n" + "".join(f"2024-05,부서{i},{i * 1000},{i}\n" for i in range(50))).encode("utf-8")
+
+
+@pytest.fixture(autouse=True)
+def chunk_dir(settings, tmp_path):
+    settings.CHUNKED_UPLOAD_DIR = tmp_path / "chunks"
+    return settings.CHUNKED_UPLOAD_DIR
+
+
+def init_upload(client, content=CSV_CONTENT, **extra):
+    payload = {"filename": "data.csv", "total_size": len(content), **extra}
+    response = client.post("/api/upload/chunked/", payload, content_type="application/json")
+    assert response.status_code == 201
+    return response.json()["upload_id"]
+
+
+def put_chunk(client, upload_id, content, start, end, **headers):
+    return client.put(
+        f"/api/upload/chunked/{upload_id}/",
+        data=content[start:end],
+        content_type="application/octet-stream",
+        HTTP_CONTENT_RANGE=f"bytes {start}-{end - 1}/{len(content)}",
+        **headers,
+    )
+
+
+@pytest.mark.django_db
+class TestChunkedUpload:
+    """Test cases for the chunked upload endpoints."""
+
+    def test_upload_in_chunks_and_finalize(self, authenticated_client):
+        upload_id = init_upload(authenticated_client, checksum=hashlib.sha256(CSV_CONTENT).hexdigest())
+        middle = len(CSV_CONTENT) // 2
+
+        assert put_chunk(authenticated_client, upload_id, CSV_CONTENT, 0, middle).json()["offset"] == middle
+        assert put_chunk(authenticated_client, upload_id, CSV_CONTENT, middle, len(CSV_CONTENT)).status_code == 200
+
+        response = authenticated_client.post(f"/api/upload/chunked/{upload_id}/finalize/")
+
+        assert response.status_code == 201
+        assert response.json()["created_count"] == 50
+        assert PerformanceData.objects.filter(reference_date="2024-05").count() == 50
+        assert UploadLog.objects.get().filename == "data.csv"
+        assert ChunkedUpload.objects.get(pk=upload_id).status == "complete"
+
+    def test_finalize_streams_assembled_file(self, authenticated_client, chunk_dir):
+        upload_id = init_upload(authenticated_client)
+        put_chunk(authenticated_client, upload_id, CSV_CONTENT, 0, len(CSV_CONTENT))
+
+        with mock.patch.object(
+            PerformanceDataImporter, "import_file", autospec=True, side_effect=PerformanceDataImporter.import_file
+        ) as import_file:
+            response = authenticated_client.post(f"/api/upload/chunked/{upload_id}/finalize/")
+
+        assert response.status_code == 201
+        # 조립된 파일은 메모리로 읽지 않고 경로로 전달
+        assert import_file.call_args.args[1] == chunk_dir / f"{upload_id}.part"
+
+    def test_out_of_order_chunk_returns_expected_offset(self, authenticated_client):
+        upload_id = init_upload(authenticated_client)
+
+        response = put_chunk(authenticated_client, upload_id, CSV_CONTENT, 10, 20)
+
+        assert response.status_code == 409
+        assert response.json()["offset"] == 0
+
+    def test_resume_after_interrupted_chunk(self, authenticated_client):
+        upload_id = init_upload(authenticated_client)
+        put_chunk(authenticated_client, upload_id, CSV_CONTENT, 0, 100)
+
+        # 연결 끊김 후 현재 offset 조회하여 재개
+        offset = authenticated_client.get(f"/api/upload/chunked/{upload_id}/").json()["offset"]
+        put_chunk(authenticated_client, upload_id, CSV_CONTENT, offset, len(CSV_CONTENT))
+
+        response = authenticated_client.post(f"/api/upload/chunked/{upload_id}/finalize/")
+        assert response.status_code == 201
+
+    def test_chunk_checksum_mismatch_is_rejected(self, authenticated_client):
+        upload_id = init_upload(authenticated_client)
+
+        response = put_chunk(authenticated_client, upload_id, CSV_CONTENT, 0, 100, HTTP_X_CHUNK_CHECKSUM="0" * 64)
+
+        assert response.status_code == 400
+        assert ChunkedUpload.objects.get(pk=upload_id).received_bytes == 0
+
+    def test_file_checksum_mismatch_blocks_finalize(self, authenticated_client):
+        upload_id = init_upload(authenticated_client, checksum="f" * 64)
+        put_chunk(authenticated_client, upload_id, CSV_CONTENT, 0, len(CSV_CONTENT))
+
+        response = authenticated_client.post(f"/api/upload/chunked/{upload_id}/finalize/")
+
+        assert response.status_code == 400
+        assert not PerformanceData.objects.exists()
+
+    def test_finalize_incomplete_upload(self, authenticated_client):
+        upload_id = init_upload(authenticated_client)
+        put_chunk(authenticated_client, upload_id, CSV_CONTENT, 0, 100)
+
+        response = authenticated_client.post(f"/api/upload/chunked/{upload_id}/finalize/")
+
+        assert response.status_code == 400
+        assert response.json()["offset"] == 100
+        # 이어서 업로드할 수 있도록 선점 해제
+        assert ChunkedUpload.objects.get(pk=upload_id).status == "uploading"
+
+    def test_finalize_is_claimed_once(self, authenticated_client):
+        upload_id = init_upload(authenticated_client)
+        put_chunk(authenticated_client, upload_id, CSV_CONTENT, 0, len(CSV_CONTENT))
+        # 느린 finalize가 진행 중인 상태에서 클라이언트가 재시도
+        assert chunked_upload.claim_upload(ChunkedUpload.objects.get(pk=upload_id))
+
+        response = authenticated_client.post(f"/api/upload/chunked/{upload_id}/finalize/")
+
+        assert response.status_code == 409
+        assert not PerformanceData.objects.exists()
+
+    def test_finalize_twice(self, authenticated_client):
+        upload_id = init_upload(authenticated_client)
+        put_chunk(authenticated_client, upload_id, CSV_CONTENT, 0, len(CSV_CONTENT))
+        authenticated_client.post(f"/api/upload/chunked/{upload_id}/finalize/")
+
+        response = authenticated_client.post(f"/api/upload/chunked/{upload_id}/finalize/")
+
+        assert response.status_code == 409
+        assert UploadLog.objects.count() == 1
+
+    def test_total_size_mismatch_is_rejected(self, authenticated_client):
+        upload_id = init_upload(authenticated_client)
+
+        response = authenticated_client.put(
+            f"/api/upload/chunked/{upload_id}/",
+            data=CSV_CONTENT[:100],
+            content_type="application/octet-stream",
+            HTTP_CONTENT_RANGE=f"bytes 0-99/{len(CSV_CONTENT) + 1}",
+        )
+
+        assert response.status_code == 400
+        assert ChunkedUpload.objects.get(pk=upload_id).received_bytes == 0
+
+    def test_rejects_unsupported_extension(self, authenticated_client):
+        response = authenticated_client.post(
+            "/api/upload/chunked/",
+            {"filename": "data.txt", "total_size": 10},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+class TestUploadOwnership:
+    """Sessions are only visible to the user who started them (and staff)."""
+
+    @pytest.fixture
+    def upload_id(self, authenticated_client):
+        return init_upload(authenticated_client)
+
+    @pytest.fixture
+    def other_client(self):
+        client = Client()
+        client.force_login(UserFactory())
+        return client
+
+    def test_other_user_gets_not_found(self, upload_id, other_client):
+        assert other_client.get(f"/api/upload/chunked/{upload_id}/").status_code == 404
+        assert put_chunk(other_client, upload_id, CSV_CONTENT, 0, len(CSV_CONTENT)).status_code == 404
+        assert other_client.post(f"/api/upload/chunked/{upload_id}/finalize/").status_code == 404
+        assert other_client.delete(f"/api/upload/chunked/{upload_id}/").status_code == 404
+
+        upload = ChunkedUpload.objects.get(pk=upload_id)
+        assert (upload.received_bytes, upload.status) == (0, "uploading")
+
+    def test_staff_can_access(self, upload_id):
+        client = Client()
+        client.force_login(AdminUserFactory())
+
+        assert client.get(f"/api/upload/chunked/{upload_id}/").status_code == 200
+
+
+@pytest.mark.django_db
+class TestExpiredUploads:
+    """Test cases for cleaning up abandoned sessions (clean_chunked_uploads)."""
+
+    def test_deletes_stale_sessions_and_files(self, authenticated_client, chunk_dir):
+        stale_id = init_upload(authenticated_client)
+        fresh_id = init_upload(authenticated_client)
+        ChunkedUpload.objects.filter(pk=stale_id).update(updated_at=timezone.now() - timedelta(days=2))
+
+        call_command("clean_chunked_uploads", "--max-age", "86400")
+
+        assert [str(pk) for pk in ChunkedUpload.objects.values_list("pk", flat=True)] == [fresh_id]
+        assert not (chunk_dir / f"{stale_id}.part").exists()
+        assert (chunk_dir / f"{fresh_id}.part").exists()
+
+    def test_keeps_sessions_being_finalized(self, authenticated_client, chunk_dir, settings):
+        settings.CHUNKED_UPLOAD_PROCESSING_EXPIRY = 7 * 86400
+        importing_id = init_upload(authenticated_client)
+        crashed_id = init_upload(authenticated_client)
+        ChunkedUpload.objects.filter(pk=importing_id).update(
+            status="processing", updated_at=timezone.now() - timedelta(days=2)
+        )
+        ChunkedUpload.objects.filter(pk=crashed_id).update(
+            status="processing", updated_at=timezone.now() - timedelta(days=8)
+        )
+
+        assert chunked_upload.delete_expired_uploads(max_age=86400) == 1
+
+        # 가져오기 중인 세션의 파일은 유지, 워커가 죽어 남은 세션만 삭제
+        assert [str(pk) for pk in ChunkedUpload.objects.values_list("pk", flat=True)] == [importing_id]
+        assert (chunk_dir / f"{importing_id}.part").exists()
+        assert not (chunk_dir / f"{crashed_id}.part").exists()
+
+    def test_deletes_orphaned_part_files(self, chunk_dir):
+        orphan = chunked_upload.get_upload_dir() / "orphan.part"
+        orphan.touch()
+        recent = chunk_dir / "recent.part"
+        recent.touch()
+        old = time.time() - 2 * 86400
+        os.utime(orphan, (old, old))
+
+        assert chunked_upload.delete_expired_uploads(max_age=86400) == 0
+
+        assert not orphan.exists()
+        assert recent.exists()
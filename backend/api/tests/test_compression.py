@@ -0,0 +1,175 @@
+"""
+Tests for response compression (api/compression.py, ResponseCompressionMiddleware).
+"""
+
+import gzip
+import json
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from prometheus_client import REGISTRY
+
+from api import compression
+from api.middleware import ResponseCompressionMiddleware
+from conftest import PerformanceDataFactory
+
+BODY = json.dumps([{"department": "경영학과", "revenue": "123456.00", "row": i} for i in range(200)]).encode()
+
+
+def compressed_bytes(encoding: str, stage: str) -> float:
+    return REGISTRY.get_sample_value("response_compression_bytes_total", {"encoding": encoding, "stage": stage}) or 0
+
+
+def run(response, accept_encoding="gzip, deflate, br"):
+    request = RequestFactory().get("/api/data/", HTTP_ACCEPT_ENCODING=accept_encoding)
+    return ResponseCompressionMiddleware(lambda request: response)(request)
+
+
+def json_response(body=BODY, **headers):
+    response = HttpResponse(body, content_type="application/json")
+    for key, value in headers.items():
+        response[key] = value
+    return response
+
+
+@pytest.fixture
+def gzip_only(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+
+
+class TestResponseCompressionMiddleware:
+    """Test cases for ResponseCompressionMiddleware."""
+
+    def test_gzip(self, gzip_only):
+        before = compressed_bytes("gzip", "original")
+
+        response = run(json_response())
+
+        assert response["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.content) == BODY
+        assert response["Content-Length"] == str(len(response.content))
+        assert "Accept-Encoding" in response["Vary"]
+        assert compressed_bytes("gzip", "original") - before == len(BODY)
+
+    def test_brotli_preferred(self):
+        brotli = pytest.importorskip("brotli")
+
+        response = run(json_response())
+
+        assert response["Content-Encoding"] == "br"
+        assert brotli.decompress(response.content) == BODY
+
+    def test_identity_when_not_accepted(self):
+        response = run(json_response(), accept_encoding="identity")
+
+        assert "Content-Encoding" not in response
+        assert response.content == BODY
+        assert "Accept-Encoding" in response["Vary"]
+
+    def test_small_body_is_not_compressed(self, settings):
+        settings.RESPONSE_COMPRESSION_MIN_SIZE = len(BODY) + 1
+
+        response = run(json_response())
+
+        assert "Content-Encoding" not in response
+        assert response.content == BODY
+
+    @pytest.mark.parametrize(
+        "content_type",
+        ["image/png", "application/zip", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"],
+    )
+    def test_compressed_types_are_skipped(self, content_type):
+        response = run(HttpResponse(BODY, content_type=content_type))
+
+        assert "Content-Encoding" not in response
+
+    def test_already_encoded_response_is_skipped(self):
+        body = gzip.compress(BODY)
+
+        response = run(json_response(body, **{"Content-Encoding": "gzip"}))
+
+        assert response.content == body
+
+    def test_no_transform(self):
+        response = run(json_response(**{"Cache-Control": "no-transform"}))
+
+        assert "Content-Encoding" not in response
+
+    def test_strong_etag_becomes_weak(self, gzip_only):
+        response = run(json_response(ETag='"abc"'))
+
+        assert response["ETag"] == 'W/"abc"'
+
+    def test_gzip_level_setting(self, settings, gzip_only):
+        # gzip 헤더의 XFL 바이트: 최대 압축(9)=2, 최고 속도(1)=4
+        settings.RESPONSE_COMPRESSION_GZIP_LEVEL = 9
+        assert run(json_response()).content[8] == 2
+
+        settings.RESPONSE_COMPRESSION_GZIP_LEVEL = 1
+        assert run(json_response()).content[8] == 4
+
+
+class TestStreamingCompression:
+    """StreamingHttpResponse 청크 단위 압축"""
+
+    def test_chunks_are_sent_incrementally(self, gzip_only):
+        consumed = []
+
+        def chunks():
+            for i in range(3):
+                consumed.append(i)
+                yield BODY
+
+        response = run(StreamingHttpResponse(chunks(), content_type="application/json"))
+        stream = iter(response.streaming_content)
+
+        first = next(stream)
+        assert consumed == [0]  # 첫 청크의 압축 결과가 다음 청크를 읽기 전에 전송됨
+        body = first + b"".join(stream)
+
+        assert response["Content-Encoding"] == "gzip"
+        assert not response.has_header("Content-Length")
+        assert gzip.decompress(body) == BODY * 3
+
+    def test_async_stream(self, gzip_only):
+        async def chunks():
+            for _ in range(3):
+                yield BODY
+
+        response = run(StreamingHttpResponse(chunks(), content_type="application/json"))
+
+        async def read():
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        assert gzip.decompress(async_to_sync(read)()) == BODY * 3
+
+    def test_streamed_bytes_recorded_at_end(self, gzip_only):
+        before = compressed_bytes("gzip", "original")
+
+        response = run(StreamingHttpResponse(iter([BODY, BODY]), content_type="application/json"))
+        b"".join(response.streaming_content)
+
+        assert compressed_bytes("gzip", "original") - before == 2 * len(BODY)
+
+    def test_middleware_is_async_capable(self):
+        async def get_response(request):
+            return json_response()
+
+        middleware = ResponseCompressionMiddleware(get_response)
+        assert iscoroutinefunction(middleware)
+
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip")
+        response = async_to_sync(middleware)(request)
+        assert response["Content-Encoding"] in ("gzip", "br")
+
+
+@pytest.mark.django_db
+def test_api_list_is_compressed(authenticated_client, gzip_only):
+    PerformanceDataFactory.create_batch(30)
+
+    response = authenticated_client.get("/api/data/", HTTP_ACCEPT_ENCODING="gzip")
+
+    assert response["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.content))["count"] == 30
@@ -0,0 +1,94 @@
+"""
+Tests for the database connection layer (api.db).
+"""
+
+from unittest import mock
+
+import pytest
+from django.db import connections
+from prometheus_client import REGISTRY
+
+from api.db import config as db_config
+from api.db.backends.sqlite3.base import DatabaseWrapper
+from api.db.config import database_config
+
+POOL_OPTIONS = {"min_size": 1, "max_size": 4, "max_idle": 60, "max_lifetime": 600, "timeout": 5}
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestDatabaseConfig:
+    """Test cases for database_config."""
+
+    def test_postgres_uses_pool(self):
+        with mock.patch.object(db_config, "pool_available", return_value=True):
+            config = database_config("postgres://u:p@db.example.com:5432/app", POOL_OPTIONS, conn_max_age=60)
+
+        assert config["ENGINE"] == "api.db.backends.postgresql"
+        assert config["OPTIONS"]["pool"] == POOL_OPTIONS
+        assert config["CONN_MAX_AGE"] == 0
+
+    def test_postgres_without_psycopg_pool_persists_connections(self):
+        with mock.patch.object(db_config, "pool_available", return_value=False):
+            config = database_config("postgres://u:p@db.example.com:5432/app", POOL_OPTIONS, conn_max_age=60)
+
+        assert "pool" not in config.get("OPTIONS", {})
+        assert config["CONN_MAX_AGE"] == 60
+        assert config["CONN_HEALTH_CHECKS"] is True
+
+    def test_no_pool_before_django_5_1(self):
+        with mock.patch.object(db_config.django, "VERSION", (5, 0, 9, "final", 0)):
+            assert not db_config.pool_available()
+
+    def test_pool_disabled(self):
+        with mock.patch.object(db_config, "pool_available", return_value=True):
+            config = database_config("postgres://u:p@db.example.com:5432/app", None, conn_max_age=0)
+
+        assert "pool" not in config.get("OPTIONS", {})
+        assert config["CONN_MAX_AGE"] == 0
+        assert config["CONN_HEALTH_CHECKS"] is False
+
+    def test_sqlite_never_pools(self, tmp_path):
+        config = database_config(f"sqlite:///{tmp_path / 'db.sqlite3'}", POOL_OPTIONS, conn_max_age=30)
+
+        assert config["ENGINE"] == "api.db.backends.sqlite3"
+        assert "pool" not in config.get("OPTIONS", {})
+        assert config["CONN_MAX_AGE"] == 30
+
+
+class TestInstrumentedBackend:
+    """Test cases for connection metrics of the api.db backends."""
+
+    def test_connect_and_release_are_observed(self, tmp_path, django_db_blocker):
+        settings_dict = {**connections["default"].settings_dict, "NAME": str(tmp_path / "metrics.sqlite3")}
+        wrapper = DatabaseWrapper(settings_dict, alias="metrics_test")
+        acquired = sample("db_connection_acquire_seconds_count", alias="metrics_test", source="connect")
+        released = sample("db_connection_age_seconds_count", alias="metrics_test")
+
+        with django_db_blocker.unblock():
+            wrapper.ensure_connection()
+            wrapper.close()
+
+        assert sample("db_connection_acquire_seconds_count", alias="metrics_test", source="connect") == acquired + 1
+        assert sample("db_connection_age_seconds_count", alias="metrics_test") == released + 1
+        assert wrapper.connection_opened_at is None
+
+    def test_pool_stats_are_exported(self, tmp_path):
+        settings_dict = {**connections["default"].settings_dict, "NAME": str(tmp_path / "pool.sqlite3")}
+        wrapper = DatabaseWrapper(settings_dict, alias="pool_test")
+        pool = mock.Mock()
+        pool.get_stats.return_value = {"pool_size": 4, "pool_available": 3, "requests_waiting": 1}
+
+        with mock.patch.object(DatabaseWrapper, "connection_pool", pool):
+            wrapper.record_pool_stats()
+
+        assert sample("db_pool_connections", alias="pool_test", state="size") == 4
+        assert sample("db_pool_connections", alias="pool_test", state="available") == 3
+        assert sample("db_pool_connections", alias="pool_test", state="waiting") == 1
+
+    @pytest.mark.django_db
+    def test_default_connection_is_instrumented(self):
+        assert connections["default"].settings_dict["ENGINE"] == "api.db.backends.sqlite3"
+        assert hasattr(connections["default"], "connection_opened_at")
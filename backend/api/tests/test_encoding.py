@@ -0,0 +1,83 @@
+"""
+Unit tests for CSV encoding detection.
+"""
+
+import codecs
+
+import pytest
+
+from api.services.encoding import detect_encoding, fallback_encodings, looks_like_korean
+from api.services.excel_parser import ExcelParser
+
+KOREAN_CSV = "기준년월,부서명,매출액\n2024-05,컴퓨터공학과,1000\n2024-05,전자공학과,2000\n"
+
+
+class TestDetectEncoding:
+    """Test cases for detect_encoding()."""
+
+    def test_utf8(self):
+        assert detect_encoding(KOREAN_CSV.encode("utf-8")) == "utf-8"
+
+    def test_utf8_bom(self):
+        assert detect_encoding(codecs.BOM_UTF8 + KOREAN_CSV.encode("utf-8")) == "utf-8-sig"
+
+    def test_cp949(self):
+        assert detect_encoding(KOREAN_CSV.encode("cp949")) == "cp949"
+
+    def test_euc_kr_detected_as_cp949(self):
+        """CP949 is a superset of EUC-KR, so EUC-KR files decode with cp949."""
+        assert detect_encoding(KOREAN_CSV.encode("euc-kr")) == "cp949"
+
+    def test_latin1(self):
+        assert detect_encoding("date,name\n2024-05,Café Müller\n".encode("latin1")) == "latin1"
+
+    def test_multibyte_character_cut_at_sample_boundary(self):
+        """A character split by the sample boundary should not fail UTF-8 validation."""
+        content = ("가" * 100).encode("utf-8")
+        assert detect_encoding(content, sample_size=10) == "utf-8"
+
+    def test_hangul_heuristic(self):
+        assert looks_like_korean("컴퓨터공학과".encode("cp949"))
+        assert not looks_like_korean(b"plain ascii")
+
+    def test_tail_window_sees_late_korean(self):
+        content = b"a,b\n" * 50000 + "가,나\n".encode("cp949")
+        assert detect_encoding(content) == "cp949"
+
+    def test_file_on_disk_sampled_by_windows(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_bytes(codecs.BOM_UTF8 + KOREAN_CSV.encode("utf-8"))
+        assert detect_encoding(path) == "utf-8-sig"
+
+        path.write_bytes(b"a,b\n" * 50000 + "가,나\n".encode("cp949"))
+        assert detect_encoding(path) == "cp949"
+
+    def test_fallback_order(self):
+        assert fallback_encodings("utf-8") == ["cp949", "euc-kr", "latin1"]
+        assert fallback_encodings("latin1") == []
+
+
+class TestReadCsvEncodings:
+    """read_excel should parse CSVs in every supported encoding."""
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "cp949", "euc-kr"])
+    def test_korean_csv(self, encoding):
+        df = ExcelParser().read_excel(KOREAN_CSV.encode(encoding), filename="data.csv")
+        assert list(df.columns) == ["reference_date", "department", "revenue"]
+        assert df["department"].tolist() == ["컴퓨터공학과", "전자공학과"]
+
+    def test_korean_only_at_end_of_large_file(self):
+        """Korean text far past the head sample should still be detected."""
+        content = b"reference_date,department,revenue\n" + b"2024-05,dept,1\n" * 10000 + "2024-05,공학과,1\n".encode("cp949")
+        df = ExcelParser().read_excel(content, filename="data.csv")
+        assert df["department"].iloc[-1] == "공학과"
+
+    @pytest.mark.parametrize("engine", ["auto", "c"])
+    def test_reads_file_path(self, tmp_path, engine):
+        """Assembled chunked uploads are parsed from disk, not from bytes."""
+        path = tmp_path / "upload.part"
+        path.write_bytes(KOREAN_CSV.encode("cp949"))
+        parser = ExcelParser()
+        parser.CSV_ENGINE = engine
+        df = parser.read_excel(path, filename="data.csv")
+        assert df["department"].tolist() == ["컴퓨터공학과", "전자공학과"]
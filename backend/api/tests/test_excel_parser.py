@@ -286,6 +286,123 @@ class TestColumnMapping:
         assert parser.COLUMN_MAPPING["논문"] == "paper_count"
 
 
+class TestColumnResolver:
+    """Test cases for the precompiled column resolver."""
+
+    @pytest.fixture
+    def resolver(self):
+        """Return the shared ExcelParser column resolver."""
+        return ExcelParser.get_column_resolver()
+
+    def test_exact_mapping(self, resolver):
+        """Known column names should map to model fields."""
+        mapping = resolver.resolve(["기준년월", "부서명", "매출액"])
+        assert mapping == {"기준년월": "reference_date", "부서명": "department", "매출액": "revenue"}
+
+    def test_department_priority(self, resolver):
+        """단과대학 should win over 학과 when both map to department."""
+        mapping = resolver.resolve(["평가년도", "학과", "단과대학"])
+        assert mapping["단과대학"] == "department"
+        assert "학과" not in mapping
+
+    def test_date_priority(self, resolver):
+        """기준년월 should win over 날짜 when both map to reference_date."""
+        mapping = resolver.resolve(["날짜", "기준년월", "부서"])
+        assert mapping["기준년월"] == "reference_date"
+        assert "날짜" not in mapping
+
+    def test_keyword_detection(self, resolver):
+        """Unknown columns containing date/department keywords should be detected."""
+        mapping = resolver.resolve(["작성 일자", "소속기관명", "금액"])
+        assert mapping["작성 일자"] == "reference_date"
+        assert mapping["소속기관명"] == "department"
+
+    def test_same_header_hits_cache(self, resolver):
+        """Repeated headers should be served from the signature cache."""
+        header = ["기준년월", "부서명", "캐시테스트컬럼"]
+        resolver.resolve(header)
+        hits = resolver.cache_info().hits
+        resolver.resolve(header)
+        assert resolver.cache_info().hits == hits + 1
+
+    def test_read_excel_applies_resolved_mapping(self):
+        """read_excel should rename columns using the resolver."""
+        content = "기준 년월,학과,매출,논문\n2024-05,컴퓨터공학과,1000,3\n".encode("utf-8")
+        df = ExcelParser().read_excel(content, filename="data.csv")
+        assert list(df.columns) == ["reference_date", "department", "revenue", "paper_count"]
+
+
+class TestTypedParsing:
+    """Test cases for typed CSV reads and vectorized DataFrame parsing."""
+
+    @pytest.fixture
+    def parser(self):
+        """Create ExcelParser instance."""
+        return ExcelParser()
+
+    def test_thousand_separators_arrive_numeric(self, parser):
+        """Quoted numbers with thousand separators should be parsed as numbers."""
+        content = '기준년월,부서명,매출액,논문수\n2024-05,컴퓨터공학과,"1,234,567.89","1,200"\n'.encode("utf-8")
+        df = parser.read_excel(content, filename="data.csv")
+        assert pd.api.types.is_numeric_dtype(df["revenue"])
+        assert pd.api.types.is_numeric_dtype(df["paper_count"])
+        objects, _ = parser.parse_dataframe(df)
+        assert objects[0].revenue == Decimal("1234567.89")
+        assert objects[0].paper_count == 1200
+
+    def test_text_columns_keep_leading_zeros(self, parser):
+        """Columns mapped to text fields should be read as strings."""
+        content = "기준년월,부서명,부서코드\n2024.10,컴퓨터공학과,007\n".encode("utf-8")
+        df = parser.read_excel(content, filename="data.csv")
+        objects, _ = parser.parse_dataframe(df)
+        assert objects[0].department_code == "007"
+        assert objects[0].reference_date == "2024-10"
+
+    def test_invalid_numbers_use_defaults(self, parser):
+        """Unparseable numeric cells should fall back to 0 like to_decimal/to_int."""
+        df = pd.DataFrame(
+            {
+                "reference_date": ["2024-05", "2024-05"],
+                "department": ["A", "B"],
+                "revenue": ["abc", "1,000"],
+                "paper_count": ["3.7", None],
+            }
+        )
+        objects, errors = parser.parse_dataframe(df)
+        assert errors == []
+        assert [o.revenue for o in objects] == [Decimal("0"), Decimal("1000")]
+        assert [o.paper_count for o in objects] == [3, 0]
+
+    def test_huge_integer_is_row_error_not_wrapped(self, parser):
+        """Counts beyond the IntegerField range should be rejected, not wrapped by the int64 cast."""
+        content = "기준년월,부서명,논문수\n2024-05,A,1e20\n2024-05,B,-3000000000\n2024-05,C,12\n".encode("utf-8")
+        df = parser.read_excel(content, filename="data.csv")
+        objects, errors = parser.parse_dataframe(df)
+        assert [(o.department, o.paper_count) for o in objects] == [("C", 12)]
+        assert len(errors) == 2
+        assert errors[0].startswith("행 2: paper_count")
+
+    def test_parse_dataframe_matches_parse_row(self, parser):
+        """Vectorized parsing should produce the same values as parse_row."""
+        df = pd.DataFrame(
+            {
+                "reference_date": ["202405", "2024/6", None],
+                "department": [" 컴퓨터공학과 ", None, "C"],
+                "revenue": [1234.56, None, 1.0],
+                "budget": ["2,000", "3000", "1"],
+                "patent_count": [2.9, 1, 0],
+                "extra_metric_1": [None, 12.5, 1],
+            }
+        )
+        objects, _ = parser.parse_dataframe(df)
+        expected = [parser.parse_row(row) for _, row in df.iterrows()]
+        expected = [row for row in expected if row]
+        assert len(objects) == len(expected) == 2
+        for obj, row in zip(objects, expected):
+            for field, value in row.items():
+                assert getattr(obj, field) == value
+
+
 class TestValidateDataframe:
     """Test cases for DataFrame validation."""
 
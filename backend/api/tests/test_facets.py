@@ -0,0 +1,91 @@
+"""
+Tests for the /api/facets/ endpoint.
+"""
+
+import pytest
+from django.core.cache import cache
+
+from api.models import StudentRoster
+from api.services.aggregates import refresh_aggregates
+from api.services.facets import get_facets
+from conftest import PerformanceDataFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def facet_data(db):
+    PerformanceDataFactory(reference_date="2024-01", department="컴퓨터공학과")
+    PerformanceDataFactory(reference_date="2024-02", department="컴퓨터공학과")
+    PerformanceDataFactory(reference_date="2024-02", department="경영학과")
+    refresh_aggregates()
+    StudentRoster.objects.create(student_id="1", name="가", college="공과대학", department="컴퓨터공학과")
+    StudentRoster.objects.create(student_id="2", name="나", college="공과대학", department="전자공학과", enrollment_status="휴학")
+    StudentRoster.objects.create(student_id="3", name="다", college="경영대학", department="경영학과", program_type="석사")
+
+
+@pytest.mark.django_db
+class TestFacetsView:
+    """Test cases for /api/facets/."""
+
+    def test_counts(self, authenticated_client, facet_data):
+        data = authenticated_client.get("/api/facets/").json()
+
+        assert data["performance"]["departments"] == [
+            {"value": "경영학과", "count": 1},
+            {"value": "컴퓨터공학과", "count": 2},
+        ]
+        assert [f["value"] for f in data["performance"]["reference_dates"]] == ["2024-02", "2024-01"]
+        assert data["students"]["colleges"] == [{"value": "경영대학", "count": 1}, {"value": "공과대학", "count": 2}]
+        assert {"value": "휴학", "count": 1} in data["students"]["enrollment_statuses"]
+        assert {"value": "석사", "count": 1} in data["students"]["program_types"]
+
+    def test_not_modified_for_same_version(self, authenticated_client, facet_data):
+        etag = authenticated_client.get("/api/facets/")["ETag"]
+
+        response = authenticated_client.get("/api/facets/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_not_modified_with_compressed_weak_etag(self, authenticated_client, facet_data):
+        # 1KB 이상 본문 -> 압축 미들웨어가 ETag를 W/"..."로 바꿈
+        for i in range(40):
+            PerformanceDataFactory(reference_date="2024-03", department=f"학과{i:02d}")
+        refresh_aggregates(["2024-03"])
+        first = authenticated_client.get("/api/facets/", HTTP_ACCEPT_ENCODING="gzip")
+        assert first["Content-Encoding"] == "gzip"
+        assert first["ETag"].startswith('W/"')
+
+        response = authenticated_client.get(
+            "/api/facets/", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=first["ETag"]
+        )
+
+        assert response.status_code == 304
+
+    def test_cached_until_version_changes(self, facet_data, django_assert_num_queries):
+        get_facets()
+        with django_assert_num_queries(1):  # data version lookup only
+            get_facets()
+
+        PerformanceDataFactory(reference_date="2024-03", department="물리학과")
+        refresh_aggregates(["2024-03"])
+
+        departments = [f["value"] for f in get_facets()["performance"]["departments"]]
+        assert "물리학과" in departments
+
+    def test_student_change_refreshes_facets(self, authenticated_client, facet_data):
+        authenticated_client.get("/api/facets/")
+
+        authenticated_client.post(
+            "/api/students/",
+            {"student_id": "4", "name": "라", "college": "인문대학"},
+            content_type="application/json",
+        )
+
+        colleges = [f["value"] for f in authenticated_client.get("/api/facets/").json()["students"]["colleges"]]
+        assert "인문대학" in colleges
@@ -0,0 +1,80 @@
+"""
+Import-time budget for worker cold start.
+
+Runs ``python -X importtime`` in a fresh interpreter over what a gunicorn
+worker imports before serving its first request (django.setup() + URLconf)
+and checks that the spreadsheet stack (pandas, openpyxl, ExcelParser) is
+not loaded and the total import time stays within budget.
+"""
+
+import os
+import subprocess
+import sys
+
+from conftest import BACKEND_DIR, subprocess_env
+
+BOOT_SCRIPT = "import django; django.setup(); import config.urls"
+
+# 업로드 시 처음 사용될 때 로드되어야 하는 모듈
+LAZY_MODULES = ("pandas", "openpyxl", "api.services.excel_parser", "api.services.sheet_reader")
+
+# 현재 약 0.5초 (pandas 포함 시 약 1.1초), 느린 CI를 고려한 여유값
+IMPORT_TIME_BUDGET_SECONDS = float(os.environ.get("IMPORT_TIME_BUDGET_SECONDS", "1.5"))
+
+
+def run_importtime() -> dict[str, tuple[int, int, bool]]:
+    """{module: (self_us, cumulative_us, top_level)} for every import made by BOOT_SCRIPT."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT],
+        cwd=BACKEND_DIR,
+        env=subprocess_env(DEBUG="False"),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr
+
+    modules = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue  # 헤더 행
+        modules[name.strip()] = (int(self_us), int(cumulative_us), not name.startswith("  "))
+    return modules
+
+
+def total_seconds(modules: dict[str, tuple[int, int, bool]]) -> float:
+    return sum(cumulative for _, cumulative, top_level in modules.values() if top_level) / 1e6
+
+
+def test_worker_boot_skips_spreadsheet_stack():
+    modules = run_importtime()
+
+    loaded = [name for name in LAZY_MODULES if name in modules]
+    assert loaded == [], f"worker boot imports the spreadsheet stack: {loaded}"
+
+
+def test_worker_boot_import_budget():
+    # 단일 측정은 다른 프로세스의 영향을 받으므로 최대 3회 중 최소값으로 판단
+    best = None
+    for _ in range(3):
+        modules = run_importtime()
+        if best is None or total_seconds(modules) < total_seconds(best):
+            best = modules
+        if total_seconds(best) < IMPORT_TIME_BUDGET_SECONDS:
+            break
+
+    slowest = sorted(((cumulative, name) for name, (_, cumulative, top_level) in best.items() if top_level), reverse=True)
+    assert total_seconds(best) < IMPORT_TIME_BUDGET_SECONDS, (
+        f"import time {total_seconds(best):.2f}s exceeds budget {IMPORT_TIME_BUDGET_SECONDS}s; slowest: {slowest[:5]}"
+    )
+
+
+def test_excel_parser_loaded_on_first_use():
+    """api.services.ExcelParser는 첫 접근 시 로드 (기존 import 경로 유지)"""
+    from api.services import ExcelParser
+    from api.services.excel_parser import ExcelParser as ExcelParserClass
+
+    assert ExcelParser is ExcelParserClass
@@ -0,0 +1,187 @@
+"""
+Tests for the PerformanceDataImporter service.
+
+Covers CSV/Excel imports, month replacement and multi-sheet workbooks.
+"""
+
+import io
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from api.models import DatasetVersion, PerformanceData, UploadLog
+from api.services.ingestion import PerformanceDataImporter
+from api.services.sheet_reader import _reset_executor
+
+
+def make_workbook(sheets: dict[str, pd.DataFrame]) -> bytes:
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def institutional_workbook():
+    """Workbook bundling KPI, publication and research project sheets."""
+    return make_workbook(
+        {
+            "학과KPI": pd.DataFrame(
+                {"평가년도": ["2024-05", "2024-05"], "학과": ["컴퓨터공학과", "전자공학과"], "국제학술대회 개최 횟수": [2, 1]}
+            ),
+            "논문": pd.DataFrame({"게재일": ["2024-05-10"], "학과": ["컴퓨터공학과"], "논문제목": ["딥러닝 연구"]}),
+            "연구과제": pd.DataFrame(
+                {"집행일자": ["2024-06-01"], "소속학과": ["전자공학과"], "총연구비": [500000000], "집행금액": [1200000]}
+            ),
+            "표지": pd.DataFrame({"설명": ["2024년 실적 보고서"]}),
+        }
+    )
+
+
+@pytest.mark.django_db
+class TestPerformanceDataImporter:
+    """Test cases for PerformanceDataImporter.import_file()."""
+
+    def test_csv_import_replaces_month(self):
+        PerformanceData.objects.create(reference_date="2024-05", department="기존부서")
+        content = "기준년월,부서명,매출액\n2024-05,컴퓨터공학과,1000\n".encode("utf-8")
+
+        result = PerformanceDataImporter().import_file(content, filename="data.csv")
+
+        assert result.created_count == 1
+        assert list(PerformanceData.objects.active().values_list("department", flat=True)) == ["컴퓨터공학과"]
+        assert UploadLog.objects.get().row_count == 1
+
+    def test_profile_recorded_on_upload_log(self):
+        csv = "기준년월,부서,매출액\n2024-05,A,100\n2024-05,B,200\n".encode("utf-8")
+
+        PerformanceDataImporter().import_file(csv, filename="data.csv")
+
+        log = UploadLog.objects.get()
+        assert set(log.phase_timings) >= {
+            "file_read",
+            "encoding_detection",
+            "column_mapping",
+            "row_parsing",
+            "insert",
+            "activate",
+            "commit",
+            "total",
+        }
+        phases = sum(seconds for name, seconds in log.phase_timings.items() if name != "total")
+        assert phases == pytest.approx(log.phase_timings["total"], abs=0.01)
+        assert log.rows_per_second > 0
+        assert log.peak_memory_bytes > 0
+        assert log.profile_report == ""
+
+    def test_cprofile_report_behind_setting(self, settings):
+        settings.UPLOAD_PROFILING_ENABLED = True
+        csv = "기준년월,부서,매출액\n2024-05,A,100\n".encode("utf-8")
+
+        PerformanceDataImporter().import_file(csv, filename="data.csv")
+
+        assert "cumulative" in UploadLog.objects.get().profile_report
+
+    def test_no_valid_rows_raises(self):
+        content = "기준년월,부서명\n,컴퓨터공학과\n".encode("utf-8")
+
+        with pytest.raises(ValueError):
+            PerformanceDataImporter().import_file(content, filename="data.csv")
+
+        assert not UploadLog.objects.exists()
+
+    def test_multi_sheet_workbook_imports_every_sheet(self, institutional_workbook):
+        result = PerformanceDataImporter().import_file(institutional_workbook, filename="report.xlsx")
+
+        assert result.created_count == 4
+        assert result.sheets == ["학과KPI", "논문", "연구과제"]
+        assert any("표지" in warning for warning in result.warnings)
+        assert set(PerformanceData.objects.active().values_list("reference_date", flat=True)) == {"2024-05", "2024-06"}
+        assert PerformanceData.objects.active().get(reference_date="2024-06").budget == 500000000
+
+    def test_multi_sheet_workbook_without_dates_fails(self):
+        content = make_workbook({"A": pd.DataFrame({"이름": ["x"]}), "B": pd.DataFrame({"메모": ["y"]})})
+
+        with pytest.raises(ValueError):
+            PerformanceDataImporter().import_file(content, filename="report.xlsx")
+
+    def test_failed_write_rolls_back_month(self, monkeypatch):
+        PerformanceData.objects.create(reference_date="2024-05", department="기존부서")
+
+        def failing_bulk_create(*args, **kwargs):
+            raise RuntimeError("insert failed")
+
+        monkeypatch.setattr(PerformanceData.objects, "bulk_create", failing_bulk_create)
+        with pytest.raises(RuntimeError):
+            PerformanceDataImporter().import_file("기준년월,부서명\n2024-05,A\n".encode("utf-8"), filename="data.csv")
+
+        assert list(PerformanceData.objects.active().values_list("department", flat=True)) == ["기존부서"]
+        assert not DatasetVersion.objects.exists()
+
+    def test_profile_recorded_for_failed_import(self, monkeypatch, settings):
+        settings.UPLOAD_PROFILING_ENABLED = True
+        monkeypatch.setattr(PerformanceData.objects, "bulk_create", mock.Mock(side_effect=RuntimeError("insert failed")))
+        importer = PerformanceDataImporter()
+
+        with pytest.raises(RuntimeError) as exc_info:
+            importer.import_file("기준년월,부서명\n2024-05,A\n".encode("utf-8"), filename="data.csv")
+        importer.record_failure("data.csv", exc_info.value)
+
+        log = UploadLog.objects.get()
+        assert log.status == "failed"
+        assert {"file_read", "row_parsing", "insert", "total"} <= set(log.phase_timings)
+        assert log.peak_memory_bytes > 0
+        assert "cumulative" in log.profile_report
+
+
+@pytest.mark.django_db
+class TestUploadLogProfileReport:
+    """The cProfile report is only served on the staff detail view, never in lists."""
+
+    @pytest.fixture
+    def profiled_log(self, upload_log):
+        upload_log.profile_report = "cumulative ..."
+        upload_log.save()
+        return upload_log
+
+    def test_not_in_list(self, admin_client, profiled_log):
+        for url in ("/api/logs/", "/api/async/logs/"):
+            item = admin_client.get(url).json()["results"][0]
+            assert "profile_report" not in item
+            assert "phase_timings" in item
+
+    def test_staff_detail(self, admin_client, profiled_log):
+        assert admin_client.get(f"/api/logs/{profiled_log.pk}/").json()["profile_report"] == "cumulative ..."
+
+    def test_hidden_from_regular_users(self, authenticated_client, profiled_log):
+        assert "profile_report" not in authenticated_client.get(f"/api/logs/{profiled_log.pk}/").json()
+
+
+@pytest.mark.django_db
+def test_sheets_read_in_process_pool(settings, institutional_workbook):
+    """Large multi-sheet workbooks are read by pool workers with the same result."""
+    settings.UPLOAD_PARALLEL_SHEETS_MIN_BYTES = 0
+    try:
+        result = PerformanceDataImporter().import_file(institutional_workbook, filename="report.xlsx")
+    finally:
+        _reset_executor()
+
+    assert result.created_count == 4
+    assert result.sheets == ["학과KPI", "논문", "연구과제"]
+
+
+@pytest.mark.django_db
+def test_workbook_streamed_from_path(settings, tmp_path, institutional_workbook):
+    """Assembled chunked uploads are read from disk; pool workers receive the path, not the bytes."""
+    settings.UPLOAD_PARALLEL_SHEETS_MIN_BYTES = 0
+    path = tmp_path / "upload.part"
+    path.write_bytes(institutional_workbook)
+    try:
+        result = PerformanceDataImporter().import_file(path, filename="report.xlsx")
+    finally:
+        _reset_executor()
+
+    assert result.created_count == 4
+    assert result.sheets == ["학과KPI", "논문", "연구과제"]
@@ -0,0 +1,70 @@
+"""
+Tests for the Prometheus metrics endpoint.
+"""
+
+import io
+
+import pandas as pd
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from api.metrics import get_registry
+
+
+def sample_value(name, labels=None):
+    return get_registry().get_sample_value(name, labels or {}) or 0
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    """Test cases for /api/metrics."""
+
+    def test_exposition_format(self, settings, client):
+        settings.DEBUG = True
+        response = client.get("/api/metrics")
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+        assert b"# TYPE ingestion_phase_duration_seconds histogram" in response.content
+
+    def test_token_required_when_configured(self, settings, client):
+        settings.METRICS_AUTH_TOKEN = "secret"
+
+        assert client.get("/api/metrics").status_code == 401
+        response = client.get("/api/metrics", HTTP_AUTHORIZATION="Bearer secret")
+        assert response.status_code == 200
+
+    def test_denied_in_production_without_token(self, settings, client):
+        settings.DEBUG = False
+        settings.METRICS_AUTH_TOKEN = ""
+
+        assert client.get("/api/metrics").status_code == 403
+
+    def test_summary_latency_observed(self, authenticated_client):
+        before = sample_value("dashboard_summary_duration_seconds_count")
+
+        authenticated_client.get("/api/summary/")
+
+        assert sample_value("dashboard_summary_duration_seconds_count") == before + 1
+
+    def test_upload_phases_observed(self, authenticated_client):
+        buffer = io.BytesIO()
+        pd.DataFrame({"기준년월": ["2024-05", "2024-05"], "부서": ["A", "B"], "매출액": [1, 2]}).to_excel(buffer, index=False)
+        upload = SimpleUploadedFile("data.xlsx", buffer.getvalue())
+        phases = ["read", "map", "parse", "write"]
+        before = {phase: sample_value("ingestion_phase_duration_seconds_count", {"phase": phase}) for phase in phases}
+        rows_before = sample_value("upload_rows_total")
+
+        response = authenticated_client.post("/api/upload/", {"file": upload}, format="multipart")
+
+        assert response.status_code == 201
+        for phase in phases:
+            assert sample_value("ingestion_phase_duration_seconds_count", {"phase": phase}) == before[phase] + 1
+        assert sample_value("upload_rows_total") == rows_before + 2
+
+    def test_multiprocess_registry(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+        registry = get_registry()
+
+        assert registry is not get_registry()
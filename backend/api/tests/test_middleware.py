@@ -0,0 +1,93 @@
+"""
+Tests for API middleware.
+"""
+
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from rest_framework.authtoken.models import Token
+
+from api.middleware import AsyncCapableWhiteNoiseMiddleware, PerformanceMonitoringMiddleware
+from api.middleware import logger as perf_logger
+from conftest import PerformanceDataFactory
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(level=logging.INFO)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def perf_records():
+    """Capture api.performance records (the logger does not propagate to root)."""
+    handler = ListHandler()
+    perf_logger.addHandler(handler)
+    yield handler.records
+    perf_logger.removeHandler(handler)
+
+
+@pytest.mark.django_db
+class TestPerformanceMonitoringMiddleware:
+    """Test cases for PerformanceMonitoringMiddleware."""
+
+    def test_sampled_request_has_server_timing(self, settings, authenticated_client):
+        settings.PERF_MONITORING_SAMPLE_RATE = 1.0
+        PerformanceDataFactory.create_batch(3)
+
+        response = authenticated_client.get("/api/summary/")
+
+        timing = response["Server-Timing"]
+        assert "total;dur=" in timing
+        assert "db;dur=" in timing and "queries" in timing
+        assert "serialize;dur=" in timing
+
+    def test_unsampled_request_has_no_server_timing(self, settings, authenticated_client):
+        settings.PERF_MONITORING_SAMPLE_RATE = 0.0
+
+        response = authenticated_client.get("/api/summary/")
+
+        assert "Server-Timing" not in response
+
+    def test_structured_log_line(self, settings, authenticated_client, perf_records):
+        settings.PERF_MONITORING_SAMPLE_RATE = 1.0
+
+        authenticated_client.get("/api/summary/")
+
+        record = perf_records[-1]
+        assert record.perf["path"] == "/api/summary/"
+        assert record.perf["status"] == 200
+        assert record.perf["db_queries"] > 0
+        assert record.perf["bytes"] > 0
+
+    def test_slow_unsampled_request_is_logged(self, settings, authenticated_client, perf_records):
+        settings.PERF_MONITORING_SAMPLE_RATE = 0.0
+        settings.PERF_SLOW_REQUEST_MS = 0
+
+        authenticated_client.get("/api/summary/")
+
+        record = perf_records[-1]
+        assert record.levelno == logging.WARNING
+        assert record.perf["sampled"] is False
+
+    def test_async_request(self, settings, user, perf_records):
+        """ASGI 요청도 미들웨어 체인을 스레드 전환 없이 통과하며 계측"""
+        settings.PERF_MONITORING_SAMPLE_RATE = 1.0
+        token = Token.objects.create(user=user)
+
+        response = async_to_sync(AsyncClient().get)(
+            "/api/async/summary/", headers={"Authorization": f"Token {token.key}"}
+        )
+
+        assert response.status_code == 200
+        assert "db;dur=" in response["Server-Timing"]
+        assert perf_records[-1].perf["db_queries"] > 0
+
+    def test_middleware_is_async_capable(self):
+        assert PerformanceMonitoringMiddleware.async_capable
+        assert AsyncCapableWhiteNoiseMiddleware.async_capable
@@ -0,0 +1,70 @@
+"""
+Tests for optional PerformanceData partitioning (api/services/partitions.py).
+
+The test database is SQLite, so the PostgreSQL DDL paths are not exercised
+here; these tests cover partition naming/bounds and the unpartitioned fallback.
+"""
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from api.services import partitions
+
+TABLE = "api_performancedata"
+
+
+class TestPartitionLayout:
+    @pytest.mark.parametrize(
+        "month, scheme, key",
+        [
+            ("2024-05", "year", "2024"),
+            ("2024-05", "month", "2024-05"),
+            ("2024-5", "month", None),
+            ("", "year", None),
+        ],
+    )
+    def test_partition_key(self, month, scheme, key):
+        assert partitions.partition_key(month, scheme) == key
+
+    @pytest.mark.parametrize(
+        "key, scheme, bounds",
+        [
+            ("2024", "year", ("2024", "2025")),
+            ("2024-05", "month", ("2024-05", "2024-06")),
+            ("2024-12", "month", ("2024-12", "2025-01")),
+        ],
+    )
+    def test_partition_bounds(self, key, scheme, bounds):
+        assert partitions.partition_bounds(key, scheme) == bounds
+
+    def test_year_range_covers_every_month_string(self):
+        low, high = partitions.partition_bounds("2024", "year")
+
+        assert all(low <= f"2024-{month:02d}" < high for month in range(1, 13))
+        assert not low <= "2025-01" < high
+
+    def test_partition_names(self):
+        assert partitions.partition_name(TABLE, "2024") == "api_performancedata_p2024"
+        assert partitions.partition_name(TABLE, "2024-05") == "api_performancedata_p2024_05"
+        assert partitions.default_partition_name(TABLE) == "api_performancedata_default"
+
+
+@pytest.mark.django_db
+class TestUnpartitionedFallback:
+    """SQLite(파티션 없음)에서는 아무것도 하지 않음"""
+
+    def test_not_partitioned(self):
+        assert partitions.current_scheme() == ""
+        assert partitions.ensure_partitions(["2024-05"]) == []
+
+    def test_partition_table_needs_postgres(self):
+        with pytest.raises(ValueError, match="PostgreSQL"):
+            partitions.partition_table("year")
+
+    def test_unknown_scheme(self):
+        with pytest.raises(ValueError, match="quarter"):
+            partitions.partition_table("quarter")
+
+    def test_command_needs_postgres(self):
+        with pytest.raises(CommandError):
+            call_command("partition_performance_data", "--by", "year")
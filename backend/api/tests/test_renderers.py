@@ -0,0 +1,105 @@
+"""
+Tests for the orjson and MessagePack renderers (api/renderers.py).
+"""
+
+import datetime
+import decimal
+import json
+import uuid
+
+import numpy as np
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from api import renderers
+from api.renderers import MSGPACK_MEDIA_TYPE, MessagePackRenderer, ORJSONRenderer
+from api.services.aggregates import refresh_aggregates
+from conftest import PerformanceDataFactory
+
+msgpack = pytest.importorskip("msgpack")
+
+PAYLOAD = {
+    "decimal": decimal.Decimal("12345678901.25"),
+    "aware": timezone.now(),
+    "naive": datetime.datetime(2024, 1, 2, 3, 4, 5, 678901),
+    "date": datetime.date(2024, 1, 2),
+    "time": datetime.time(1, 2, 3, 456789),
+    "lazy": gettext_lazy("Invalid token."),
+    "numpy": np.int64(5),
+    "array": np.arange(3),
+    "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "korean": "경영학과\u2028",
+    1: "int key",
+    "nested": {"values": [1, 2.5, None, True]},
+    "duration": datetime.timedelta(seconds=3.5),
+}
+
+
+class TestORJSONRenderer:
+    """DRF JSONRenderer와 같은 바이트를 출력하는지 확인"""
+
+    def test_matches_drf_output(self):
+        assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    def test_none(self):
+        assert ORJSONRenderer().render(None) == b""
+
+    def test_indent_uses_drf_encoder(self):
+        rendered = ORJSONRenderer().render({"a": 1}, "application/json; indent=4", {})
+        assert rendered == b'{\n    "a": 1\n}'
+
+    def test_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(renderers, "orjson", None)
+        assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+
+class TestMessagePackRenderer:
+    def test_same_values_as_json(self):
+        payload = {key: value for key, value in PAYLOAD.items() if key != 1}
+
+        unpacked = msgpack.unpackb(MessagePackRenderer().render(payload))
+
+        assert unpacked == json.loads(JSONRenderer().render(payload))
+
+
+@pytest.mark.django_db
+class TestContentNegotiation:
+    """Accept 헤더 / ?format= 로 응답 형식 선택"""
+
+    @pytest.fixture(autouse=True)
+    def data(self):
+        PerformanceDataFactory(reference_date="2024-01", department="경영학과")
+        refresh_aggregates(["2024-01"])
+
+    def test_json_by_default(self, authenticated_client):
+        response = authenticated_client.get("/api/summary/")
+
+        assert response["Content-Type"] == "application/json"
+        assert response.json()["reference_dates"] == ["2024-01"]
+
+    @pytest.mark.parametrize(
+        "path", ["/api/summary/", "/api/data/", "/api/periods/", "/api/async/summary/", "/api/async/data/"]
+    )
+    def test_msgpack_accept_header(self, authenticated_client, path):
+        as_json = authenticated_client.get(path).json()
+
+        response = authenticated_client.get(path, HTTP_ACCEPT=MSGPACK_MEDIA_TYPE)
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == MSGPACK_MEDIA_TYPE
+        assert msgpack.unpackb(response.content) == as_json
+
+    def test_msgpack_format_param(self, authenticated_client):
+        response = authenticated_client.get("/api/summary/", {"format": "msgpack"})
+
+        assert response["Content-Type"] == MSGPACK_MEDIA_TYPE
+        assert msgpack.unpackb(response.content)["reference_dates"] == ["2024-01"]
+
+    @pytest.mark.parametrize("path", ["/api/summary/", "/api/async/summary/"])
+    def test_errors_are_negotiated(self, client, path):
+        response = client.get(path, HTTP_ACCEPT=MSGPACK_MEDIA_TYPE)
+
+        assert response.status_code == 403
+        assert "detail" in msgpack.unpackb(response.content)
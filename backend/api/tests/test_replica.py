@@ -0,0 +1,156 @@
+"""
+Tests for read-replica routing (api.db.routers).
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+import time
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+
+from api.db.routers import (
+    STICKY_COOKIE,
+    ReadReplicaRouter,
+    is_pinned,
+    prefer_replica,
+    routing_request,
+    set_sticky_cookie,
+)
+from api.models import PerformanceData
+from conftest import BACKEND_DIR, subprocess_env
+
+
+class TestReadReplicaRouter:
+    """Test cases for ReadReplicaRouter."""
+
+    router = ReadReplicaRouter()
+
+    def test_reads_default_outside_requests(self):
+        with prefer_replica():
+            assert self.router.db_for_read(PerformanceData) is None
+
+    def test_opted_in_reads_use_replica(self):
+        with mock.patch("api.db.routers.replica_configured", return_value=True), routing_request():
+            assert self.router.db_for_read(PerformanceData) is None
+            with prefer_replica():
+                assert self.router.db_for_read(PerformanceData) == "replica"
+                # 인증/세션 모델은 항상 기본 DB
+                assert self.router.db_for_read(User) is None
+            assert self.router.db_for_read(PerformanceData) is None
+
+    def test_pinned_request_reads_primary(self):
+        with routing_request(pinned=True), prefer_replica():
+            assert self.router.db_for_read(PerformanceData) is None
+
+    def test_write_is_flagged(self):
+        with routing_request() as state:
+            assert self.router.db_for_write(PerformanceData) == "default"
+        assert state.wrote
+
+    def test_migrations_only_on_primary(self):
+        assert self.router.allow_migrate("default", "api")
+        assert not self.router.allow_migrate("replica", "api")
+
+    def test_sticky_cookie(self, settings):
+        settings.REPLICA_STICKY_SECONDS = 30
+        response = HttpResponse()
+
+        set_sticky_cookie(response)
+
+        cookie = response.cookies[STICKY_COOKIE]
+        assert cookie["max-age"] == 30
+        assert is_pinned({STICKY_COOKIE: cookie.value})
+        assert not is_pinned({STICKY_COOKIE: str(time.time() - 1)})
+        assert not is_pinned({STICKY_COOKIE: "garbage"})
+        assert not is_pinned({})
+
+
+@pytest.mark.django_db
+class TestReplicaRoutingMiddleware:
+    """Test cases for ReplicaRoutingMiddleware."""
+
+    @pytest.fixture(autouse=True)
+    def replica_configured(self, settings):
+        settings.DATABASE_ROUTERS = ["api.db.routers.ReadReplicaRouter"]
+        with mock.patch("api.middleware.replica_configured", return_value=True):
+            yield
+
+    def test_write_sets_sticky_cookie(self, authenticated_client):
+        response = authenticated_client.post(
+            "/api/data/", {"reference_date": "2024-06", "department": "물리학과"}, content_type="application/json"
+        )
+
+        assert response.status_code == 201
+        assert STICKY_COOKIE in response.cookies
+
+    def test_read_does_not_set_cookie(self, authenticated_client):
+        response = authenticated_client.get("/api/summary/")
+
+        assert STICKY_COOKIE not in response.cookies
+
+
+REPLICA_SCRIPT = textwrap.dedent(
+    """
+    import json, os, shutil
+    import django
+    django.setup()
+    from django.core.management import call_command
+    from django.test import Client
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    call_command("migrate", verbosity=0)
+    # "복제": 마이그레이션된 기본 DB 파일을 복제본으로 복사
+    shutil.copy(os.environ["PRIMARY_PATH"], os.environ["REPLICA_PATH"])
+
+    from api.services.aggregates import refresh_aggregates
+    from conftest import PerformanceDataFactory
+    PerformanceDataFactory(reference_date="2024-05", department="컴퓨터공학과")
+    refresh_aggregates()  # 기본 DB에만 존재 (복제 지연 상황)
+
+    uploader, other = Client(), Client()
+    result = {
+        "before": uploader.get("/api/data/").json()["count"],
+        "summary_months": uploader.get("/api/summary/").json()["reference_dates"],
+        "write": uploader.post(
+            "/api/data/", {"reference_date": "2024-06", "department": "물리학과"}, content_type="application/json"
+        ).status_code,
+        "after_own_write": uploader.get("/api/data/").json()["count"],
+        "other_client": other.get("/api/data/").json()["count"],
+        "async_after_own_write": uploader.get("/api/async/data/").json()["count"],
+    }
+    print(json.dumps(result))
+    """
+)
+
+
+def test_two_sqlite_files(tmp_path):
+    """기본/복제본 SQLite 파일 두 개로 라우팅과 read-your-writes 확인"""
+    primary, replica = tmp_path / "primary.sqlite3", tmp_path / "replica.sqlite3"
+    env = subprocess_env(
+        DATABASE_URL=f"sqlite:///{primary}",
+        DATABASE_REPLICA_URL=f"sqlite:///{replica}",
+        PRIMARY_PATH=str(primary),
+        REPLICA_PATH=str(replica),
+        DEBUG="True",
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", REPLICA_SCRIPT], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    assert result == {
+        "before": 0,  # 조회는 복제본 (아직 복제되지 않은 행은 안 보임)
+        "summary_months": [],
+        "write": 201,  # 쓰기는 기본 DB
+        "after_own_write": 2,  # 자신의 쓰기 직후에는 기본 DB에서 조회
+        "other_client": 0,  # 다른 사용자는 계속 복제본
+        "async_after_own_write": 2,
+    }
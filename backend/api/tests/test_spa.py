@@ -0,0 +1,87 @@
+"""
+Tests for the cached React SPA index (config/spa.py).
+"""
+
+import gzip
+import os
+
+import pytest
+
+from config import spa
+from conftest import INDEX_HTML
+
+
+@pytest.mark.django_db
+class TestServeReact:
+    """Test cases for serve_react with the in-memory index."""
+
+    def test_identity(self, client, index_file):
+        response = client.get("/dashboard/upload")
+
+        assert response.status_code == 200
+        assert response.content.decode() == INDEX_HTML
+        assert response["Cache-Control"] == "no-cache"
+        assert "Accept-Encoding" in response["Vary"]
+        assert "Content-Encoding" not in response
+
+    def test_gzip_variant(self, client, index_file):
+        response = client.get("/", HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        assert response["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.content).decode() == INDEX_HTML
+        assert response["ETag"].endswith('-gzip"')
+
+    def test_not_modified(self, client, index_file):
+        etag = client.get("/", HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+
+        response = client.get("/students", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_served_from_memory(self, client, index_file, monkeypatch):
+        client.get("/")
+        monkeypatch.setattr(spa.IndexEntry, "load", classmethod(lambda cls, *args: pytest.fail("re-read from disk")))
+
+        assert client.get("/other").status_code == 200
+
+    def test_revalidated_by_mtime(self, client, index_file):
+        first = client.get("/")
+        index_file.write_text(INDEX_HTML.replace("app.js", "app.v2.js"), encoding="utf-8")
+        stat = index_file.stat()
+        os.utime(index_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = client.get("/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert second.status_code == 200
+        assert "app.v2.js" in second.content.decode()
+        assert second["ETag"] != first["ETag"]
+
+    def test_check_interval_skips_stat(self, client, index_file, settings):
+        settings.SPA_INDEX_CHECK_INTERVAL = 3600
+        client.get("/")
+        index_file.unlink()
+
+        assert client.get("/").status_code == 200
+
+    def test_missing_build(self, client, tmp_path, settings):
+        settings.STATICFILES_DIRS = [tmp_path]
+
+        response = client.get("/")
+
+        assert "npm run build" in response.content.decode()
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("", ""),
+        ("gzip", "gzip"),
+        ("br, gzip", "br"),
+        ("gzip;q=0", ""),
+        ("*", "br"),
+        ("identity", ""),
+    ],
+)
+def test_accepted_encoding(header, expected):
+    assert spa.accepted_encoding(header, {"": b"", "gzip": b"", "br": b""}) == expected
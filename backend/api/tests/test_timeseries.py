@@ -0,0 +1,126 @@
+"""
+Tests for the prefix-sum time series store behind /api/summary/.
+"""
+
+from decimal import Decimal
+
+import pytest
+from django.db.models import Avg, Count, Sum
+
+from api.models import PerformanceData
+from api.services.aggregates import refresh_aggregates
+from api.services.timeseries import get_prefix_store
+from conftest import PerformanceDataFactory
+
+MONTHS = ["2023-11", "2023-12", "2024-01", "2024-02", "2024-03"]
+
+
+def raw_summary(queryset):
+    """The former summary: aggregate raw rows on every request."""
+    summary = queryset.aggregate(
+        total_revenue=Sum("revenue"),
+        total_budget=Sum("budget"),
+        total_expenditure=Sum("expenditure"),
+        total_papers=Sum("paper_count"),
+        total_patents=Sum("patent_count"),
+        total_projects=Sum("project_count"),
+        department_count=Count("department", distinct=True),
+        avg_revenue=Avg("revenue"),
+    )
+    trend = (
+        queryset.values("reference_date")
+        .annotate(
+            revenue=Sum("revenue"),
+            budget=Sum("budget"),
+            expenditure=Sum("expenditure"),
+            papers=Sum("paper_count"),
+            patents=Sum("patent_count"),
+            projects=Sum("project_count"),
+        )
+        .order_by("reference_date")
+    )
+    return summary, list(trend)
+
+
+@pytest.fixture
+def history(db):
+    for month in MONTHS:
+        for index in range(6):
+            PerformanceDataFactory(reference_date=month, department=f"부서{index}")
+    # A department that only reports in one month
+    PerformanceDataFactory(reference_date="2024-02", department="신설학과")
+    refresh_aggregates()
+
+
+@pytest.mark.django_db
+class TestPrefixSumStore:
+    """Store results match the raw-row aggregation."""
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {},
+            {"reference_date": "2024-02"},
+            {"reference_date": "2025-01"},
+            {"start_date": "2023-12", "end_date": "2024-02"},
+            {"start_date": "2024-02"},
+            {"end_date": "2023-12"},
+            {"start_date": "2024-01", "departments": ["부서1", "신설학과", "없는학과"]},
+            {"departments": ["없는학과"]},
+        ],
+    )
+    def test_matches_raw_aggregation(self, history, filters):
+        queryset = PerformanceData.objects.all()
+        if filters.get("reference_date"):
+            queryset = queryset.filter(reference_date=filters["reference_date"])
+        if filters.get("start_date"):
+            queryset = queryset.filter(reference_date__gte=filters["start_date"])
+        if filters.get("end_date"):
+            queryset = queryset.filter(reference_date__lte=filters["end_date"])
+        if filters.get("departments"):
+            queryset = queryset.filter(department__in=filters["departments"])
+        expected_summary, expected_trend = raw_summary(queryset)
+
+        store = get_prefix_store()
+        lo, hi = store.month_bounds(filters.get("reference_date"), filters.get("start_date"), filters.get("end_date"))
+        rows = store.department_rows(filters.get("departments"))
+        summary = store.summary(lo, hi, rows)
+
+        assert store.monthly_trend(lo, hi, rows) == expected_trend
+        avg_revenue = summary.pop("avg_revenue")
+        expected_avg = expected_summary.pop("avg_revenue")
+        assert summary == expected_summary
+        if expected_avg is None:
+            assert avg_revenue is None
+        else:
+            assert avg_revenue == pytest.approx(Decimal(expected_avg), rel=Decimal("1e-9"))
+
+    def test_rebuilt_after_upload(self, history):
+        before = get_prefix_store()
+
+        PerformanceData.objects.filter(reference_date="2024-03").delete()
+        refresh_aggregates(["2024-03"])
+
+        store = get_prefix_store()
+        assert store is not before
+        assert "2024-03" not in store.months
+
+    def test_reused_while_data_unchanged(self, history):
+        assert get_prefix_store() is get_prefix_store()
+
+    def test_summary_endpoint_payload(self, authenticated_client, history):
+        response = authenticated_client.get("/api/summary/", {"start_date": "2024-01", "departments": "부서1,부서2"})
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["summary"]["department_count"] == 2
+        assert [row["reference_date"] for row in data["monthly_trend"]] == ["2024-01", "2024-02", "2024-03"]
+        assert {row["department"] for row in data["department_ranking"]} == {"부서1", "부서2"}
+
+    def test_empty_database(self, authenticated_client):
+        data = authenticated_client.get("/api/summary/").json()
+
+        assert data["summary"]["total_revenue"] is None
+        assert data["summary"]["department_count"] == 0
+        assert data["monthly_trend"] == []
+        assert data["department_ranking"] == []
@@ -0,0 +1,215 @@
+"""
+Tests for dataset versions: upload activation, rollback and garbage collection (api/services/versions.py).
+"""
+
+import io
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+
+from api.models import DatasetVersion, DepartmentMonthlyStat, PerformanceData
+from api.services import versions
+from api.services.ingestion import PerformanceDataImporter
+from conftest import PerformanceDataFactory
+
+
+def upload(*rows: str) -> None:
+    csv = "기준년월,부서명,매출액\n" + "".join(f"{row}\n" for row in rows)
+    PerformanceDataImporter().import_file(csv.encode("utf-8"), filename="data.csv")
+
+
+def active_departments(month: str) -> list[str]:
+    return sorted(PerformanceData.objects.active().filter(reference_date=month).values_list("department", flat=True))
+
+
+def month_revenue(month: str) -> int:
+    return sum(DepartmentMonthlyStat.objects.filter(reference_date=month).values_list("revenue", flat=True))
+
+
+@pytest.mark.django_db
+class TestActivation:
+    def test_upload_flips_active_version(self):
+        upload("2024-05,A,100", "2024-05,B,200")
+        first = DatasetVersion.objects.get()
+
+        upload("2024-05,C,1000")
+
+        assert active_departments("2024-05") == ["C"]
+        assert month_revenue("2024-05") == 1000
+        first.refresh_from_db()
+        assert first.status == DatasetVersion.STATUS_SUPERSEDED
+        # 이전 버전 행은 롤백용으로 남아 있음 (조회에서만 제외)
+        assert PerformanceData.objects.filter(version=first).count() == 2
+
+    def test_months_are_versioned_independently(self):
+        upload("2024-05,A,100", "2024-06,B,200")
+
+        upload("2024-05,C,300")
+
+        assert active_departments("2024-05") == ["C"]
+        assert active_departments("2024-06") == ["B"]
+
+    def test_consecutive_activations_of_same_month(self):
+        earlier = versions.create_pending_versions({"2024-05": 1})["2024-05"]
+        later = versions.create_pending_versions({"2024-05": 1})["2024-05"]
+        PerformanceDataFactory(reference_date="2024-05", department="A", version=earlier)
+        PerformanceDataFactory(reference_date="2024-05", department="B", version=later)
+
+        with transaction.atomic():
+            versions.activate_versions([earlier])
+        with transaction.atomic():
+            versions.activate_versions([later])
+
+        earlier.refresh_from_db()
+        later.refresh_from_db()
+        assert (earlier.status, later.status) == (DatasetVersion.STATUS_SUPERSEDED, DatasetVersion.STATUS_ACTIVE)
+        assert active_departments("2024-05") == ["B"]
+
+    def test_version_records_upload(self):
+        upload("2024-05,A,100", "2024-05,B,200")
+
+        version = DatasetVersion.objects.get()
+        assert version.status == DatasetVersion.STATUS_ACTIVE
+        assert version.row_count == 2
+        assert version.activated_at is not None
+        assert version.upload_log.filename == "data.csv"
+
+    def test_unversioned_rows_hidden_by_upload(self):
+        PerformanceDataFactory(reference_date="2024-05", department="기존")
+        PerformanceDataFactory(reference_date="2024-06", department="다른 월")
+
+        upload("2024-05,A,100")
+
+        assert active_departments("2024-05") == ["A"]
+        assert active_departments("2024-06") == ["다른 월"]
+
+    def test_sample_data_replaces_uploaded_month(self):
+        upload("2023-01,업로드학과,100")
+
+        call_command("load_sample_data", stdout=io.StringIO())
+
+        # 샘플 데이터도 업로드처럼 새 활성 버전으로 적재 (기존 활성 버전에 가려지지 않음)
+        assert "컴퓨터공학과" in active_departments("2023-01")
+        assert "업로드학과" not in active_departments("2023-01")
+        assert not PerformanceData.objects.filter(version=None).exists()
+
+    def test_api_create_joins_active_version(self, authenticated_client):
+        upload("2024-05,A,100")
+
+        response = authenticated_client.post(
+            "/api/data/", {"reference_date": "2024-05", "department": "B"}, content_type="application/json"
+        )
+
+        assert response.status_code == 201
+        assert active_departments("2024-05") == ["A", "B"]
+        assert PerformanceData.objects.get(department="B").version == DatasetVersion.objects.get()
+
+
+@pytest.mark.django_db
+class TestRollback:
+    def test_rollback_reactivates_previous_version(self, authenticated_client):
+        upload("2024-05,A,100")
+        upload("2024-05,B,500")
+
+        response = authenticated_client.post("/api/periods/2024-05/rollback/")
+
+        assert response.status_code == 200
+        assert response.json()["active_version"]["status"] == DatasetVersion.STATUS_ACTIVE
+        assert active_departments("2024-05") == ["A"]
+        assert month_revenue("2024-05") == 100
+        assert DatasetVersion.objects.filter(status=DatasetVersion.STATUS_ROLLED_BACK).count() == 1
+
+    def test_rollback_to_unversioned_rows(self):
+        PerformanceDataFactory(reference_date="2024-05", department="기존")
+        upload("2024-05,A,100")
+
+        assert versions.rollback_month("2024-05") is None
+
+        assert active_departments("2024-05") == ["기존"]
+
+    def test_rollback_without_active_version(self, authenticated_client):
+        response = authenticated_client.post("/api/periods/2024-05/rollback/")
+
+        assert response.status_code == 400
+        assert "error" in response.json()
+
+    def test_versions_listed(self, authenticated_client):
+        upload("2024-05,A,100")
+        upload("2024-05,B,200")
+
+        response = authenticated_client.get("/api/periods/2024-05/versions/")
+
+        assert [v["status"] for v in response.json()] == ["active", "superseded"]
+
+
+@pytest.mark.django_db
+class TestGarbageCollection:
+    def test_keeps_retention_chain(self):
+        PerformanceDataFactory(reference_date="2024-05", department="기존")
+        upload("2024-05,A,100")
+        upload("2024-05,B,200")
+        upload("2024-05,C,300")
+
+        deleted = versions.collect_garbage(retention=1)
+
+        # 활성(C) + 직전 버전(B)만 남음
+        assert deleted == 2
+        assert sorted(PerformanceData.objects.values_list("department", flat=True)) == ["B", "C"]
+        assert DatasetVersion.objects.count() == 2
+        assert active_departments("2024-05") == ["C"]
+
+    def test_retention_zero_keeps_only_active(self):
+        PerformanceDataFactory(reference_date="2024-05", department="기존")
+        upload("2024-05,A,100")
+
+        versions.collect_garbage(retention=0)
+
+        assert list(PerformanceData.objects.values_list("department", flat=True)) == ["A"]
+
+    def test_rolled_back_version_collected(self):
+        upload("2024-05,A,100")
+        upload("2024-05,B,200")
+        versions.rollback_month("2024-05")
+
+        versions.collect_garbage()
+
+        assert list(PerformanceData.objects.values_list("department", flat=True)) == ["A"]
+
+    def test_abandoned_pending_versions(self):
+        fresh, stale = versions.create_pending_versions({"2024-05": 1, "2024-06": 1}).values()
+        PerformanceDataFactory(reference_date="2024-05", version=fresh)
+        PerformanceDataFactory(reference_date="2024-06", version=stale)
+        DatasetVersion.objects.filter(pk=stale.pk).update(created_at=timezone.now() - timedelta(days=2))
+
+        versions.collect_garbage(pending_ttl=86400)
+
+        assert list(DatasetVersion.objects.values_list("pk", flat=True)) == [fresh.pk]
+        assert not PerformanceData.objects.active().exists()
+
+    def test_only_given_months(self):
+        upload("2024-05,A,100", "2024-06,B,100")
+        upload("2024-05,C,100", "2024-06,D,100")
+
+        versions.collect_garbage(["2024-05"], retention=0)
+
+        assert sorted(PerformanceData.objects.values_list("department", flat=True)) == ["B", "C", "D"]
+
+    def test_scheduled_after_upload_commit(self, settings, monkeypatch, django_capture_on_commit_callbacks):
+        settings.DATASET_VERSION_GC_ON_UPLOAD = True
+        scheduled = []
+        monkeypatch.setattr(versions, "_collect_in_background", scheduled.append)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            upload("2024-05,A,100", "2024-06,B,100")
+        versions._get_executor().submit(lambda: None).result()
+
+        assert scheduled == [["2024-05", "2024-06"]]
+
+    def test_background_collection_off_by_default(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks() as callbacks:
+            versions.schedule_garbage_collection(["2024-05"])
+
+        assert callbacks == []
@@ -0,0 +1,138 @@
+"""
+Tests for the pre-fork warmup (config/warmup.py) and its gunicorn hooks.
+"""
+
+import gc
+import os
+import runpy
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from api.services import timeseries
+from api.services.data_version import get_data_version
+from config import spa, warmup
+
+from conftest import BACKEND_DIR
+
+GUNICORN_CONF = str(BACKEND_DIR / "gunicorn.conf.py")
+
+
+@pytest.mark.django_db
+class TestWarmup:
+    """Test cases for warmup()."""
+
+    def test_runs_every_step(self, index_file, monkeypatch):
+        monkeypatch.setattr(timeseries, "_store", None)
+
+        timings = warmup.warmup()
+
+        assert list(timings) == [name for name, _ in warmup.STEPS]
+        assert timeseries._store is not None
+        assert timeseries._store.version == get_data_version()
+        assert str(index_file) in spa._entries
+
+    def test_failing_step_is_skipped(self, monkeypatch, caplog):
+        def broken():
+            raise RuntimeError("no such table")
+
+        monkeypatch.setattr(warmup, "STEPS", [("broken", broken), ("compile_parser", warmup.compile_parser)])
+
+        timings = warmup.warmup()
+
+        assert list(timings) == ["compile_parser"]
+        assert "Warmup step broken failed" in caplog.text
+
+    def test_warmup_host(self, settings):
+        settings.ALLOWED_HOSTS = [".railway.app", "*", "dashboard.example.com"]
+        assert warmup.warmup_host() == "dashboard.example.com"
+
+        settings.ALLOWED_HOSTS = ["*"]
+        assert warmup.warmup_host() == "localhost"
+
+
+def fake_connection(alias="default", pooled=False, conn_max_age=0):
+    connection = mock.Mock(alias=alias)
+    connection.settings_dict = {"OPTIONS": {"pool": {"min_size": 1}} if pooled else {}, "CONN_MAX_AGE": conn_max_age}
+    connection._connection_pools = {alias: object()} if pooled else {}
+    return connection
+
+
+class TestConnections:
+    """fork 전 연결/풀 정리와 fork 후 재연결"""
+
+    def test_release_closes_connections_and_pools(self):
+        pooled, plain = fake_connection("default", pooled=True), fake_connection("replica")
+        with mock.patch.object(warmup, "connections") as connections:
+            connections.all.return_value = [pooled, plain]
+            warmup.release_connections()
+
+        pooled.close.assert_called_once_with()
+        pooled.close_pool.assert_called_once_with()
+        plain.close.assert_called_once_with()
+        plain.close_pool.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "pooled, conn_max_age, open_connections, expected",
+        [
+            (True, 0, False, "pool"),
+            (False, 60, True, "connect"),
+            (False, 60, False, None),
+            (False, 0, True, None),
+        ],
+    )
+    def test_connect_worker(self, pooled, conn_max_age, open_connections, expected):
+        connection = fake_connection(pooled=pooled, conn_max_age=conn_max_age)
+        type(connection).pool = pool = mock.PropertyMock()
+        with mock.patch.object(warmup, "connections", {"default": connection}):
+            warmup.connect_worker(open_connections=open_connections)
+
+        assert pool.called == (expected == "pool")
+        assert connection.ensure_connection.called == (expected == "connect")
+
+
+@pytest.fixture
+def metrics_dir(tmp_path, monkeypatch):
+    # gunicorn.conf.py가 환경변수를 설정하므로 테스트 후 복원되도록 미리 지정
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestGunicornConf:
+    """gunicorn.conf.py preload 설정과 훅"""
+
+    def test_preload_by_default(self, metrics_dir, monkeypatch):
+        monkeypatch.delenv("GUNICORN_PRELOAD", raising=False)
+        assert runpy.run_path(GUNICORN_CONF)["preload_app"] is True
+
+        monkeypatch.setenv("GUNICORN_PRELOAD", "False")
+        assert runpy.run_path(GUNICORN_CONF)["preload_app"] is False
+
+    def test_when_ready_warms_up_and_drops_master_metrics(self, metrics_dir):
+        conf = runpy.run_path(GUNICORN_CONF)
+        master_file = metrics_dir / f"counter_{os.getpid()}.db"
+        worker_file = metrics_dir / "counter_1.db"
+        master_file.touch()
+        worker_file.touch()
+
+        with mock.patch.object(warmup, "warmup") as run_warmup:
+            try:
+                conf["when_ready"](SimpleNamespace(cfg=SimpleNamespace(preload_app=True)))
+            finally:
+                gc.unfreeze()
+
+        run_warmup.assert_called_once_with()
+        assert not master_file.exists()
+        assert worker_file.exists()
+
+    def test_hooks_skip_without_preload(self, metrics_dir):
+        conf = runpy.run_path(GUNICORN_CONF)
+        server = SimpleNamespace(cfg=SimpleNamespace(preload_app=False, worker_class_str="sync"))
+
+        with mock.patch.object(warmup, "warmup") as run_warmup, mock.patch.object(warmup, "connect_worker") as connect:
+            conf["when_ready"](server)
+            conf["post_fork"](server, worker=None)
+
+        run_warmup.assert_not_called()
+        connect.assert_not_called()
@@ -1,10 +1,18 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+from . import async_views
 from .views import (
+    BatchView,
+    ChunkedUploadDetailView,
+    ChunkedUploadFinalizeView,
+    ChunkedUploadInitView,
     DashboardSummaryView,
     ExcelUploadView,
+    FacetsView,
+    MetricsView,
     PerformanceDataViewSet,
+    ReferencePeriodViewSet,
     StudentRosterViewSet,
     UploadLogViewSet,
 )
@@ -13,12 +21,33 @@ router = DefaultRouter()
 router.register(r"data", PerformanceDataViewSet, basename="performance-data")
 router.register(r"logs", UploadLogViewSet, basename="upload-logs")
 router.register(r"students", StudentRosterViewSet, basename="student-roster")
+router.register(r"periods", ReferencePeriodViewSet, basename="reference-periods")
 
 urlpatterns = [
     # 엑셀 업로드 엔드포인트
     path("upload/", ExcelUploadView.as_view(), name="excel-upload"),
+    # 분할(재개 가능) 업로드 엔드포인트
+    path("upload/chunked/", ChunkedUploadInitView.as_view(), name="chunked-upload-init"),
+    path("upload/chunked/<uuid:upload_id>/", ChunkedUploadDetailView.as_view(), name="chunked-upload-detail"),
+    path(
+        "upload/chunked/<uuid:upload_id>/finalize/",
+        ChunkedUploadFinalizeView.as_view(),
+        name="chunked-upload-finalize",
+    ),
     # 대시보드 요약 데이터
     path("summary/", DashboardSummaryView.as_view(), name="dashboard-summary"),
+    # 배치 조회 (여러 패널을 한 번의 요청으로)
+    path("batch/", BatchView.as_view(), name="batch"),
+    # 필터 facet (선택지와 건수)
+    path("facets/", FacetsView.as_view(), name="facets"),
+    # Prometheus 메트릭 (스크레이퍼 기본 경로와 맞춰 슬래시 없음)
+    path("metrics", MetricsView.as_view(), name="metrics"),
+    # 비동기(ASGI) 읽기 전용 엔드포인트 (uvicorn 워커 배포 시 사용, docs/deployment.md)
+    path("async/summary/", async_views.dashboard_summary, name="async-dashboard-summary"),
+    path("async/data/", async_views.performance_data_list, name="async-performance-data-list"),
+    path("async/students/", async_views.student_roster_list, name="async-student-roster-list"),
+    path("async/logs/", async_views.upload_log_list, name="async-upload-logs-list"),
+    path("async/periods/", async_views.reference_period_list, name="async-reference-periods-list"),
     # ViewSet 라우터
     path("", include(router.urls)),
 ]
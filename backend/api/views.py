@@ -5,23 +5,84 @@ Views handle HTTP request/response only.
 Business logic is delegated to services layer.
 """
 
-import pandas as pd
+import hmac
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from urllib.parse import urlencode
+
 from django.conf import settings
-from django.db import transaction
-from django.db.models import Avg, Count, Sum
+from django.db import connection, connections, transaction
+from django.http import HttpRequest, HttpResponse, QueryDict
+from django.urls import reverse
+from django.utils.http import parse_etags
+from django.shortcuts import get_object_or_404
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.parsers import MultiPartParser
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import SAFE_METHODS, AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import PerformanceData, StudentRoster, UploadLog
-from .serializers import PerformanceDataSerializer, StudentRosterSerializer, UploadLogSerializer
-from .services import ExcelParser
+from .db.routers import current_state, prefer_replica, routing_thread
+from .metrics import SUMMARY_LATENCY_SECONDS, render_latest
+from .models import ChunkedUpload, DatasetVersion, PerformanceData, ReferencePeriod, StudentRoster, UploadLog
+from .serializers import (
+    ChunkedUploadSerializer,
+    DatasetVersionSerializer,
+    PerformanceDataSerializer,
+    ReferencePeriodSerializer,
+    StudentRosterSerializer,
+    UploadLogDetailSerializer,
+    UploadLogSerializer,
+)
+from .services import chunked_upload
+from .services.aggregates import DEFAULT_RANKING_METRIC, department_ranking, refresh_aggregates
+from .services.data_version import bump_data_version, get_data_version
+from .services.facets import get_facets
+from .services.ingestion import ImportResult, ImportValidationError, PerformanceDataImporter
+from .services.partitions import ensure_partitions
+from .services.timeseries import get_prefix_store
+from .services.versions import active_version_id, rollback_month
+
+logger = logging.getLogger(__name__)
 
 # 개발 모드에서는 인증 없이 접근 허용
 API_PERMISSION = [AllowAny] if settings.DEBUG else [IsAuthenticated]
 
+ALLOWED_UPLOAD_EXTENSIONS = (".xlsx", ".xls", ".csv")
+ALLOWED_EXTENSIONS_ERROR = "엑셀 또는 CSV 파일(.xlsx, .xls, .csv)만 업로드 가능합니다."
+
+
+class ReplicaReadMixin:
+    """
+    조회(GET/HEAD) 요청의 실적 데이터 쿼리를 읽기 복제본으로 (DATABASE_REPLICA_URL 설정 시)
+
+    - 쓰기 요청과 최근 쓰기 후 고정(sticky)된 요청은 기본 DB 사용 (api.db.routers)
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+        with prefer_replica():
+            return super().dispatch(request, *args, **kwargs)
+
+
+def is_allowed_upload_filename(filename: str) -> bool:
+    return filename.lower().endswith(ALLOWED_UPLOAD_EXTENSIONS)
+
+
+def import_result_payload(result: ImportResult) -> dict:
+    """업로드 성공 응답 본문 (단일/분할 업로드 공통)"""
+    return {
+        "message": "데이터 업로드가 완료되었습니다.",
+        "reference_dates": result.reference_dates,
+        "created_count": result.created_count,
+        "warnings": result.warnings if result.warnings else None,
+        "sheets": result.sheets if len(result.sheets) > 1 else None,
+    }
+
 
 class ExcelUploadView(APIView):
     """
@@ -37,19 +98,17 @@ class ExcelUploadView(APIView):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.parser = ExcelParser()
+        self.importer = PerformanceDataImporter()
 
     def post(self, request):
         """
         엑셀 파일 업로드 처리
 
         1. 파일 유효성 검사
-        2. ExcelParser로 엑셀 파싱
-        3. 기준 년월 추출
-        4. Atomic Transaction 내에서:
-           - 해당 년월 기존 데이터 삭제
-           - 새 데이터 bulk_create
-        5. 업로드 이력 기록
+        2. PerformanceDataImporter로 파싱 및 저장
+           - ExcelParser로 엑셀 파싱, 기준 년월 추출
+           - Atomic Transaction 내에서 해당 년월 데이터 교체
+           - 업로드 이력 기록
         """
         file = request.FILES.get("file")
 
@@ -60,89 +119,259 @@ class ExcelUploadView(APIView):
             )
 
         # 파일 확장자 검사
-        filename = file.name.lower()
-        if not (filename.endswith(".xlsx") or filename.endswith(".xls") or filename.endswith(".csv")):
+        if not is_allowed_upload_filename(file.name):
+            return Response(
+                {"error": ALLOWED_EXTENSIONS_ERROR},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            # 엑셀/CSV 파일 파싱 및 저장 (서비스 레이어 사용)
+            result = self.importer.import_file(file.read(), filename=file.name, user=request.user)
+        except ImportValidationError as e:
             return Response(
-                {"error": "엑셀 또는 CSV 파일(.xlsx, .xls, .csv)만 업로드 가능합니다."},
+                {"error": str(e), "details": e.details},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        except ValueError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except Exception as e:
+            # 에러 발생 시 업로드 이력 기록
+            self.importer.record_failure(file.name, e, user=request.user)
+            return Response(
+                {"error": f"파일 처리 중 오류가 발생했습니다: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return Response(import_result_payload(result), status=status.HTTP_201_CREATED)
+
+
+CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+
+def get_chunked_upload(request, upload_id) -> ChunkedUpload:
+    """
+    요청 사용자가 시작한 분할 업로드 세션 조회
+
+    다른 사용자의 세션은 존재 여부도 드러내지 않도록 404 (스태프는 모든 세션 접근 가능).
+    익명 세션(DEBUG의 AllowAny)은 익명 요청에서만 조회됩니다.
+    """
+    queryset = ChunkedUpload.objects.all()
+    if not request.user.is_staff:
+        queryset = queryset.filter(uploaded_by=request.user if request.user.is_authenticated else None)
+    return get_object_or_404(queryset, pk=upload_id)
+
+
+class ChunkedUploadInitView(APIView):
+    """
+    분할 업로드 세션 생성 API
+
+    - POST /api/upload/chunked/
+    - body: {"filename": "data.xlsx", "total_size": 123456, "checksum": "<sha256, 선택>"}
+    - 응답의 upload_id로 청크를 PUT 한 뒤 finalize 호출
+    """
+
+    permission_classes = API_PERMISSION
+
+    def post(self, request):
+        filename = str(request.data.get("filename", "")).strip()
+        if not filename:
+            return Response({"error": "파일명이 제공되지 않았습니다."}, status=status.HTTP_400_BAD_REQUEST)
+        if not is_allowed_upload_filename(filename):
+            return Response({"error": ALLOWED_EXTENSIONS_ERROR}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            # 엑셀/CSV 파일 읽기 및 파싱 (서비스 레이어 사용)
-            file_content = file.read()
-            df = self.parser.read_excel(file_content, filename=file.name)
+            total_size = int(request.data.get("total_size", 0))
+            upload = chunked_upload.create_upload(
+                filename=filename,
+                total_size=total_size,
+                checksum=str(request.data.get("checksum", "")).strip(),
+                user=request.user,
+            )
+        except (TypeError, ValueError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = ChunkedUploadSerializer(upload).data
+        data["chunk_size"] = settings.CHUNKED_UPLOAD_CHUNK_SIZE
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class ChunkedUploadDetailView(APIView):
+    """
+    분할 업로드 청크 전송/상태 조회 API
+
+    - GET    /api/upload/chunked/{id}/ : 현재 offset 조회 (재개 시 사용)
+    - PUT    /api/upload/chunked/{id}/ : 청크 전송 (Content-Range: bytes start-end/total)
+      * offset 쿼리 파라미터로도 지정 가능
+      * X-Chunk-Checksum 헤더(SHA-256)로 청크 무결성 검증 가능
+    - DELETE /api/upload/chunked/{id}/ : 업로드 취소
+    - 세션을 시작한 사용자(또는 스태프)만 접근 가능
+    """
 
-            # 데이터 유효성 검증
-            self.parser.validate_dataframe(df)
+    permission_classes = API_PERMISSION
 
-            # 기준 년월 추출
-            reference_dates = self.parser.extract_reference_dates(df)
+    def get(self, request, upload_id):
+        upload = get_chunked_upload(request, upload_id)
+        return Response(ChunkedUploadSerializer(upload).data)
 
-            # 데이터 변환
-            performance_objects, errors = self.parser.parse_dataframe(df)
+    def put(self, request, upload_id):
+        upload = get_chunked_upload(request, upload_id)
+
+        try:
+            length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        if length <= 0:
+            return Response({"error": "청크 데이터가 비어있습니다."}, status=status.HTTP_400_BAD_REQUEST)
+        if length > settings.CHUNKED_UPLOAD_MAX_CHUNK_SIZE:
+            return Response(
+                {"error": f"청크 크기가 최대 허용 크기({settings.CHUNKED_UPLOAD_MAX_CHUNK_SIZE} 바이트)를 초과합니다."},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
 
-            if not performance_objects:
+        content_range = request.META.get("HTTP_CONTENT_RANGE")
+        if content_range:
+            match = CONTENT_RANGE_RE.match(content_range.strip())
+            if not match or int(match.group(2)) - int(match.group(1)) + 1 != length:
+                return Response({"error": "Content-Range 헤더 형식이 올바르지 않습니다."}, status=status.HTTP_400_BAD_REQUEST)
+            if match.group(3) != "*" and int(match.group(3)) != upload.total_size:
                 return Response(
-                    {"error": "처리할 유효한 데이터가 없습니다.", "details": errors},
+                    {"error": f"Content-Range의 전체 크기가 업로드 파일 크기({upload.total_size} 바이트)와 다릅니다."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
+            offset = int(match.group(1))
+        else:
+            try:
+                offset = int(request.query_params.get("offset", upload.received_bytes))
+            except ValueError:
+                return Response({"error": "offset 값이 올바르지 않습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-            # Atomic Transaction으로 데이터 저장
-            with transaction.atomic():
-                # 해당 기준 년월의 기존 데이터 삭제
-                for ref_date in reference_dates:
-                    ref_date_str = ExcelParser.normalize_date(ref_date)
-                    PerformanceData.objects.filter(reference_date=ref_date_str).delete()
-
-                # 새 데이터 일괄 삽입
-                created_objects = PerformanceData.objects.bulk_create(performance_objects, batch_size=1000)
-
-                # 업로드 이력 기록
-                UploadLog.objects.create(
-                    reference_date=str(reference_dates[0]),
-                    filename=file.name,
-                    row_count=len(created_objects),
-                    status="success",
-                    uploaded_by=request.user if request.user.is_authenticated else None,
-                )
+        try:
+            # request.body를 거치지 않고 WSGI 입력 스트림에서 바로 디스크로 기록
+            upload = chunked_upload.write_chunk(
+                upload,
+                offset=offset,
+                stream=request._request,
+                length=length,
+                chunk_checksum=request.META.get("HTTP_X_CHUNK_CHECKSUM"),
+            )
+        except chunked_upload.ChunkOffsetError as e:
+            return Response(
+                {"error": str(e), "offset": e.expected_offset},
+                status=status.HTTP_409_CONFLICT,
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(ChunkedUploadSerializer(upload).data)
+
+    def delete(self, request, upload_id):
+        upload = get_chunked_upload(request, upload_id)
+        chunked_upload.discard_upload(upload)
+        upload.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ChunkedUploadFinalizeView(APIView):
+    """
+    분할 업로드 완료 및 데이터 저장 API
+
+    - POST /api/upload/chunked/{id}/finalize/
+    - 조립된 파일의 체크섬 검증 후 ExcelUploadView와 동일한 파이프라인으로 저장
+    """
 
+    permission_classes = API_PERMISSION
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.importer = PerformanceDataImporter()
+
+    def post(self, request, upload_id):
+        upload = get_chunked_upload(request, upload_id)
+        # 느린 finalize를 재시도해도 한 요청만 처리 (상태 선점은 조건부 UPDATE 한 번)
+        if not chunked_upload.claim_upload(upload):
+            return Response({"error": "이미 처리 중이거나 처리된 업로드입니다."}, status=status.HTTP_409_CONFLICT)
+
+        try:
+            file_path = chunked_upload.read_assembled_file(upload)
+        except ValueError as e:
+            # 미완료/체크섬 불일치: 이어서 업로드할 수 있도록 되돌림
+            chunked_upload.release_upload(upload)
             return Response(
-                {
-                    "message": "데이터 업로드가 완료되었습니다.",
-                    "reference_dates": [str(d) for d in reference_dates],
-                    "created_count": len(created_objects),
-                    "warnings": errors if errors else None,
-                },
-                status=status.HTTP_201_CREATED,
+                {"error": str(e), "offset": upload.received_bytes},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        except pd.errors.EmptyDataError:
+        try:
+            result = self.importer.import_file(file_path, filename=upload.filename, user=request.user)
+        except ImportValidationError as e:
+            chunked_upload.finish_upload(upload, "failed")
             return Response(
-                {"error": "엑셀 파일이 비어있습니다."},
+                {"error": str(e), "details": e.details},
                 status=status.HTTP_400_BAD_REQUEST,
             )
         except ValueError as e:
+            chunked_upload.finish_upload(upload, "failed")
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_400_BAD_REQUEST,
             )
         except Exception as e:
-            # 에러 발생 시 업로드 이력 기록
-            UploadLog.objects.create(
-                reference_date="",
-                filename=file.name if file else "unknown",
-                row_count=0,
-                status="failed",
-                error_message=str(e),
-                uploaded_by=request.user if request.user.is_authenticated else None,
-            )
+            chunked_upload.finish_upload(upload, "failed")
+            self.importer.record_failure(upload.filename, e, user=request.user)
             return Response(
                 {"error": f"파일 처리 중 오류가 발생했습니다: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+        chunked_upload.finish_upload(upload, "complete")
+        return Response(import_result_payload(result), status=status.HTTP_201_CREATED)
+
+
+def filter_performance_data(queryset, params):
+    """실적 데이터 목록 필터 (동기/비동기 목록 API 공통)"""
+    # 기준 년월 필터링
+    reference_date = params.get("reference_date")
+    if reference_date:
+        queryset = queryset.filter(reference_date=reference_date)
+
+    # 부서 필터링
+    department = params.get("department")
+    if department:
+        queryset = queryset.filter(department__icontains=department)
+
+    return queryset
+
+
+def filter_student_roster(queryset, params):
+    """학생 명단 목록 필터 (동기/비동기 목록 API 공통)"""
+    # 학과 필터링
+    department = params.get("department")
+    if department:
+        queryset = queryset.filter(department__icontains=department)
+
+    # 학적상태 필터링
+    enrollment_status = params.get("enrollment_status")
+    if enrollment_status:
+        queryset = queryset.filter(enrollment_status=enrollment_status)
 
-class PerformanceDataViewSet(viewsets.ModelViewSet):
+    # 과정구분 필터링
+    program_type = params.get("program_type")
+    if program_type:
+        queryset = queryset.filter(program_type=program_type)
+
+    # 단과대학 필터링
+    college = params.get("college")
+    if college:
+        queryset = queryset.filter(college__icontains=college)
+
+    return queryset
+
+
+class PerformanceDataViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """
     실적 데이터 CRUD API
 
@@ -151,37 +380,91 @@ class PerformanceDataViewSet(viewsets.ModelViewSet):
     - GET /api/data/{id}/ : 단일 조회
     """
 
-    queryset = PerformanceData.objects.all()
+    queryset = PerformanceData.objects.active()
     serializer_class = PerformanceDataSerializer
     permission_classes = API_PERMISSION
 
     def get_queryset(self):
-        queryset = PerformanceData.objects.all()
+        return filter_performance_data(PerformanceData.objects.active(), self.request.query_params)
+
+    # 변경된 기준 년월의 부서별 집계 갱신 (행은 해당 월의 활성 버전에 추가/이동)
+    @transaction.atomic
+    def perform_create(self, serializer):
+        month = serializer.validated_data.get("reference_date", "")
+        ensure_partitions([month])
+        instance = serializer.save(version_id=active_version_id(month))
+        refresh_aggregates([instance.reference_date])
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        previous_month = serializer.instance.reference_date
+        month = serializer.validated_data.get("reference_date", previous_month)
+        ensure_partitions([month])
+        instance = serializer.save(version_id=active_version_id(month))
+        refresh_aggregates([previous_month, instance.reference_date])
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        instance.delete()
+        refresh_aggregates([instance.reference_date])
+
+
+class UploadLogViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    업로드 이력 조회 API (읽기 전용)
 
-        # 기준 년월 필터링
-        reference_date = self.request.query_params.get("reference_date")
-        if reference_date:
-            queryset = queryset.filter(reference_date=reference_date)
+    - cProfile 보고서(profile_report)는 목록에서 제외하고 스태프의 단건 조회에서만 제공
+    """
 
-        # 부서 필터링
-        department = self.request.query_params.get("department")
-        if department:
-            queryset = queryset.filter(department__icontains=department)
+    queryset = UploadLog.objects.all()
+    serializer_class = UploadLogSerializer
+    permission_classes = API_PERMISSION
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.get_serializer_class() is UploadLogSerializer:
+            # 수십 KB 보고서 텍스트는 읽지도 않음
+            queryset = queryset.defer("profile_report")
         return queryset
 
+    def get_serializer_class(self):
+        if self.action == "retrieve" and self.request.user.is_staff:
+            return UploadLogDetailSerializer
+        return super().get_serializer_class()
+
 
-class UploadLogViewSet(viewsets.ReadOnlyModelViewSet):
+class ReferencePeriodViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """
-    업로드 이력 조회 API (읽기 전용)
+    기준 년월 목록 API (읽기 전용)
+
+    - GET /api/periods/ : 데이터가 있는 기준 년월 목록 (최신순, 행 수, 최근 업로드 일시)
+    - GET /api/periods/2024-05/ : 단일 조회
+    - GET /api/periods/2024-05/versions/ : 해당 월의 데이터 버전 목록 (최신순)
+    - POST /api/periods/2024-05/rollback/ : 직전 업로드 버전으로 되돌리기
     """
 
-    queryset = UploadLog.objects.all()
-    serializer_class = UploadLogSerializer
+    queryset = ReferencePeriod.objects.all()
+    serializer_class = ReferencePeriodSerializer
     permission_classes = API_PERMISSION
+    pagination_class = None
+    lookup_field = "month"
+
+    @action(detail=True, methods=["get"])
+    def versions(self, request, month=None):
+        versions = DatasetVersion.objects.filter(month=month)
+        return Response(DatasetVersionSerializer(versions, many=True).data)
+
+    # 활성 버전만 전환 (행 삭제/재삽입 없음), 집계는 해당 월만 재계산
+    @action(detail=True, methods=["post"])
+    def rollback(self, request, month=None):
+        try:
+            version = rollback_month(month)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"month": month, "active_version": DatasetVersionSerializer(version).data if version else None})
 
 
-class StudentRosterViewSet(viewsets.ModelViewSet):
+class StudentRosterViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """
     학생 명단 CRUD API
 
@@ -196,32 +479,68 @@ class StudentRosterViewSet(viewsets.ModelViewSet):
     permission_classes = API_PERMISSION
 
     def get_queryset(self):
-        queryset = StudentRoster.objects.all()
+        return filter_student_roster(StudentRoster.objects.all(), self.request.query_params)
 
-        # 학과 필터링
-        department = self.request.query_params.get("department")
-        if department:
-            queryset = queryset.filter(department__icontains=department)
+    # 학생 명단 변경 시 데이터 버전 갱신 (필터 facet 캐시 무효화)
+    @transaction.atomic
+    def perform_create(self, serializer):
+        serializer.save()
+        bump_data_version()
 
-        # 학적상태 필터링
-        enrollment_status = self.request.query_params.get("enrollment_status")
-        if enrollment_status:
-            queryset = queryset.filter(enrollment_status=enrollment_status)
+    @transaction.atomic
+    def perform_update(self, serializer):
+        serializer.save()
+        bump_data_version()
 
-        # 과정구분 필터링
-        program_type = self.request.query_params.get("program_type")
-        if program_type:
-            queryset = queryset.filter(program_type=program_type)
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        instance.delete()
+        bump_data_version()
 
-        # 단과대학 필터링
-        college = self.request.query_params.get("college")
-        if college:
-            queryset = queryset.filter(college__icontains=college)
 
-        return queryset
+def dashboard_summary_payload(params, store, reference_dates: list[str]) -> dict:
+    """
+    대시보드 요약 응답 본문 (동기/비동기 요약 API 공통)
 
+    Args:
+        params: 쿼리 파라미터 (reference_date, departments, start_date, end_date, ranking_metric)
+        store: 누적합 저장소 (get_prefix_store)
+        reference_dates: 기준 년월 목록
 
-class DashboardSummaryView(APIView):
+    Raises:
+        ValueError: 지원하지 않는 ranking_metric
+    """
+    reference_date = params.get("reference_date")
+    departments = params.get("departments")
+    start_date = params.get("start_date")
+    end_date = params.get("end_date")
+
+    # 부서 필터 (쉼표로 구분된 부서 목록)
+    dept_list = [d.strip() for d in departments.split(",") if d.strip()] if departments else []
+
+    # 누적합 저장소: 기간 합계 = 두 누적값의 차 (원본 행을 다시 합산하지 않음)
+    lo, hi = store.month_bounds(reference_date, start_date, end_date)
+    rows = store.department_rows(dept_list)
+
+    # 부서별 실적 (상위 10개)
+    ranking = department_ranking(
+        reference_date=reference_date,
+        start_date=start_date,
+        end_date=end_date,
+        departments=dept_list,
+        metric=params.get("ranking_metric", DEFAULT_RANKING_METRIC),
+        store=store,
+    )
+
+    return {
+        "summary": store.summary(lo, hi, rows),
+        "monthly_trend": store.monthly_trend(lo, hi, rows),
+        "department_ranking": ranking,
+        "reference_dates": reference_dates,
+    }
+
+
+class DashboardSummaryView(ReplicaReadMixin, APIView):
     """
     대시보드 요약 데이터 API
 
@@ -229,81 +548,177 @@ class DashboardSummaryView(APIView):
     - GET /api/summary/?reference_date=2024-05 : 특정 월 요약
     - GET /api/summary/?departments=컴퓨터공학과,전자공학과 : 특정 부서 필터
     - GET /api/summary/?start_date=2024-01&end_date=2024-12 : 날짜 범위 필터
+    - GET /api/summary/?ranking_metric=papers : 부서 순위 기준 (revenue, budget, papers, patents, projects)
     """
 
     permission_classes = API_PERMISSION
 
+    @SUMMARY_LATENCY_SECONDS.time()
     def get(self, request):
-        reference_date = request.query_params.get("reference_date")
-        departments = request.query_params.get("departments")
-        start_date = request.query_params.get("start_date")
-        end_date = request.query_params.get("end_date")
-
-        queryset = PerformanceData.objects.all()
-
-        # 기준월 필터
-        if reference_date:
-            queryset = queryset.filter(reference_date=reference_date)
-
-        # 날짜 범위 필터
-        if start_date:
-            queryset = queryset.filter(reference_date__gte=start_date)
-        if end_date:
-            queryset = queryset.filter(reference_date__lte=end_date)
-
-        # 부서 필터 (쉼표로 구분된 부서 목록)
-        if departments:
-            dept_list = [d.strip() for d in departments.split(",") if d.strip()]
-            if dept_list:
-                queryset = queryset.filter(department__in=dept_list)
-
-        # 집계 데이터
-        summary = queryset.aggregate(
-            total_revenue=Sum("revenue"),
-            total_budget=Sum("budget"),
-            total_expenditure=Sum("expenditure"),
-            total_papers=Sum("paper_count"),
-            total_patents=Sum("patent_count"),
-            total_projects=Sum("project_count"),
-            department_count=Count("department", distinct=True),
-            avg_revenue=Avg("revenue"),
-        )
-
-        # 월별 추이 데이터 (필터 적용)
-        monthly_trend = (
-            queryset.values("reference_date")
-            .annotate(
-                revenue=Sum("revenue"),
-                budget=Sum("budget"),
-                expenditure=Sum("expenditure"),
-                papers=Sum("paper_count"),
-                patents=Sum("patent_count"),
-                projects=Sum("project_count"),
-            )
-            .order_by("reference_date")
-        )
-
-        # 부서별 실적 (상위 10개)
-        department_ranking = (
-            queryset.values("department")
-            .annotate(
-                total_revenue=Sum("revenue"),
-                total_budget=Sum("budget"),
-                total_expenditure=Sum("expenditure"),
-                total_papers=Sum("paper_count"),
-                total_patents=Sum("patent_count"),
-                total_projects=Sum("project_count"),
+        reference_dates = list(ReferencePeriod.objects.values_list("month", flat=True))
+        try:
+            data = dashboard_summary_payload(request.query_params, get_prefix_store(), reference_dates)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(data)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 약한 비교 (압축 미들웨어가 붙인 W/ 접두어 무시, Django 조건부 GET과 동일)"""
+    tags = parse_etags(if_none_match)
+    return "*" in tags or etag.removeprefix("W/") in {tag.removeprefix("W/") for tag in tags}
+
+
+class FacetsView(ReplicaReadMixin, APIView):
+    """
+    필터 facet API
+
+    - GET /api/facets/ : 필터 선택지와 건수
+        performance: departments, reference_dates
+        students: colleges, departments, enrollment_statuses, program_types
+    - 데이터 버전별 캐시, ETag(데이터 버전)로 변경이 없으면 304 응답
+    """
+
+    permission_classes = API_PERMISSION
+
+    def get(self, request):
+        version = get_data_version()
+        etag = f'"{version}"'
+        if etag_matches(request.headers.get("If-None-Match", ""), etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        return Response({"version": version, **get_facets(version)}, headers={"ETag": etag})
+
+
+class MetricsView(APIView):
+    """
+    Prometheus 메트릭 API (텍스트 노출 형식)
+
+    - GET /api/metrics : 업로드 단계별 시간, 처리량, 요약 API 지연, 캐시 적중률
+    - gunicorn 워커 전체 합산 (PROMETHEUS_MULTIPROC_DIR)
+    - METRICS_AUTH_TOKEN 설정 시 "Authorization: Bearer <token>" 필요
+    - 토큰이 없으면 개발 모드(DEBUG)에서만 공개, 운영에서는 403
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        token = settings.METRICS_AUTH_TOKEN
+        if token:
+            provided = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+            if not hmac.compare_digest(provided.encode(), token.encode()):
+                return HttpResponse(status=status.HTTP_401_UNAUTHORIZED)
+        elif not settings.DEBUG:
+            return HttpResponse(status=status.HTTP_403_FORBIDDEN)
+
+        body, content_type = render_latest()
+        return HttpResponse(body, content_type=content_type)
+
+
+class BatchView(APIView):
+    """
+    배치 조회 API (대시보드 패널 여러 개를 한 번의 요청으로)
+
+    - POST /api/batch/
+        {"queries": [
+            {"id": "summary", "type": "summary", "params": {"start_date": "2024-01"}},
+            {"id": "page2", "type": "data", "params": {"page": 2, "reference_date": "2024-05"}},
+            {"type": "facets"},
+            {"type": "logs"}
+        ]}
+    - 응답: {"results": [{"id": ..., "type": ..., "status": 200, "data": {...}}, ...]} (요청 순서 유지)
+    - 각 하위 조회는 해당 GET 엔드포인트와 동일하게 처리 (필터, 페이지네이션, 권한)
+    - 인증·미들웨어는 배치 요청에서 한 번만 수행
+    - DB 연결 풀(DB_POOL, psycopg_pool)이 있으면 BATCH_MAX_WORKERS 스레드로 동시 실행
+      (스레드마다 풀에서 연결을 빌려 쓰고 반납), 없으면 요청의 DB 연결 하나로 순차 실행
+    """
+
+    permission_classes = API_PERMISSION
+
+    def post(self, request):
+        queries = request.data.get("queries") if isinstance(request.data, dict) else None
+        if not isinstance(queries, list) or not queries:
+            return Response({"error": "queries 목록이 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(queries) > settings.BATCH_MAX_QUERIES:
+            return Response(
+                {"error": f"한 번에 최대 {settings.BATCH_MAX_QUERIES}개까지 조회할 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            .order_by("-total_revenue")[:10]
-        )
-
-        return Response(
-            {
-                "summary": summary,
-                "monthly_trend": list(monthly_trend),
-                "department_ranking": list(department_ranking),
-                "reference_dates": list(
-                    PerformanceData.objects.values_list("reference_date", flat=True).distinct().order_by("-reference_date")
-                ),
-            }
-        )
+
+        workers = min(settings.BATCH_MAX_WORKERS, len(queries))
+        if workers > 1 and self.use_threads():
+            # 요청 컨텍스트를 하위 조회 스레드로 전달 (DB 라우팅 상태는 스레드별 복사본)
+            state = current_state()
+            contexts = [copy_context() for _ in queries]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda context, query: context.run(self._run_in_thread, request, query, state),
+                        contexts,
+                        queries,
+                    )
+                )
+        else:
+            results = [self._run(request, query) for query in queries]
+        return Response({"results": results})
+
+    @staticmethod
+    def use_threads() -> bool:
+        """
+        연결 풀이 있을 때만 스레드 실행
+
+        풀이 없으면 스레드마다 새 연결(TLS 포함)을 열고 닫으므로 순차 실행보다 느림 (SQLite는 풀 없음)
+        """
+        return bool(connection.settings_dict.get("OPTIONS", {}).get("pool"))
+
+    @classmethod
+    def _run_in_thread(cls, request, query, state) -> dict:
+        try:
+            with routing_thread(state):
+                return cls._run(request, query)
+        finally:
+            # 스레드가 빌린 연결(기본 DB, 복제본)을 풀에 반납
+            connections.close_all()
+
+    @staticmethod
+    def _run(request, query) -> dict:
+        if not isinstance(query, dict):
+            return {"id": None, "type": None, "status": 400, "data": {"error": "조회 항목은 객체여야 합니다."}}
+
+        query_id, query_type = query.get("id", query.get("type")), query.get("type")
+        params = query.get("params") or {}
+        target = BATCH_QUERY_VIEWS.get(query_type)
+        if target is None or not isinstance(params, dict):
+            error = f"지원하지 않는 조회 유형입니다: {query_type} (가능: {', '.join(BATCH_QUERY_VIEWS)})"
+            if target is not None:
+                error = "params는 객체여야 합니다."
+            return {"id": query_id, "type": query_type, "status": 400, "data": {"error": error}}
+
+        view, url_name = target
+        sub_request = HttpRequest()
+        sub_request.method = "GET"
+        sub_request.META = {**request._request.META, "REQUEST_METHOD": "GET", "QUERY_STRING": urlencode(params, doseq=True)}
+        sub_request.GET = QueryDict(sub_request.META["QUERY_STRING"])
+        sub_request.path = sub_request.path_info = reverse(url_name)
+        # 배치 요청에서 인증된 사용자로 하위 뷰 실행 (인증 재수행 없음)
+        sub_request._force_auth_user = request.user
+        sub_request._force_auth_token = request.auth
+
+        try:
+            response = view(sub_request)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.exception("Batch sub-query %s failed", query_type)
+            return {"id": query_id, "type": query_type, "status": 500, "data": {"error": str(e)}}
+        return {"id": query_id, "type": query_type, "status": response.status_code, "data": response.data}
+
+
+# 배치 조회 유형 -> (GET 뷰, URL 이름)
+BATCH_QUERY_VIEWS = {
+    "summary": (DashboardSummaryView.as_view(), "dashboard-summary"),
+    "data": (PerformanceDataViewSet.as_view({"get": "list"}), "performance-data-list"),
+    "students": (StudentRosterViewSet.as_view({"get": "list"}), "student-roster-list"),
+    "logs": (UploadLogViewSet.as_view({"get": "list"}), "upload-logs-list"),
+    "periods": (ReferencePeriodViewSet.as_view({"get": "list"}), "reference-periods-list"),
+    "facets": (FacetsView.as_view(), "facets"),
+}
@@ -0,0 +1,121 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks are plain scripts (not collected by pytest) that print a table and
+write machine-readable JSON so results can be compared between commits.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = BACKEND_DIR / "benchmarks" / "results"
+
+
+def setup_django() -> None:
+    """Configure Django so benchmarks can import api.* modules."""
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    import django
+
+    django.setup()
+
+
+def measure(func: Callable[[], object], repeat: int = 5, warmup: int = 1) -> dict:
+    """Run func repeatedly and return timing statistics in seconds."""
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+        "repeat": repeat,
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(name: str, results: list[dict], output: str = "") -> Path:
+    """
+    Write benchmark results as JSON.
+
+    Default path: benchmarks/results/<name>-<git revision>.json
+    """
+    path = Path(output) if output else RESULTS_DIR / f"{name}-{git_revision()}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "benchmark": name,
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def load_results(path: str) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def compare_results(
+    results: list[dict], baseline_path: str, keys: list[str], metrics: list[str], threshold: float = 1.10
+) -> list[dict]:
+    """
+    Compare results against a previous JSON run (lower is better for every metric).
+
+    Rows are matched on the key columns; ratios above threshold are flagged
+    as regressions. Prints and returns the comparison table.
+    """
+    baseline = load_results(baseline_path)
+    previous = {tuple(row.get(key) for key in keys): row for row in baseline["results"]}
+    comparison = []
+    for row in results:
+        old = previous.get(tuple(row.get(key) for key in keys))
+        if old is None:
+            continue
+        entry = {key: row.get(key) for key in keys}
+        for metric in metrics:
+            if row.get(metric) and old.get(metric):
+                ratio = row[metric] / old[metric]
+                entry[metric] = f"{ratio:.2f}x" + (" !" if ratio > threshold else "")
+        comparison.append(entry)
+
+    print(f"\nCompared with {baseline['revision']} (current/baseline, '!' = slower by more than {threshold - 1:.0%})")
+    if comparison:
+        print_table(comparison, keys + metrics)
+    return comparison
+
+
+def print_table(results: list[dict], columns: list[str]) -> None:
+    widths = {col: max(len(col), *(len(_fmt(r.get(col))) for r in results)) for col in columns}
+    print("  ".join(col.ljust(widths[col]) for col in columns))
+    for row in results:
+        print("  ".join(_fmt(row.get(col)).ljust(widths[col]) for col in columns))
+
+
+def _fmt(value) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.4f}"
+    return str(value)
@@ -0,0 +1,104 @@
+"""
+Sync (WSGI) vs async (ASGI) read API throughput benchmark.
+
+Serves the same seeded database (see bench_read_api.py) twice with the same
+number of gunicorn workers:
+
+    sync    config.wsgi:application, sync workers, /api/...
+    async   config.asgi:application, uvicorn workers, /api/async/...
+
+and drives the summary and list endpoints at increasing concurrency,
+reporting p50/p95/p99 latency and requests per second. With sync workers a
+slow request occupies its worker until it finishes, so throughput flattens
+once concurrency exceeds the worker count; async workers keep accepting
+requests while queries are in flight.
+
+Requires uvicorn-worker (requirements.txt).
+
+Usage:
+    python benchmarks/bench_async.py
+    python benchmarks/bench_async.py --scales 1000000 --concurrency 1 16 64 --workers 2
+    python benchmarks/bench_async.py --compare benchmarks/results/async-abc1234.json
+"""
+
+import argparse
+import urllib.parse
+
+from _common import compare_results, print_table, write_results
+from bench_read_api import PAGE_SIZE, GunicornServer, prepare_database, run_load
+
+SERVERS = {
+    "sync": ("config.wsgi:application", "sync", "/api/"),
+    "async": ("config.asgi:application", "uvicorn_worker.UvicornWorker", "/api/async/"),
+}
+
+RESULT_KEYS = ["scale", "server", "endpoint", "scenario", "concurrency"]
+RESULT_METRICS = ["p50_ms", "p95_ms", "p99_ms"]
+
+
+def scenarios(scale: int) -> list[tuple[str, str, str]]:
+    """(endpoint, scenario, path relative to the API prefix) for one scale."""
+    quote = urllib.parse.quote
+    return [
+        ("summary", "all", "summary/"),
+        ("summary", "range+departments",
+         f"summary/?start_date=2024-01&end_date=2024-12&departments={quote('경영학과,물리학과,사학과')}"),
+        ("data", "page-first", "data/?page=1"),
+        ("data", "page-last", f"data/?page={max(1, -(-scale // PAGE_SIZE))}"),
+        ("students", "department-icontains", f"students/?department={quote('공학')}"),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--requests", type=int, default=300, help="requests per scenario and concurrency level")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers (same for both servers)")
+    parser.add_argument("--servers", nargs="+", default=list(SERVERS), choices=list(SERVERS))
+    parser.add_argument("--endpoints", nargs="+", default=["summary", "data", "students"])
+    parser.add_argument(
+        "--database-url",
+        default="",
+        help="benchmark against this database instead of cached SQLite files (its tables are replaced!)",
+    )
+    parser.add_argument("--reseed", action="store_true", help="rebuild cached SQLite databases")
+    parser.add_argument("--output", default="")
+    parser.add_argument("--compare", default="", help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    results = []
+    for scale in args.scales:
+        database_url, token = prepare_database(scale, args.database_url, args.reseed)
+
+        for server_name in args.servers:
+            app, worker_class, prefix = SERVERS[server_name]
+            with GunicornServer(database_url, args.workers, app=app, worker_class=worker_class) as server:
+                for endpoint, scenario, path in scenarios(scale):
+                    if endpoint not in args.endpoints:
+                        continue
+                    for concurrency in args.concurrency:
+                        stats = run_load(server.base_url, prefix + path, token, concurrency, args.requests)
+                        results.append(
+                            {
+                                "scale": scale,
+                                "server": server_name,
+                                "endpoint": endpoint,
+                                "scenario": scenario,
+                                "concurrency": concurrency,
+                                **stats,
+                            }
+                        )
+                        print(
+                            f"  {scale:>9,} {server_name:<6} {endpoint:<9} {scenario:<22} c={concurrency:<3} done",
+                            flush=True,
+                        )
+
+    print_table(results, RESULT_KEYS + RESULT_METRICS + ["rps", "errors"])
+    print(f"\nResults written to {write_results('async', results, args.output)}")
+    if args.compare:
+        compare_results(results, args.compare, RESULT_KEYS, RESULT_METRICS)
+
+
+if __name__ == "__main__":
+    main()
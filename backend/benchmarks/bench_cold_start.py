@@ -0,0 +1,117 @@
+"""
+Cold-start benchmark: first request after a (re)start vs steady state.
+
+For each launcher mode, restarts gunicorn (one worker) several times against
+the seeded read API database (see bench_read_api.py) and times the very
+first request to one endpoint, then the steady-state p50 of the following
+requests:
+
+    preload     GUNICORN_PRELOAD=True  (config.warmup runs in the master before fork)
+    no-preload  GUNICORN_PRELOAD=False (each worker imports and builds caches itself)
+
+Endpoints: summary, data (first page), students, upload (a one-row CSV;
+the first upload imports pandas unless it was preloaded). SQLite databases
+are copied per run so uploads never modify the cached seed.
+
+Usage:
+    python benchmarks/bench_cold_start.py
+    python benchmarks/bench_cold_start.py --scale 1000000 --restarts 5
+    python benchmarks/bench_cold_start.py --compare benchmarks/results/cold_start-abc1234.json
+"""
+
+import argparse
+import shutil
+import statistics
+import tempfile
+import time
+import urllib.request
+import uuid
+from pathlib import Path
+
+from _common import compare_results, print_table, write_results
+from bench_read_api import GunicornServer, prepare_database
+
+MODES = {"preload": "True", "no-preload": "False"}
+
+ENDPOINTS = {
+    "summary": "/api/summary/",
+    "data": "/api/data/?page=1",
+    "students": "/api/students/",
+    "upload": "/api/upload/",
+}
+
+UPLOAD_CSV = "기준년월,부서명,매출액\n2099-12,벤치마크학과,1000\n".encode("utf-8")
+
+RESULT_KEYS = ["scale", "mode", "endpoint"]
+RESULT_METRICS = ["first_ms", "steady_p50_ms"]
+
+
+def timed_request(base_url: str, endpoint: str, token: str) -> float:
+    """Seconds for one request to the endpoint (multipart POST for upload)."""
+    headers = {"Authorization": f"Token {token}", "Accept": "application/json"}
+    data = None
+    if endpoint == "upload":
+        boundary = uuid.uuid4().hex
+        headers["Content-Type"] = f"multipart/form-data; boundary={boundary}"
+        data = (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="cold.csv"\r\n'
+            f"Content-Type: text/csv\r\n\r\n"
+        ).encode() + UPLOAD_CSV + f"\r\n--{boundary}--\r\n".encode()
+
+    request = urllib.request.Request(base_url + ENDPOINTS[endpoint], data=data, headers=headers)
+    start = time.perf_counter()
+    with urllib.request.urlopen(request, timeout=120) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def measure_mode(database_url: str, token: str, mode: str, endpoint: str, restarts: int, steady: int) -> dict:
+    """Median first-request latency over restarts and the steady-state p50."""
+    firsts, latencies = [], []
+    for _ in range(restarts):
+        with tempfile.TemporaryDirectory(prefix="bench-cold-") as tmp:
+            url = database_url
+            if database_url.startswith("sqlite:///"):
+                copy = Path(tmp) / "db.sqlite3"
+                shutil.copyfile(database_url.removeprefix("sqlite:///"), copy)
+                url = f"sqlite:///{copy}"
+            with GunicornServer(url, workers=1, env={"GUNICORN_PRELOAD": MODES[mode]}) as server:
+                firsts.append(timed_request(server.base_url, endpoint, token))
+                latencies.extend(timed_request(server.base_url, endpoint, token) for _ in range(steady))
+
+    return {
+        "first_ms": statistics.median(firsts) * 1000,
+        "first_max_ms": max(firsts) * 1000,
+        "steady_p50_ms": statistics.median(latencies) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=100_000)
+    parser.add_argument("--restarts", type=int, default=3, help="server restarts per mode and endpoint")
+    parser.add_argument("--steady", type=int, default=20, help="requests after the first one")
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--endpoints", nargs="+", default=list(ENDPOINTS), choices=list(ENDPOINTS))
+    parser.add_argument("--reseed", action="store_true", help="rebuild the cached SQLite database")
+    parser.add_argument("--output", default="")
+    parser.add_argument("--compare", default="", help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    database_url, token = prepare_database(args.scale, reseed=args.reseed)
+
+    results = []
+    for endpoint in args.endpoints:
+        for mode in args.modes:
+            stats = measure_mode(database_url, token, mode, endpoint, args.restarts, args.steady)
+            results.append({"scale": args.scale, "mode": mode, "endpoint": endpoint, **stats})
+            print(f"  {mode:<10} {endpoint:<9} first {stats['first_ms']:8.1f} ms  steady {stats['steady_p50_ms']:6.1f} ms")
+
+    print_table(results, RESULT_KEYS + ["first_ms", "first_max_ms", "steady_p50_ms"])
+    print(f"\nResults written to {write_results('cold_start', results, args.output)}")
+    if args.compare:
+        compare_results(results, args.compare, RESULT_KEYS, RESULT_METRICS)
+
+
+if __name__ == "__main__":
+    main()
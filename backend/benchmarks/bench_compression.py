@@ -0,0 +1,105 @@
+"""
+Response compression benchmark: CPU cost vs bandwidth saved.
+
+Compresses rendered API payloads (see bench_renderers.py) with gzip and
+brotli at several levels, the way ResponseCompressionMiddleware does, and
+reports per response:
+
+    compress_ms     CPU time to compress the body
+    ratio           compressed / original size
+    saved_kb        bytes no longer sent
+    breakeven_mbps  link speed at which compressing costs as much time as
+                    it saves in transfer; compression pays off for clients
+                    on slower links (practically every mobile or WAN client)
+
+The "stream" rows compress the bulk payload in 64 KiB chunks with a flush
+per chunk (StreamingHttpResponse) to show the cost of incremental output.
+Brotli quality 11 is left out: ~70 ms for one 100-row page, seconds for bulk.
+
+Usage:
+    python benchmarks/bench_compression.py
+    python benchmarks/bench_compression.py --repeat 20 --bulk-rows 50000
+    python benchmarks/bench_compression.py --compare benchmarks/results/compression-abc1234.json
+"""
+
+import argparse
+
+from _common import compare_results, measure, print_table, setup_django, write_results
+from bench_renderers import PAGE_SIZE, rows_payload, summary_payload
+
+LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 6]}
+STREAM_CHUNK = 64 * 1024
+
+RESULT_KEYS = ["payload", "format", "encoding", "level", "mode"]
+RESULT_METRICS = ["compress_ms"]
+
+
+def compress_chunked(body: bytes, encoding: str, level: int) -> bytes:
+    from api.compression import StreamCompressor
+
+    compressor = StreamCompressor(encoding, level)
+    out = [compressor.compress(body[i : i + STREAM_CHUNK]) for i in range(0, len(body), STREAM_CHUNK)]
+    out.append(compressor.finish())
+    return b"".join(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--bulk-rows", type=int, default=10_000)
+    parser.add_argument("--output", default="")
+    parser.add_argument("--compare", default="", help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    setup_django()
+    from api.compression import available_encodings, compress_body
+    from api.renderers import MessagePackRenderer, ORJSONRenderer, msgpack
+
+    formats = {"json": ORJSONRenderer()}
+    if msgpack is not None:
+        formats["msgpack"] = MessagePackRenderer()
+    if "br" not in available_encodings():
+        print("brotli not installed, gzip only")
+
+    payloads = {
+        "summary": summary_payload(),
+        "page": {"count": args.bulk_rows, "next": None, "previous": None, "results": rows_payload(PAGE_SIZE)},
+        "bulk": rows_payload(args.bulk_rows),
+    }
+
+    results = []
+    for payload_name, data in payloads.items():
+        for format_name, renderer in formats.items():
+            body = renderer.render(data)
+            for encoding in available_encodings():
+                for level in LEVELS[encoding]:
+                    modes = {"whole": compress_body}
+                    if payload_name == "bulk":
+                        modes["stream"] = compress_chunked
+                    for mode, compress in modes.items():
+                        stats = measure(lambda: compress(body, encoding, level), repeat=args.repeat)
+                        size = len(compress(body, encoding, level))
+                        saved = len(body) - size
+                        results.append(
+                            {
+                                "payload": payload_name,
+                                "format": format_name,
+                                "encoding": encoding,
+                                "level": level,
+                                "mode": mode,
+                                "original_kb": len(body) / 1024,
+                                "ratio": size / len(body),
+                                "saved_kb": saved / 1024,
+                                "compress_ms": stats["median"] * 1000,
+                                "breakeven_mbps": saved * 8 / stats["median"] / 1e6,
+                            }
+                        )
+
+    print_table(results, RESULT_KEYS + ["original_kb", "ratio", "saved_kb", "compress_ms", "breakeven_mbps"])
+    print(f"\nResults written to {write_results('compression', results, args.output)}")
+    if args.compare:
+        compare_results(results, args.compare, RESULT_KEYS, RESULT_METRICS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+CSV encoding detection benchmark.
+
+Compares the legacy "try every encoding with a full read_csv" cascade against
+sniffing a bounded sample and parsing once, on multi-MB Korean CSVs.
+
+Usage:
+    python benchmarks/bench_encoding.py
+    python benchmarks/bench_encoding.py --size-mb 20 --repeat 3 --output results.json
+"""
+
+import argparse
+import io
+import random
+
+from _common import measure, print_table, setup_django, write_results
+
+ENCODINGS = ["utf-8", "utf-8-sig", "cp949", "euc-kr"]
+DEPARTMENTS = ["컴퓨터공학과", "전자공학과", "기계공학과", "경영학과", "국어국문학과", "물리학과"]
+
+
+def make_korean_csv(size_mb: float, encoding: str, late_korean: bool = False) -> bytes:
+    """
+    Build a CSV of roughly size_mb megabytes.
+
+    late_korean: ASCII header and department codes, with Korean text only in
+    the last rows - the worst case for the legacy cascade, which parses almost
+    the whole file before the UTF-8 attempt fails.
+    """
+    rng = random.Random(42)
+    header = "reference_date,department,revenue,budget,paper_count,note" if late_korean else "기준년월,부서명,매출액,예산,논문수,비고"
+    lines = [header]
+    target = int(size_mb * 1024 * 1024)
+    size = 0
+    while size < target:
+        department = f"D{rng.randint(1, 99):03d}" if late_korean else rng.choice(DEPARTMENTS)
+        note = "-" if late_korean else "연구 실적 비고"
+        line = f"2024-{rng.randint(1, 12):02d},{department},{rng.randint(0, 10**9)},{rng.randint(0, 10**9)},{rng.randint(0, 50)},{note}"
+        lines.append(line)
+        size += len(line.encode("utf-8"))
+    if late_korean:
+        lines.extend(f"2024-12,{department},0,0,0,연구 실적 비고" for department in DEPARTMENTS)
+    return ("\n".join(lines) + "\n").encode(encoding)
+
+
+def legacy_read_csv(content: bytes):
+    import pandas as pd
+
+    for encoding in ["utf-8", "cp949", "euc-kr", "latin1"]:
+        try:
+            return pd.read_csv(io.BytesIO(content), encoding=encoding)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError("encoding not recognised")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=8.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+
+    setup_django()
+    from api.services.encoding import detect_encoding
+    from api.services.excel_parser import ExcelParser
+
+    csv_parser = ExcelParser()
+    results = []
+    for encoding, late_korean in [(encoding, late) for late in (False, True) for encoding in ENCODINGS]:
+        content = make_korean_csv(args.size_mb, encoding, late_korean=late_korean)
+        detect = measure(lambda: detect_encoding(content), repeat=args.repeat)
+        legacy = measure(lambda: legacy_read_csv(content), repeat=args.repeat)
+        sniffed = measure(lambda: csv_parser.read_csv(content), repeat=args.repeat)
+        results.append(
+            {
+                "encoding": encoding,
+                "layout": "late-korean" if late_korean else "korean",
+                "size_mb": round(len(content) / 1024 / 1024, 2),
+                "detected": detect_encoding(content),
+                "detect_s": detect["median"],
+                "legacy_s": legacy["median"],
+                "sniffed_s": sniffed["median"],
+                "speedup": legacy["median"] / sniffed["median"],
+            }
+        )
+
+    print_table(results, ["encoding", "layout", "size_mb", "detected", "detect_s", "legacy_s", "sniffed_s", "speedup"])
+    print(f"\nResults written to {write_results('encoding', results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
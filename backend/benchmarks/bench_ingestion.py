@@ -0,0 +1,205 @@
+"""
+Ingestion pipeline benchmark.
+
+Generates synthetic uploads (10k / 100k / 1M rows) in every supported column
+dialect and CSV encoding, plus XLSX, and measures:
+
+    read      ExcelParser.read_excel (file read + encoding + column mapping)
+    parse     ExcelParser.parse_dataframe
+    e2e       PerformanceDataImporter.import_file into a throwaway SQLite DB
+    scalar    normalize_date / to_decimal per value, over mixed input formats
+
+Usage:
+    python benchmarks/bench_ingestion.py
+    python benchmarks/bench_ingestion.py --rows 10000 100000 --repeat 3
+    python benchmarks/bench_ingestion.py --compare benchmarks/results/ingestion-abc1234.json
+"""
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from _common import compare_results, measure, print_table, setup_django, write_results
+
+DEPARTMENTS = ["컴퓨터공학과", "전자공학과", "기계공학과", "경영학과", "국어국문학과", "물리학과", "화학과", "건축학과"]
+
+# Column dialects seen in real uploads: name -> (encodings to test, frame builder)
+DIALECT_ENCODINGS = {
+    "standard": ["utf-8", "utf-8-sig", "cp949"],
+    "english": ["utf-8"],
+    "kpi": ["utf-8", "cp949"],
+    "publication": ["utf-8", "cp949"],
+    "project": ["utf-8", "cp949"],
+}
+
+RESULT_KEYS = ["kind", "dialect", "format", "encoding", "rows"]
+RESULT_METRICS = ["read_s", "parse_s", "e2e_s", "ns_per_value"]
+
+
+def make_frame(dialect: str, rows: int, seed: int = 42) -> pd.DataFrame:
+    """Build a synthetic upload in the given column dialect."""
+    rng = np.random.default_rng(seed)
+    months = rng.integers(1, 13, rows)
+    departments = np.array(DEPARTMENTS)[rng.integers(0, len(DEPARTMENTS), rows)]
+    amounts = rng.integers(0, 10**9, rows)
+
+    if dialect == "standard":
+        return pd.DataFrame(
+            {
+                "기준년월": [f"2024-{m:02d}" for m in months],
+                "부서명": departments,
+                "부서코드": [f"{i % 1000:03d}" for i in range(rows)],
+                "매출액": [f"{a:,}" for a in amounts],
+                "예산": rng.integers(0, 10**9, rows),
+                "지출액": rng.integers(0, 10**9, rows),
+                "논문수": rng.integers(0, 50, rows),
+                "특허수": rng.integers(0, 10, rows),
+                "과제수": rng.integers(0, 20, rows),
+            }
+        )
+    if dialect == "english":
+        return pd.DataFrame(
+            {
+                "reference_date": 202400 + months,
+                "department": departments,
+                "revenue": amounts,
+                "budget": rng.integers(0, 10**9, rows),
+                "paper_count": rng.integers(0, 50, rows),
+            }
+        )
+    if dialect == "kpi":
+        return pd.DataFrame(
+            {
+                "평가년도": [f"2024.{m}" for m in months],
+                "단과대학": departments,
+                "연간 기술이전 수입액 (억원)": rng.random(rows).round(2) * 10,
+                "국제학술대회 개최 횟수": rng.integers(0, 5, rows),
+            }
+        )
+    if dialect == "publication":
+        return pd.DataFrame(
+            {
+                "게재일": [f"2024-{m:02d}-{d:02d}" for m, d in zip(months, rng.integers(1, 29, rows))],
+                "학과": departments,
+                "논문제목": "딥러닝 기반 연구",
+                "논문": 1,
+            }
+        )
+    if dialect == "project":
+        return pd.DataFrame(
+            {
+                "집행일자": [f"2024/{m}/15" for m in months],
+                "소속학과": departments,
+                "총연구비": amounts,
+                "집행금액": [f"{a // 3:,}" for a in amounts],
+            }
+        )
+    raise ValueError(f"unknown dialect: {dialect}")
+
+
+def make_inputs(rows: int, xlsx_max_rows: int):
+    """Yield (dialect, format, encoding, filename, content) for one scale."""
+    for dialect, encodings in DIALECT_ENCODINGS.items():
+        df = make_frame(dialect, rows)
+        csv_text = df.to_csv(index=False)
+        for encoding in encodings:
+            yield dialect, "csv", encoding, "bench.csv", csv_text.encode(encoding)
+        if rows <= xlsx_max_rows:
+            with tempfile.TemporaryFile() as buffer:
+                df.to_excel(buffer, index=False)
+                buffer.seek(0)
+                yield dialect, "xlsx", "-", "bench.xlsx", buffer.read()
+
+
+def scalar_inputs(count: int) -> tuple[list, list]:
+    """Mixed-format values for normalize_date / to_decimal."""
+    rng = np.random.default_rng(7)
+    date_formats = ["2024-{m:02d}", "2024.{m}", "2024/{m}", "2024{m:02d}", "2024. {m}", "2024-{m:02d}-15"]
+    dates = [date_formats[i % len(date_formats)].format(m=int(m)) for i, m in enumerate(rng.integers(1, 13, count))]
+    numbers = [f"{int(v):,}" if i % 3 == 0 else (str(v) if i % 3 == 1 else float(v)) for i, v in enumerate(rng.random(count) * 10**7)]
+    return dates, numbers
+
+
+def configure_sqlite(db_dir: str) -> None:
+    """Point Django at a throwaway SQLite database before setup."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{Path(db_dir) / 'bench.sqlite3'}"
+    os.environ.setdefault("DEBUG", "False")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--xlsx-max-rows", type=int, default=100_000, help="skip XLSX above this size (openpyxl is slow to write)")
+    parser.add_argument("--dialects", nargs="+", default=list(DIALECT_ENCODINGS), choices=list(DIALECT_ENCODINGS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-e2e", action="store_true", help="skip the end-to-end SQLite import")
+    parser.add_argument("--output", default="")
+    parser.add_argument("--compare", default="", help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        configure_sqlite(db_dir)
+        setup_django()
+        from django.core.management import call_command
+
+        from api.services.excel_parser import ExcelParser
+        from api.services.ingestion import PerformanceDataImporter
+
+        call_command("migrate", verbosity=0)
+        excel_parser = ExcelParser()
+        importer = PerformanceDataImporter(parser=excel_parser)
+        results = []
+
+        for rows in args.rows:
+            repeat = args.repeat if rows < 1_000_000 else 1
+            for dialect, fmt, encoding, filename, content in make_inputs(rows, args.xlsx_max_rows):
+                if dialect not in args.dialects:
+                    continue
+                df = excel_parser.read_excel(content, filename=filename)
+                read = measure(lambda: excel_parser.read_excel(content, filename=filename), repeat=repeat, warmup=0)
+                parse = measure(lambda: excel_parser.parse_dataframe(df), repeat=repeat, warmup=0)
+                row = {
+                    "kind": "pipeline",
+                    "dialect": dialect,
+                    "format": fmt,
+                    "encoding": encoding,
+                    "rows": rows,
+                    "size_mb": round(len(content) / 1024 / 1024, 2),
+                    "read_s": read["median"],
+                    "parse_s": parse["median"],
+                }
+                if not args.no_e2e:
+                    e2e = measure(lambda: importer.import_file(content, filename=filename), repeat=repeat, warmup=0)
+                    row["e2e_s"] = e2e["median"]
+                    row["rows_per_s"] = round(rows / e2e["median"])
+                results.append(row)
+                print(f"  {dialect:<12} {fmt:<5} {encoding:<10} {rows:>9,} rows  done", flush=True)
+
+            dates, numbers = scalar_inputs(rows)
+            for name, func, values in (
+                ("normalize_date", ExcelParser.normalize_date, dates),
+                ("to_decimal", ExcelParser.to_decimal, numbers),
+            ):
+                timing = measure(lambda: [func(value) for value in values], repeat=repeat, warmup=0)
+                results.append(
+                    {
+                        "kind": name,
+                        "dialect": "mixed",
+                        "format": "-",
+                        "encoding": "-",
+                        "rows": rows,
+                        "ns_per_value": timing["median"] / len(values) * 1e9,
+                    }
+                )
+
+    print_table(results, RESULT_KEYS + ["size_mb"] + RESULT_METRICS + ["rows_per_s"])
+    print(f"\nResults written to {write_results('ingestion', results, args.output)}")
+    if args.compare:
+        compare_results(results, args.compare, RESULT_KEYS, RESULT_METRICS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+"""
+Read API load benchmark.
+
+Seeds PerformanceData and StudentRoster at several scales, starts gunicorn
+against that database and drives the read endpoints with a local concurrent
+HTTP client, reporting p50/p95/p99 latency and throughput:
+
+    summary    /api/summary/ with a matrix of filters
+    data       /api/data/ first, middle and last page (deep pagination)
+    students   /api/students/ icontains searches
+
+Seeded SQLite databases are cached in benchmarks/.data/ and reused between
+runs (--reseed rebuilds them).
+
+Usage:
+    python benchmarks/bench_read_api.py
+    python benchmarks/bench_read_api.py --scales 10000 1000000 5000000 --concurrency 1 8 --requests 500
+    python benchmarks/bench_read_api.py --compare benchmarks/results/read_api-abc1234.json
+"""
+
+import argparse
+import os
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional
+
+from _common import BACKEND_DIR, compare_results, print_table, setup_django, write_results
+
+DATA_DIR = BACKEND_DIR / "benchmarks" / ".data"
+PAGE_SIZE = 100  # REST_FRAMEWORK["PAGE_SIZE"]
+SEED_BATCH = 50_000
+BENCH_USER = "bench"
+
+COLLEGES = {
+    "공과대학": ["컴퓨터공학과", "전자공학과", "기계공학과", "화학공학과", "건축학과"],
+    "자연과학대학": ["물리학과", "화학과", "수학과", "생명과학과"],
+    "경영대학": ["경영학과", "회계학과", "경제학과"],
+    "인문대학": ["국어국문학과", "영어영문학과", "사학과", "철학과"],
+    "사회과학대학": ["행정학과", "사회학과", "심리학과", "정치외교학과"],
+}
+DEPARTMENTS = [dept for depts in COLLEGES.values() for dept in depts]
+DEPT_COLLEGE = {dept: college for college, depts in COLLEGES.items() for dept in depts}
+MONTHS = [f"{year}-{month:02d}" for year in (2023, 2024) for month in range(1, 13)]
+
+RESULT_KEYS = ["scale", "endpoint", "scenario", "concurrency"]
+RESULT_METRICS = ["p50_ms", "p95_ms", "p99_ms"]
+
+
+# ----------------------------------------------------------------------------
+# Seeding
+# ----------------------------------------------------------------------------
+
+
+def seed(scale: int) -> None:
+    """Replace both tables with `scale` synthetic rows each (raw batched inserts)."""
+    from django.db import connection, transaction
+
+    from api.models import DatasetVersion, PerformanceData, StudentRoster
+    from api.services.aggregates import refresh_aggregates
+
+    rng = random.Random(scale)
+    now = datetime.now(timezone.utc)
+
+    with transaction.atomic():
+        PerformanceData.objects.all().delete()
+        DatasetVersion.objects.all().delete()
+        StudentRoster.objects.all().delete()
+        _insert(
+            connection,
+            PerformanceData,
+            ["reference_date", "department", "department_code", "revenue", "budget", "expenditure",
+             "paper_count", "patent_count", "project_count", "extra_text", "created_at", "updated_at"],
+            (
+                (
+                    MONTHS[i % len(MONTHS)],
+                    DEPARTMENTS[(i // len(MONTHS)) % len(DEPARTMENTS)],
+                    f"{(i // len(MONTHS)) % len(DEPARTMENTS):03d}",
+                    rng.randint(0, 10**9),
+                    rng.randint(0, 10**9),
+                    rng.randint(0, 10**9),
+                    rng.randint(0, 50),
+                    rng.randint(0, 10),
+                    rng.randint(0, 20),
+                    "",
+                    now,
+                    now,
+                )
+                for i in range(scale)
+            ),
+        )
+        _insert(
+            connection,
+            StudentRoster,
+            ["student_id", "name", "college", "department", "grade", "program_type", "enrollment_status",
+             "gender", "admission_year", "advisor", "email", "created_at", "updated_at"],
+            (
+                (
+                    f"S{i:09d}",
+                    f"학생{i}",
+                    DEPT_COLLEGE[dept],
+                    dept,
+                    rng.randint(1, 4),
+                    rng.choice(["학사", "학사", "학사", "석사", "박사"]),
+                    rng.choice(["재학", "재학", "휴학", "졸업"]),
+                    rng.choice(["남", "여"]),
+                    rng.randint(2015, 2024),
+                    "",
+                    "",
+                    now,
+                    now,
+                )
+                for i, dept in ((i, DEPARTMENTS[i % len(DEPARTMENTS)]) for i in range(scale))
+            ),
+        )
+        # Raw inserts bypass the upload path: rebuild the summary aggregates
+        refresh_aggregates()
+
+
+def _insert(connection, model, columns: list[str], rows) -> None:
+    table = connection.ops.quote_name(model._meta.db_table)
+    names = ", ".join(connection.ops.quote_name(model._meta.get_field(col).column) for col in columns)
+    sql = f"INSERT INTO {table} ({names}) VALUES ({', '.join(['%s'] * len(columns))})"
+    batch = []
+    with connection.cursor() as cursor:
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= SEED_BATCH:
+                cursor.executemany(sql, batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+
+
+def bench_token() -> str:
+    from django.contrib.auth.models import User
+    from rest_framework.authtoken.models import Token
+
+    user, _ = User.objects.get_or_create(username=BENCH_USER)
+    token, _ = Token.objects.get_or_create(user=user)
+    return token.key
+
+
+# ----------------------------------------------------------------------------
+# Server and HTTP driver
+# ----------------------------------------------------------------------------
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class GunicornServer:
+    """gunicorn subprocess serving the benchmark database."""
+
+    def __init__(
+        self,
+        database_url: str,
+        workers: int,
+        app: str = "config.wsgi:application",
+        worker_class: str = "sync",
+        env: Optional[dict] = None,
+    ):
+        self.app = app
+        self.port = free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self.metrics_dir = tempfile.mkdtemp(prefix="bench-prom-")
+        self.env = {
+            **os.environ,
+            "DATABASE_URL": database_url,
+            "DEBUG": "False",
+            "GUNICORN_BIND": f"127.0.0.1:{self.port}",
+            "GUNICORN_WORKERS": str(workers),
+            "GUNICORN_WORKER_CLASS": worker_class,
+            "PROMETHEUS_MULTIPROC_DIR": self.metrics_dir,
+            **(env or {}),
+        }
+        self.process = None
+
+    def __enter__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", self.app, "-c", "gunicorn.conf.py"],
+            cwd=BACKEND_DIR,
+            env=self.env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                urllib.request.urlopen(f"{self.base_url}/api/metrics", timeout=10).read()
+                return self
+            except urllib.error.HTTPError:
+                # Any response means the server is up (metrics are 403 without a token)
+                return self
+            except OSError:  # URLError, refused or timed out
+                if self.process.poll() is not None:
+                    raise RuntimeError("gunicorn exited during startup")
+                time.sleep(0.2)
+        raise RuntimeError("gunicorn did not start within 30s")
+
+    def __exit__(self, *exc_info):
+        self.process.terminate()
+        self.process.wait(timeout=30)
+        shutil.rmtree(self.metrics_dir, ignore_errors=True)
+        return False
+
+
+def run_load(base_url: str, path: str, token: str, concurrency: int, requests: int) -> dict:
+    """Issue `requests` GETs from `concurrency` threads; return latency percentiles and throughput."""
+    headers = {"Authorization": f"Token {token}", "Accept": "application/json"}
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def one(_):
+        nonlocal errors
+        request = urllib.request.Request(base_url + path, headers=headers)
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=120) as response:
+                response.read()
+            ok = True
+        except OSError:
+            ok = False
+        elapsed = time.perf_counter() - start
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+
+    one(None)  # warm the worker's caches and connections
+    latencies.clear()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(requests)))
+    wall = time.perf_counter() - started
+
+    if len(latencies) < 2:
+        return {"errors": errors}
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "p50_ms": cuts[49] * 1000,
+        "p95_ms": cuts[94] * 1000,
+        "p99_ms": cuts[98] * 1000,
+        "rps": len(latencies) / wall,
+        "errors": errors,
+    }
+
+
+def scenarios(scale: int) -> list[tuple[str, str, str]]:
+    """(endpoint, scenario, path) matrix for one scale."""
+    last_page = max(1, -(-scale // PAGE_SIZE))
+    month = MONTHS[-1]
+    quote = urllib.parse.quote
+    return [
+        ("summary", "all", "/api/summary/"),
+        ("summary", "month", f"/api/summary/?reference_date={month}"),
+        ("summary", "range", "/api/summary/?start_date=2024-01&end_date=2024-06"),
+        ("summary", "departments", f"/api/summary/?departments={quote('컴퓨터공학과,전자공학과')}"),
+        ("summary", "range+departments",
+         f"/api/summary/?start_date=2024-01&end_date=2024-12&departments={quote('경영학과,물리학과,사학과')}"),
+        ("data", "page-first", "/api/data/?page=1"),
+        ("data", "page-middle", f"/api/data/?page={max(1, last_page // 2)}"),
+        ("data", "page-last", f"/api/data/?page={last_page}"),
+        ("data", "month-page-last",
+         f"/api/data/?reference_date={month}&page={max(1, -(-(scale // len(MONTHS)) // PAGE_SIZE))}"),
+        ("students", "department-icontains", f"/api/students/?department={quote('공학')}"),
+        ("students", "college-icontains", f"/api/students/?college={quote('과학')}"),
+        ("students", "icontains+status", f"/api/students/?department={quote('학과')}&enrollment_status={quote('재학')}"),
+    ]
+
+
+def prepare_database(scale: int, database_url: str = "", reseed: bool = False) -> tuple[str, str]:
+    """Seed (or reuse the cached) database for one scale; return (database_url, API token)."""
+    if database_url:
+        needs_seed = True
+    else:
+        db_path = DATA_DIR / f"read_api-{scale}.sqlite3"
+        if reseed:
+            db_path.unlink(missing_ok=True)
+        database_url, needs_seed = f"sqlite:///{db_path}", not db_path.exists()
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Seed in a child process: settings read DATABASE_URL once at import time
+    subprocess.run(
+        [sys.executable, __file__, "--_seed", str(scale), "--_seed-needed", str(int(needs_seed))],
+        env={**os.environ, "DATABASE_URL": database_url, "DEBUG": "False"},
+        check=True,
+    )
+    return database_url, (DATA_DIR / ".token").read_text().strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario and concurrency level")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers")
+    parser.add_argument("--endpoints", nargs="+", default=["summary", "data", "students"])
+    parser.add_argument(
+        "--database-url",
+        default="",
+        help="benchmark against this database instead of cached SQLite files (its tables are replaced!)",
+    )
+    parser.add_argument("--reseed", action="store_true", help="rebuild cached SQLite databases")
+    parser.add_argument("--output", default="")
+    parser.add_argument("--compare", default="", help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    results = []
+    for scale in args.scales:
+        database_url, token = prepare_database(scale, args.database_url, args.reseed)
+
+        with GunicornServer(database_url, args.workers) as server:
+            for endpoint, scenario, path in scenarios(scale):
+                if endpoint not in args.endpoints:
+                    continue
+                for concurrency in args.concurrency:
+                    stats = run_load(server.base_url, path, token, concurrency, args.requests)
+                    results.append(
+                        {"scale": scale, "endpoint": endpoint, "scenario": scenario, "concurrency": concurrency, **stats}
+                    )
+                    print(f"  {scale:>9,} {endpoint:<9} {scenario:<22} c={concurrency:<3} done", flush=True)
+
+    print_table(results, RESULT_KEYS + RESULT_METRICS + ["rps", "errors"])
+    print(f"\nResults written to {write_results('read_api', results, args.output)}")
+    if args.compare:
+        compare_results(results, args.compare, RESULT_KEYS, RESULT_METRICS)
+
+
+def seed_main(scale: int, needed: bool) -> None:
+    """Child-process entry point: migrate, seed if needed, store the API token."""
+    setup_django()
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+    if needed:
+        started = time.perf_counter()
+        seed(scale)
+        print(f"  seeded {scale:,} rows per table in {time.perf_counter() - started:.1f}s", flush=True)
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    (DATA_DIR / ".token").write_text(bench_token())
+
+
+if __name__ == "__main__":
+    if "--_seed" in sys.argv:
+        seed_main(int(sys.argv[sys.argv.index("--_seed") + 1]), sys.argv[sys.argv.index("--_seed-needed") + 1] == "1")
+    else:
+        main()
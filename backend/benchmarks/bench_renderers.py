@@ -0,0 +1,141 @@
+"""
+Response renderer benchmark.
+
+Renders the same API payloads with DRF's JSONRenderer (the previous
+default), ORJSONRenderer and MessagePackRenderer (api/renderers.py) and
+reports render time and body size:
+
+    summary     /api/summary/ payload (Decimal totals, trend, ranking)
+    page        one /api/data/ page (PAGE_SIZE serialized rows)
+    bulk        a 10,000-row export-sized list
+
+Payloads are built in memory (no database needed).
+
+Usage:
+    python benchmarks/bench_renderers.py
+    python benchmarks/bench_renderers.py --repeat 50 --bulk-rows 50000
+    python benchmarks/bench_renderers.py --compare benchmarks/results/renderers-abc1234.json
+"""
+
+import argparse
+import random
+from decimal import Decimal
+
+from _common import compare_results, measure, print_table, setup_django, write_results
+
+DEPARTMENTS = [f"{name}{i}" for i in range(6) for name in ("컴퓨터공학과", "경영학과", "물리학과", "사학과", "전자공학과")]
+MONTHS = [f"{year}-{month:02d}" for year in (2023, 2024) for month in range(1, 13)]
+PAGE_SIZE = 100
+
+RESULT_KEYS = ["payload", "renderer"]
+RESULT_METRICS = ["median_ms"]
+
+
+def summary_payload() -> dict:
+    from api.services.aggregates import department_ranking
+    from api.services.timeseries import PrefixSumStore
+
+    rng = random.Random(42)
+    rows = [
+        (
+            month,
+            department,
+            Decimal(rng.randint(0, 10**11)) / 100,
+            Decimal(rng.randint(0, 10**11)) / 100,
+            Decimal(rng.randint(0, 10**11)) / 100,
+            rng.randint(0, 50),
+            rng.randint(0, 10),
+            rng.randint(0, 20),
+            rng.randint(1, 30),
+        )
+        for month in MONTHS
+        for department in DEPARTMENTS
+    ]
+    store = PrefixSumStore.from_stats("bench", rows)
+    lo, hi = store.month_bounds(None, None, None)
+    all_rows = store.department_rows([])
+    return {
+        "summary": store.summary(lo, hi, all_rows),
+        "monthly_trend": store.monthly_trend(lo, hi, all_rows),
+        "department_ranking": department_ranking(store=store),
+        "reference_dates": MONTHS,
+    }
+
+
+def rows_payload(count: int) -> list:
+    from api.models import PerformanceData
+    from api.serializers import PerformanceDataSerializer
+
+    rng = random.Random(7)
+    objects = [
+        PerformanceData(
+            id=i,
+            reference_date=rng.choice(MONTHS),
+            department=rng.choice(DEPARTMENTS),
+            department_code=f"{i % 1000:03d}",
+            revenue=Decimal(rng.randint(0, 10**11)) / 100,
+            budget=Decimal(rng.randint(0, 10**11)) / 100,
+            expenditure=Decimal(rng.randint(0, 10**11)) / 100,
+            paper_count=rng.randint(0, 50),
+            patent_count=rng.randint(0, 10),
+            project_count=rng.randint(0, 20),
+        )
+        for i in range(count)
+    ]
+    return PerformanceDataSerializer(objects, many=True).data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--bulk-rows", type=int, default=10_000)
+    parser.add_argument("--output", default="")
+    parser.add_argument("--compare", default="", help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+
+    from api.renderers import MessagePackRenderer, ORJSONRenderer, msgpack, orjson
+
+    renderers = {"drf-json": JSONRenderer()}
+    if orjson is not None:
+        renderers["orjson"] = ORJSONRenderer()
+    if msgpack is not None:
+        renderers["msgpack"] = MessagePackRenderer()
+    missing = {"orjson", "msgpack"} - renderers.keys()
+    if missing:
+        print(f"Not installed, skipped: {', '.join(sorted(missing))}")
+
+    payloads = {
+        "summary": summary_payload(),
+        "page": {"count": args.bulk_rows, "next": None, "previous": None, "results": rows_payload(PAGE_SIZE)},
+        "bulk": rows_payload(args.bulk_rows),
+    }
+
+    results = []
+    for payload_name, data in payloads.items():
+        baseline = None
+        for renderer_name, renderer in renderers.items():
+            stats = measure(lambda: renderer.render(data), repeat=args.repeat)
+            median_ms = stats["median"] * 1000
+            baseline = baseline or median_ms
+            results.append(
+                {
+                    "payload": payload_name,
+                    "renderer": renderer_name,
+                    "median_ms": median_ms,
+                    "min_ms": stats["min"] * 1000,
+                    "bytes": len(renderer.render(data)),
+                    "speedup": baseline / median_ms,
+                }
+            )
+
+    print_table(results, RESULT_KEYS + ["median_ms", "min_ms", "bytes", "speedup"])
+    print(f"\nResults written to {write_results('renderers', results, args.output)}")
+    if args.compare:
+        compare_results(results, args.compare, RESULT_KEYS, RESULT_METRICS)
+
+
+if __name__ == "__main__":
+    main()
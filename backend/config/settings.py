@@ -7,11 +7,12 @@ Django settings for data visualization dashboard project.
 - Django Native Auth (Token/Session)
 """
 
+import importlib.util
 import os
 import sys
 from pathlib import Path
 
-import dj_database_url
+from api.db.config import database_config
 
 # Testing mode detection
 TESTING = "test" in sys.argv or "pytest" in sys.modules
@@ -53,12 +54,15 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",  # Whitenoise (정적 파일)
+    "api.middleware.AsyncCapableWhiteNoiseMiddleware",  # Whitenoise (정적 파일, ASGI 겸용)
+    "api.middleware.ResponseCompressionMiddleware",  # API/페이지 응답 brotli/gzip 압축 (정적 파일은 Whitenoise)
+    "api.middleware.PerformanceMonitoringMiddleware",  # 요청 성능 계측 (Server-Timing, 구조화 로그)
     "corsheaders.middleware.CorsMiddleware",  # CORS
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "api.middleware.ReplicaRoutingMiddleware",  # 읽기 복제본 라우팅 (DATABASE_REPLICA_URL)
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -89,18 +93,60 @@ WSGI_APPLICATION = "config.wsgi.application"
 
 DATABASE_URL = os.environ.get("DATABASE_URL")
 
+# DB 연결 재사용 (요청마다 접속/TLS 비용 방지, api.db.config)
+# - PostgreSQL + psycopg3(psycopg_pool): 워커 프로세스별 연결 풀 (DB_POOL_* 설정)
+# - 그 외 또는 DB_POOL=False: 지속 연결 (DB_CONN_MAX_AGE초) + 재사용 전 상태 확인
+# - 풀 크기는 워커당 값이므로 전체 연결 수 = GUNICORN_WORKERS x DB_POOL_MAX_SIZE
+DB_POOL_ENABLED = os.environ.get("DB_POOL", "True").lower() in ("true", "1", "yes")
+DB_POOL_OPTIONS = {
+    "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+    "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+    "max_idle": float(os.environ.get("DB_POOL_MAX_IDLE", 300)),  # 유휴 연결 정리 (초)
+    "max_lifetime": float(os.environ.get("DB_POOL_MAX_LIFETIME", 1800)),  # 연결 교체 주기 (초)
+    "timeout": float(os.environ.get("DB_POOL_TIMEOUT", 10)),  # 풀 대기 최대 시간 (초)
+}
+DB_CONN_MAX_AGE = int(os.environ.get("DB_CONN_MAX_AGE", 60))
+
 if DATABASE_URL:
     # Supabase/Railway 환경
-    DATABASES = {"default": dj_database_url.parse(DATABASE_URL)}
+    DATABASES = {
+        "default": database_config(
+            DATABASE_URL, pool_options=DB_POOL_OPTIONS if DB_POOL_ENABLED else None, conn_max_age=DB_CONN_MAX_AGE
+        )
+    }
 else:
     # 로컬 개발 환경 (SQLite)
     DATABASES = {
         "default": {
-            "ENGINE": "django.db.backends.sqlite3",
+            "ENGINE": "api.db.backends.sqlite3",
             "NAME": BASE_DIR / "db.sqlite3",
         }
     }
 
+# 읽기 복제본 (선택, api.db.routers)
+# - 요약/목록 등 조회 API의 GET 쿼리를 복제본으로, 쓰기와 그 외 조회는 기본 DB로
+# - 사용자가 데이터를 변경하면 REPLICA_STICKY_SECONDS 동안 그 사용자의 조회는 기본 DB (복제 지연 대비)
+DATABASE_REPLICA_URL = os.environ.get("DATABASE_REPLICA_URL")
+REPLICA_STICKY_SECONDS = int(os.environ.get("REPLICA_STICKY_SECONDS", 10))
+DATABASE_ROUTERS = []
+
+if DATABASE_REPLICA_URL:
+    DATABASES["replica"] = {
+        **database_config(
+            DATABASE_REPLICA_URL,
+            pool_options=DB_POOL_OPTIONS if DB_POOL_ENABLED else None,
+            conn_max_age=DB_CONN_MAX_AGE,
+        ),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_ROUTERS = ["api.db.routers.ReadReplicaRouter"]
+
+# 실적 데이터 파티셔닝 (선택, PostgreSQL 전용, api.services.partitions)
+# - "year" 또는 "month": 실적 테이블을 기준 년월 범위 파티션으로 분할 (마이그레이션 0007에서 변환)
+# - 기간 조회와 이전 버전 정리(월 단위 삭제)는 해당 파티션만 스캔
+# - 이미 마이그레이션한 DB에서 값을 바꾸면 `python manage.py partition_performance_data`로 변환
+PERFORMANCE_DATA_PARTITIONING = os.environ.get("PERFORMANCE_DATA_PARTITIONING", "").strip().lower()
+
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -133,6 +179,53 @@ STATICFILES_DIRS = [
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 WHITENOISE_ROOT = BASE_DIR / "staticfiles"
 
+# React index.html 메모리 캐시 재검증 주기(초): 이 간격마다 파일 수정 시각 확인 (config/spa.py)
+SPA_INDEX_CHECK_INTERVAL = float(os.environ.get("SPA_INDEX_CHECK_INTERVAL", "0" if DEBUG else "2"))
+
+# 응답 압축 (api.middleware.ResponseCompressionMiddleware)
+# - 동적 응답은 요청마다 압축하므로 낮은 레벨이 CPU 대비 효율적 (benchmarks/bench_compression.py)
+RESPONSE_COMPRESSION_MIN_SIZE = int(os.environ.get("RESPONSE_COMPRESSION_MIN_SIZE", 1024))  # 바이트
+RESPONSE_COMPRESSION_GZIP_LEVEL = int(os.environ.get("RESPONSE_COMPRESSION_GZIP_LEVEL", 6))  # 1-9
+RESPONSE_COMPRESSION_BROTLI_QUALITY = int(os.environ.get("RESPONSE_COMPRESSION_BROTLI_QUALITY", 4))  # 0-11
+# 이미 압축된 형식 (Content-Type 접두사)
+RESPONSE_COMPRESSION_EXCLUDED_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.",  # xlsx 등 (zip 컨테이너)
+    "text/event-stream",
+)
+
+
+# 분할(Chunked) 업로드 설정
+CHUNKED_UPLOAD_DIR = Path(os.environ.get("CHUNKED_UPLOAD_DIR", BASE_DIR / "upload_chunks"))
+CHUNKED_UPLOAD_CHUNK_SIZE = int(os.environ.get("CHUNKED_UPLOAD_CHUNK_SIZE", 5 * 1024 * 1024))  # 권장 청크 크기
+CHUNKED_UPLOAD_MAX_CHUNK_SIZE = int(os.environ.get("CHUNKED_UPLOAD_MAX_CHUNK_SIZE", 32 * 1024 * 1024))
+CHUNKED_UPLOAD_MAX_SIZE = int(os.environ.get("CHUNKED_UPLOAD_MAX_SIZE", 1024 * 1024 * 1024))  # 1GB
+CHUNKED_UPLOAD_EXPIRY = int(os.environ.get("CHUNKED_UPLOAD_EXPIRY", 86400))  # 방치된 세션 삭제 기준 (초, clean_chunked_uploads)
+# finalize 중(processing) 세션 삭제 기준 (초) - 가져오기가 끝난 뒤에도 남은 세션(워커 비정상 종료)만 정리
+CHUNKED_UPLOAD_PROCESSING_EXPIRY = int(os.environ.get("CHUNKED_UPLOAD_PROCESSING_EXPIRY", 7 * 86400))
+
+# 다중 시트 워크북 병렬 파싱 설정
+UPLOAD_SHEET_WORKERS = int(os.environ.get("UPLOAD_SHEET_WORKERS", 3))  # 시트 파싱 프로세스 수 (1이면 순차 처리)
+UPLOAD_PARALLEL_SHEETS_MIN_BYTES = int(os.environ.get("UPLOAD_PARALLEL_SHEETS_MIN_BYTES", 2 * 1024 * 1024))
+
+# 업로드 cProfile 리포트 (UploadLog.profile_report에 저장, 처리 속도가 느려지므로 진단 시에만 사용)
+UPLOAD_PROFILING_ENABLED = os.environ.get("UPLOAD_PROFILING_ENABLED", "False").lower() in ("true", "1", "yes")
+
+# 데이터 버전 (api.services.versions)
+# - 업로드는 새 버전으로 행을 넣은 뒤 활성 버전만 전환 (조회는 대기 없이 기존 버전을 계속 사용)
+# - 이전 버전은 월별 DATASET_VERSION_RETENTION개까지 롤백용으로 보관, 나머지는 collect_dataset_versions 명령(cron)으로 삭제
+# - DATASET_VERSION_GC_ON_UPLOAD=True이면 업로드 커밋 후 워커의 백그라운드 스레드에서 삭제 (SQLite에서는 쓰기 잠금 경합)
+DATASET_VERSION_RETENTION = int(os.environ.get("DATASET_VERSION_RETENTION", 1))
+DATASET_VERSION_PENDING_TTL = int(os.environ.get("DATASET_VERSION_PENDING_TTL", 86400))  # 중단된 업로드 정리 기준 (초)
+DATASET_VERSION_GC_ON_UPLOAD = os.environ.get("DATASET_VERSION_GC_ON_UPLOAD", "False").lower() in ("true", "1", "yes")
+
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -149,6 +242,12 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 100,
+    # orjson 기반 JSON (미설치 시 DRF 인코더), msgpack 설치 시 Accept: application/msgpack 지원
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.ORJSONRenderer",
+        *(["api.renderers.MessagePackRenderer"] if importlib.util.find_spec("msgpack") else []),
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 }
 
 
@@ -210,9 +309,31 @@ LOGGING = {
             "level": os.environ.get("DJANGO_LOG_LEVEL", "INFO"),
             "propagate": False,
         },
+        # 요청 성능 계측 로그 (api.middleware.PerformanceMonitoringMiddleware)
+        "api.performance": {
+            "handlers": ["console"],
+            "level": os.environ.get("PERF_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
     },
 }
 
+# 요청 성능 계측 설정
+# - 샘플링된 요청만 DB 쿼리/직렬화 시간을 측정 (프로덕션 기본 10%)
+# - 느린 요청은 샘플링과 무관하게 항상 WARNING 로그 기록
+PERF_MONITORING_SAMPLE_RATE = float(os.environ.get("PERF_MONITORING_SAMPLE_RATE", "1.0" if DEBUG else "0.1"))
+PERF_SLOW_REQUEST_MS = float(os.environ.get("PERF_SLOW_REQUEST_MS", 1000))
+
+# 배치 조회 (/api/batch/)
+BATCH_MAX_QUERIES = int(os.environ.get("BATCH_MAX_QUERIES", 10))  # 요청당 최대 하위 조회 수
+BATCH_MAX_WORKERS = int(os.environ.get("BATCH_MAX_WORKERS", 4))  # 동시 실행 스레드 (DB 연결 풀이 없으면 순차)
+
+# Prometheus 메트릭 (/api/metrics)
+# - gunicorn 다중 워커 집계: PROMETHEUS_MULTIPROC_DIR 환경변수 (gunicorn.conf.py에서 설정)
+# - 토큰 지정 시 스크레이퍼는 Authorization: Bearer <token> 헤더 필요
+# - 토큰이 없으면 DEBUG에서만 공개 (운영에서는 403)
+METRICS_AUTH_TOKEN = os.environ.get("METRICS_AUTH_TOKEN", "")
+
 
 # Session Cookie Security Settings
 SESSION_COOKIE_HTTPONLY = True
@@ -233,7 +354,8 @@ if TESTING:
     # Use in-memory SQLite for faster tests
     DATABASES = {
         "default": {
-            "ENGINE": "django.db.backends.sqlite3",
+            "ENGINE": "api.db.backends.sqlite3",
             "NAME": ":memory:",
         }
     }
+    DATABASE_ROUTERS = []
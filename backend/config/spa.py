@@ -0,0 +1,110 @@
+"""
+React SPA index (index.html) served from memory.
+
+The shell is read once per worker together with precomputed gzip (and
+brotli, when installed) variants and a content ETag. It is revalidated by
+the file's mtime/size at most every SPA_INDEX_CHECK_INTERVAL seconds, so a
+client-side route hit is a dict lookup plus an occasional stat().
+
+index.html references content-hashed assets, so it is sent with
+"Cache-Control: no-cache": browsers keep it but revalidate with the ETag
+and get a 304 until the next deploy.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+
+from api.compression import accepted_encoding, brotli
+
+CONTENT_TYPE = "text/html; charset=utf-8"
+
+
+@dataclass
+class IndexEntry:
+    """In-memory copy of index.html and its compressed variants."""
+
+    signature: tuple  # (mtime_ns, size) of the file when loaded
+    etag: str
+    last_modified: str
+    variants: dict[str, bytes] = field(default_factory=dict)  # "" (identity), "gzip", "br"
+    checked_at: float = 0.0
+
+    def etag_for(self, encoding: str) -> str:
+        return f'"{self.etag}-{encoding}"' if encoding else f'"{self.etag}"'
+
+    @classmethod
+    def load(cls, path: str, signature: tuple) -> "IndexEntry":
+        with open(path, "rb") as f:
+            content = f.read()
+        variants = {"": content, "gzip": gzip.compress(content, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants["br"] = brotli.compress(content, mode=brotli.MODE_TEXT)
+        return cls(
+            signature=signature,
+            etag=hashlib.sha256(content).hexdigest()[:20],
+            last_modified=http_date(signature[0] / 1e9),
+            variants=variants,
+            checked_at=time.monotonic(),
+        )
+
+
+_entries: dict[str, IndexEntry] = {}
+_lock = threading.Lock()
+
+
+def get_index(path: str) -> Optional[IndexEntry]:
+    """Cached index.html for path, reloaded when its mtime or size changes (None if missing)."""
+    entry = _entries.get(path)
+    now = time.monotonic()
+    if entry is not None and now - entry.checked_at < settings.SPA_INDEX_CHECK_INTERVAL:
+        return entry
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        _entries.pop(path, None)
+        return None
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if entry is not None and entry.signature == signature:
+        entry.checked_at = now
+        return entry
+
+    with _lock:
+        entry = _entries.get(path)
+        if entry is None or entry.signature != signature:
+            entry = IndexEntry.load(path, signature)
+            _entries[path] = entry
+        return entry
+
+
+def index_response(request, entry: IndexEntry) -> HttpResponse:
+    """304 when the client's copy is current, else the best-compressed variant."""
+    encoding = accepted_encoding(request.headers.get("Accept-Encoding", ""), entry.variants)
+    etag = entry.etag_for(encoding)
+    # Any variant's ETag means the client already has the current content
+    client_etags = {tag.strip().removeprefix("W/") for tag in request.headers.get("If-None-Match", "").split(",")}
+    if "*" in client_etags or client_etags & {entry.etag_for(variant) for variant in entry.variants}:
+        response = HttpResponseNotModified()
+    else:
+        body = entry.variants[encoding]
+        response = HttpResponse(body, content_type=CONTENT_TYPE)
+        response["Content-Length"] = str(len(body))
+        if encoding:
+            response["Content-Encoding"] = encoding
+
+    response["ETag"] = etag
+    response["Last-Modified"] = entry.last_modified
+    response["Cache-Control"] = "no-cache"
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
@@ -14,6 +14,8 @@ from django.http import HttpResponse
 from django.urls import include, path, re_path
 from django.views.static import serve
 
+from .spa import get_index, index_response
+
 
 def serve_react(request):
     """
@@ -21,13 +23,12 @@ def serve_react(request):
 
     - API가 아닌 모든 요청을 React로 라우팅
     - React Router가 클라이언트 사이드에서 라우팅 처리
+    - index.html은 워커별 메모리 캐시 (수정 시각으로 재검증, gzip/brotli, ETag)
     """
     # staticfiles 디렉토리에서 index.html 찾기
-    index_path = os.path.join(settings.STATICFILES_DIRS[0], "index.html")
-
-    if os.path.exists(index_path):
-        with open(index_path, "r", encoding="utf-8") as f:
-            return HttpResponse(f.read(), content_type="text/html")
+    entry = get_index(os.path.join(settings.STATICFILES_DIRS[0], "index.html"))
+    if entry is not None:
+        return index_response(request, entry)
 
     # 개발 모드에서 React 빌드가 없는 경우
     return HttpResponse(
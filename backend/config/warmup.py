@@ -0,0 +1,159 @@
+"""
+Pre-fork warmup for gunicorn with preload_app (see gunicorn.conf.py).
+
+The master process loads the application once, then warmup() imports the
+lazily loaded modules, builds the per-process caches and serves a few
+synthetic requests before any worker is forked. Workers inherit all of it
+copy-on-write, so their first real request runs at steady-state latency and
+the memory is shared instead of being rebuilt in every worker.
+
+Database connections and connection pools opened here are closed at the
+end: sockets and pool threads must not be shared across fork. Each worker
+then opens its own right after fork (connect_worker), before its first
+request arrives.
+"""
+
+import logging
+import os
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Served through the full middleware stack and URLconf (anonymous, with an unknown token)
+MIDDLEWARE_PATHS = ("/", "/api/summary/")
+# Served directly to the view as an authenticated (unsaved) user
+VIEW_PATHS = ("/api/summary/", "/api/facets/", "/api/data/", "/api/students/", "/api/periods/", "/api/logs/")
+
+
+def import_modules() -> None:
+    """Import the URLconf, views and the upload stack (pandas, openpyxl) loaded lazily by workers."""
+    from django.urls import get_resolver
+
+    # pylint: disable=import-outside-toplevel,unused-import
+    import api.services.excel_parser  # noqa: F401
+    import api.services.sheet_reader  # noqa: F401
+    import openpyxl  # noqa: F401
+
+    get_resolver().url_patterns  # pylint: disable=expression-not-assigned
+
+
+def compile_parser() -> None:
+    """Build the ExcelParser column resolver (mapping indexes and keyword patterns)."""
+    from api.services.excel_parser import ExcelParser  # pylint: disable=import-outside-toplevel
+
+    ExcelParser.get_column_resolver()
+
+
+def prime_summary_caches() -> None:
+    """Build the prefix-sum store and the facets for the current data version."""
+    # pylint: disable=import-outside-toplevel
+    from api.services.facets import get_facets
+    from api.services.timeseries import get_prefix_store
+
+    get_prefix_store()
+    get_facets()
+
+
+def load_spa_index() -> None:
+    from .spa import get_index  # pylint: disable=import-outside-toplevel
+
+    get_index(os.path.join(settings.STATICFILES_DIRS[0], "index.html"))
+
+
+def warmup_host() -> str:
+    """A Host header accepted by ALLOWED_HOSTS."""
+    for host in settings.ALLOWED_HOSTS:
+        if host and host != "*" and not host.startswith("."):
+            return host
+    return "localhost"
+
+
+def synthetic_requests() -> None:
+    """
+    Serve MIDDLEWARE_PATHS through the test client, which exercises the
+    middleware, URL resolution and token authentication, then call the views
+    for VIEW_PATHS as an unsaved user so the querysets, serializers and
+    renderers of the authenticated read path run once as well.
+    """
+    # pylint: disable=import-outside-toplevel
+    from django.contrib.auth.models import User
+    from django.test import Client
+    from django.urls import resolve
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    host = warmup_host()
+    client = Client(HTTP_HOST=host, HTTP_AUTHORIZATION="Token warmup")
+    for path in MIDDLEWARE_PATHS:
+        client.get(path)
+
+    factory = APIRequestFactory()
+    user = User(username="warmup")
+    for path in VIEW_PATHS:
+        match = resolve(path)
+        request = factory.get(path, HTTP_HOST=host)
+        force_authenticate(request, user=user)
+        response = match.func(request, *match.args, **match.kwargs)
+        response.render()
+
+
+def release_connections() -> None:
+    """Close every connection and pool opened by the master before workers fork."""
+    for connection in connections.all(initialized_only=True):
+        connection.close()
+        # PostgreSQL pools live in a class-level dict; the .pool property would create one
+        if connection.alias in getattr(connection, "_connection_pools", {}):
+            connection.close_pool()
+
+
+STEPS: list[tuple[str, Callable[[], None]]] = [
+    ("import_modules", import_modules),
+    ("compile_parser", compile_parser),
+    ("prime_summary_caches", prime_summary_caches),
+    ("load_spa_index", load_spa_index),
+    ("synthetic_requests", synthetic_requests),
+    ("release_connections", release_connections),
+]
+
+
+def connect_worker(open_connections: bool = True) -> None:
+    """
+    Open the worker's database connections (gunicorn post_fork).
+
+    A configured PostgreSQL pool is created and starts filling to min_size in
+    the background. Without a pool, open_connections opens a persistent
+    connection in the calling thread; only sync workers serve requests on
+    that thread, so other worker classes should pass False.
+    """
+    for alias in connections:
+        connection = connections[alias]
+        try:
+            if connection.settings_dict.get("OPTIONS", {}).get("pool"):
+                connection.pool  # pylint: disable=pointless-statement
+            elif open_connections and connection.settings_dict.get("CONN_MAX_AGE"):
+                connection.ensure_connection()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Could not connect database %s after fork", alias)
+
+
+def warmup() -> dict[str, float]:
+    """
+    Run every warmup step and return {step: seconds}.
+
+    A failing step (e.g. the database is not migrated yet) is logged and
+    skipped; workers then build that state on their first request as before.
+    """
+    timings = {}
+    for name, step in STEPS:
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Warmup step %s failed", name)
+            continue
+        timings[name] = round(time.perf_counter() - start, 4)
+    logger.info("Warmup finished: %s", timings)
+    return timings
@@ -4,8 +4,12 @@ Pytest configuration and fixtures for backend tests.
 - Factory patterns for test data generation
 - Django database fixtures
 - Timezone-aware fixtures
+- SPA index file and child-process environment helpers
 """
 
+import os
+from pathlib import Path
+
 import pytest
 from django.contrib.auth.models import User
 from django.utils import timezone
@@ -15,6 +19,22 @@ from factory.django import DjangoModelFactory
 
 from api.models import PerformanceData, UploadLog
 
+BACKEND_DIR = Path(__file__).resolve().parent
+
+INDEX_HTML = "<!doctype html><html><body><div id=root></div>" + "<script src=/assets/app.js></script>" * 20
+
+
+def subprocess_env(**overrides: str) -> dict[str, str]:
+    """
+    Environment for a child Python process that sets up Django.
+
+    The parent's PROMETHEUS_MULTIPROC_DIR is dropped so the child does not
+    write metric files into it.
+    """
+    env = {key: value for key, value in os.environ.items() if key != "PROMETHEUS_MULTIPROC_DIR"}
+    env.update(DJANGO_SETTINGS_MODULE="config.settings", **overrides)
+    return env
+
 
 # =============================================================================
 # Factory Definitions
@@ -141,3 +161,16 @@ def seoul_timezone():
 def now_seoul(seoul_timezone):
     """Return current time in Seoul timezone."""
     return timezone.now().astimezone(seoul_timezone)
+
+
+@pytest.fixture
+def index_file(tmp_path, settings):
+    """SPA index.html (INDEX_HTML) as the only static directory; the cached index is cleared afterwards."""
+    from config import spa
+
+    settings.STATICFILES_DIRS = [tmp_path]
+    settings.SPA_INDEX_CHECK_INTERVAL = 0
+    path = tmp_path / "index.html"
+    path.write_text(INDEX_HTML, encoding="utf-8")
+    yield path
+    spa._entries.clear()
@@ -0,0 +1,69 @@
+"""
+Gunicorn configuration
+
+Usage:
+    gunicorn config.wsgi:application -c gunicorn.conf.py
+
+    # ASGI (비동기 읽기 API /api/async/, docs/deployment.md)
+    GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker gunicorn config.asgi:application -c gunicorn.conf.py
+
+preload_app (기본값): 마스터가 앱을 한 번 로드하고 config.warmup으로 캐시를 채운 뒤 워커를 fork
+(워커는 copy-on-write로 공유, 첫 요청부터 정상 지연). GUNICORN_PRELOAD=False로 끌 수 있음
+"""
+
+import gc
+import glob
+import os
+import shutil
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", 2))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "sync")
+preload_app = os.environ.get("GUNICORN_PRELOAD", "True").lower() in ("true", "1", "yes")
+
+# Prometheus 다중 프로세스 메트릭 저장소 (워커별 파일을 /api/metrics에서 합산)
+# 워커가 prometheus_client를 import하기 전에 설정되어야 함
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus-multiproc")
+# preload 시 on_starting보다 앱 로드(메트릭 생성)가 먼저 실행됨
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+
+def on_starting(server):
+    # 이전 실행의 메트릭 파일 정리 (재시작 시 카운터 중복 방지)
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def when_ready(server):
+    # 워커 fork 직전 (마스터 프로세스)
+    if not server.cfg.preload_app:
+        return
+
+    from config.warmup import warmup  # pylint: disable=import-outside-toplevel
+
+    warmup()
+
+    # 워밍업 요청이 /api/metrics에 집계되지 않도록 마스터의 메트릭 파일 삭제
+    # (워커는 fork 후 자신의 pid로 새 파일을 만듦)
+    for path in glob.glob(os.path.join(os.environ["PROMETHEUS_MULTIPROC_DIR"], f"*_{os.getpid()}.db")):
+        os.remove(path)
+
+    # 지금까지 만든 객체를 GC 대상에서 제외: 워커의 GC가 공유 페이지를 건드려 복사되는 것을 방지
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # 워커별 DB 연결/연결 풀은 fork 후에 생성 (첫 요청 전에 미리 연결)
+    if not server.cfg.preload_app:
+        return
+
+    from config.warmup import connect_worker  # pylint: disable=import-outside-toplevel
+
+    connect_worker(open_connections=server.cfg.worker_class_str == "sync")
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess  # pylint: disable=import-outside-toplevel
+
+    multiprocess.mark_process_dead(worker.pid)